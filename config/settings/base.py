@@ -93,6 +93,7 @@ LOCAL_APPS = [
     "coda.apps.invoices",
     "coda.apps.management",
     "coda.apps.preferences",
+    "coda.apps.exchangerates",
 ]
 
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
@@ -225,6 +226,13 @@ EMAIL_BACKEND = env(
 # https://docs.djangoproject.com/en/dev/ref/settings/#email-timeout
 EMAIL_TIMEOUT = 5
 
+# EXCHANGE RATES
+# ------------------------------------------------------------------------------
+# Where fetched exchange rates are cached: "database", "cache" (the default Django cache)
+# or "file" (JSON files in EXCHANGE_RATES_CACHE_DIR)
+EXCHANGE_RATES_CACHE = env("CODA_EXCHANGE_RATES_CACHE", default="database")
+EXCHANGE_RATES_CACHE_DIR = env("CODA_EXCHANGE_RATES_CACHE_DIR", default=str(BASE_DIR / ".rates"))
+
 # ADMIN
 # ------------------------------------------------------------------------------
 # Django Admin URL.
@@ -12,31 +12,39 @@ iso_currencies = "https://www.six-group.com/dam/download/financial-information/d
 output_file = "src/coda/money/_currency.py"
 
 enum_header = """
+import functools
+from collections.abc import Mapping
 from enum import Enum
-from typing import cast, NamedTuple
+from types import MappingProxyType
+from typing import NamedTuple
 
 
 class CurrencyDetails(NamedTuple):
     code: str
     name: str
     minor_units: int
+    numeric: int
 
 
 class Currency(Enum):
 """.strip()
 
 enum_entry = """
-    {code} = CurrencyDetails(code="{code}", name="{name}", minor_units={minor_units})
+    {code} = CurrencyDetails(code="{code}", name="{name}", minor_units={minor_units}, numeric={numeric})
 """.rstrip()
 
 enum_methods = """
     @staticmethod
     def from_code(code: str) -> "Currency":
-        return cast(Currency, getattr(Currency, code))
+        return currencies_by_code()[code]
 
     @staticmethod
-    def allcodes() -> set[str]:
-        return {c.code for c in Currency}
+    def from_numeric(numeric: int) -> "Currency":
+        return currencies_by_numeric()[numeric]
+
+    @staticmethod
+    def allcodes() -> frozenset[str]:
+        return currency_codes()
 
     @property
     def code(self) -> str:
@@ -49,6 +57,28 @@ enum_methods = """
     @property
     def minor_units(self) -> int:
         return self.value.minor_units
+
+    @property
+    def numeric(self) -> int:
+        return self.value.numeric
+
+
+# The lookup tables are built on first use, so importing this module stays cheap.
+
+
+@functools.cache
+def currencies_by_code() -> Mapping[str, Currency]:
+    return MappingProxyType({c.code: c for c in Currency})
+
+
+@functools.cache
+def currencies_by_numeric() -> Mapping[int, Currency]:
+    return MappingProxyType({c.numeric: c for c in Currency})
+
+
+@functools.cache
+def currency_codes() -> frozenset[str]:
+    return frozenset(currencies_by_code())
 """
 
 
@@ -66,6 +96,7 @@ def parse_entry(entry: et.Element) -> dict[str, str | int | None]:
     code = parse_tag(entry, "Ccy")
     name = parse_tag(entry, "CcyNm")
     minor_units = parse_tag(entry, "CcyMnrUnts")
+    numeric = parse_tag(entry, "CcyNbr")
 
     return {
         "code": code,
@@ -73,6 +104,7 @@ def parse_entry(entry: et.Element) -> dict[str, str | int | None]:
         "minor_units": int(minor_units)
         if minor_units is not None and minor_units != "N.A."
         else None,
+        "numeric": int(numeric) if numeric is not None else None,
     }
 
 
@@ -23,7 +23,7 @@ def as_domain_object(model: AuthorModel) -> Author:
         name=NonEmptyStr(model.name),
         email=model.email or "",
         orcid=Orcid(person_id.orcid) if person_id.orcid else None,
-        affiliation=InstitutionId(model.affiliation.pk) if model.affiliation else None,
+        affiliation=InstitutionId(model.affiliation_id) if model.affiliation_id else None,
         roles=frozenset(deserialize_roles(model.roles) if model.roles else ()),
     )
 
@@ -0,0 +1,6 @@
+from django.apps import AppConfig
+
+
+class ExchangeRatesConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "coda.apps.exchangerates"
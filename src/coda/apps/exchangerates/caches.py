@@ -0,0 +1,70 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+
+from coda.apps.exchangerates.models import RatesSnapshot as RatesSnapshotModel
+from coda.money import Currency, RatesCache
+from coda.money.exchange import RatesSnapshot
+from coda.money.filecache import FileRatesCache
+
+
+class DjangoCacheRatesCache:
+    """
+    Stores rates snapshots in a Django cache, shared by all processes using the same cache server.
+    Entries never time out in the cache itself, expiry is decided by the snapshot's timestamp.
+    """
+
+    def __init__(self, alias: str = "default", key_prefix: str = "exchangerates") -> None:
+        self.alias = alias
+        self.key_prefix = key_prefix
+
+    def __getitem__(self, currency: Currency) -> RatesSnapshot:
+        data = caches[self.alias].get(self._key(currency))
+        if data is None:
+            raise KeyError(currency)
+
+        return RatesSnapshot.from_json(data)
+
+    def __setitem__(self, currency: Currency, snapshot: RatesSnapshot) -> None:
+        caches[self.alias].set(self._key(currency), snapshot.to_json(), timeout=None)
+
+    def _key(self, currency: Currency) -> str:
+        return f"{self.key_prefix}:{currency.code}"
+
+
+class DatabaseRatesCache:
+    """
+    Stores rates snapshots in the database, one row per base currency.
+    """
+
+    def __getitem__(self, currency: Currency) -> RatesSnapshot:
+        try:
+            model = RatesSnapshotModel.objects.get(base_currency=currency.code)
+        except RatesSnapshotModel.DoesNotExist as e:
+            raise KeyError(currency) from e
+
+        return RatesSnapshot.from_json({"timestamp": model.timestamp, "rates": model.rates})
+
+    def __setitem__(self, currency: Currency, snapshot: RatesSnapshot) -> None:
+        data = snapshot.to_json()
+        RatesSnapshotModel.objects.update_or_create(
+            base_currency=currency.code,
+            defaults={"timestamp": data["timestamp"], "rates": data["rates"]},
+        )
+
+
+def rates_cache() -> RatesCache:
+    """
+    Returns the rates cache selected by the ``EXCHANGE_RATES_CACHE`` setting.
+    """
+    match settings.EXCHANGE_RATES_CACHE:
+        case "database":
+            return DatabaseRatesCache()
+        case "cache":
+            return DjangoCacheRatesCache()
+        case "file":
+            return FileRatesCache(Path(settings.EXCHANGE_RATES_CACHE_DIR))
+        case backend:
+            raise ImproperlyConfigured(f"Unknown exchange rates cache: {backend}")
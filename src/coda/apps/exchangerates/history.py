@@ -0,0 +1,148 @@
+import csv
+import datetime
+import json
+from collections.abc import Iterable, Iterator
+from decimal import Decimal, InvalidOperation
+from typing import Any
+
+from django.db.models import Q
+
+from coda.apps.exchangerates.models import HistoricalRate as HistoricalRateModel
+from coda.apps.pagination import chunked
+from coda.money import Currency
+from coda.money.history import HistoricalRate, RatesHistory
+
+BATCH_SIZE = 1000
+
+FIELDS = ("date", "base", "quote", "rate")
+
+# largest rate the rate column can store
+MAX_RATE = Decimal(10**10)
+
+
+def import_rates(rates: Iterable[HistoricalRate]) -> int:
+    """
+    Stores the given rates in batches and returns how many were imported.
+
+    All rates are read before the first one is written, so a parsing error leaves the stored
+    rates unchanged. If a currency pair and date occur more than once, the last rate is used.
+    Rates already stored for the same currency pair and date are overwritten.
+    """
+    unique = {(rate.base, rate.quote, rate.date): rate for rate in rates}
+    imported = 0
+    for batch in chunked(unique.values(), BATCH_SIZE):
+        HistoricalRateModel.objects.bulk_create(
+            [
+                HistoricalRateModel(
+                    date=rate.date,
+                    base_currency=rate.base.code,
+                    quote_currency=rate.quote.code,
+                    rate=rate.rate,
+                )
+                for rate in batch
+            ],
+            update_conflicts=True,
+            unique_fields=["base_currency", "quote_currency", "date"],
+            update_fields=["rate"],
+        )
+        imported += len(batch)
+
+    return imported
+
+
+def load_history(
+    currencies: Iterable[Currency] | None = None, until: datetime.date | None = None
+) -> RatesHistory:
+    """
+    Loads stored rates into memory with a single query.
+    Restricting ``currencies`` only loads pairs between the given currencies.
+    """
+    query = Q()
+    if currencies is not None:
+        codes = [currency.code for currency in currencies]
+        query &= Q(base_currency__in=codes, quote_currency__in=codes)
+
+    if until is not None:
+        query &= Q(date__lte=until)
+
+    rows = HistoricalRateModel.objects.filter(query).values_list(
+        "date", "base_currency", "quote_currency", "rate"
+    )
+    return RatesHistory(
+        HistoricalRate(date, Currency.from_code(base), Currency.from_code(quote), rate)
+        for date, base, quote, rate in rows.iterator(BATCH_SIZE)
+    )
+
+
+def parse_csv(lines: Iterable[str]) -> Iterator[HistoricalRate]:
+    """
+    Parses CSV with a header row containing the columns date, base, quote and rate.
+    Raises ``ValueError`` listing all invalid rows by their line number once all rows are read.
+    """
+    reader = csv.DictReader(lines)
+    yield from _parse_rows((reader.line_num, row) for row in reader)
+
+
+def parse_json(text: str) -> Iterator[HistoricalRate]:
+    """
+    Parses a JSON list of objects with the keys date, base, quote and rate.
+    Raises ``ValueError`` listing all invalid objects by their position once all are read.
+    """
+    match json.loads(text):
+        case list(rows):
+            yield from _parse_rows(enumerate(rows, start=1))
+        case _:
+            raise ValueError("Expected a list of exchange rates")
+
+
+def _parse_rows(rows: Iterable[tuple[int, Any]]) -> Iterator[HistoricalRate]:
+    errors = []
+    for number, row in rows:
+        if not isinstance(row, dict):
+            errors.append(f"Row {number}: Invalid exchange rate {row!r}")
+            continue
+
+        try:
+            yield _parse_row(row)
+        except ValueError as e:
+            errors.append(f"Row {number}: {e}")
+
+    if errors:
+        raise ValueError("\n".join(errors))
+
+
+def _parse_row(row: dict[str, Any]) -> HistoricalRate:
+    missing = [field for field in FIELDS if row.get(field) in (None, "")]
+    if missing:
+        raise ValueError(f"Missing fields {', '.join(missing)} in exchange rate {row}")
+
+    try:
+        date = datetime.date.fromisoformat(str(row["date"]))
+    except ValueError:
+        raise ValueError(f"Invalid date {row['date']!r}") from None
+
+    return HistoricalRate(
+        date=date,
+        base=_currency(row["base"]),
+        quote=_currency(row["quote"]),
+        rate=_rate(row["rate"]),
+    )
+
+
+def _currency(code: Any) -> Currency:
+    try:
+        return Currency.from_code(str(code).upper())
+    except KeyError:
+        raise ValueError(f"Unknown currency {code!r}") from None
+
+
+def _rate(value: Any) -> Decimal:
+    try:
+        rate = Decimal(str(value))
+    except InvalidOperation:
+        raise ValueError(f"Invalid rate {value!r}") from None
+
+    if not rate.is_finite() or not 0 < rate < MAX_RATE:
+        raise ValueError(f"Invalid rate {value!r}")
+
+    return rate
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="RatesSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("base_currency", models.CharField(max_length=3, unique=True)),
+                ("timestamp", models.FloatField()),
+                ("rates", models.JSONField()),
+            ],
+        ),
+    ]
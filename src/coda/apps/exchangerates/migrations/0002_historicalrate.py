@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("exchangerates", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="HistoricalRate",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("base_currency", models.CharField(max_length=3)),
+                ("quote_currency", models.CharField(max_length=3)),
+                ("rate", models.DecimalField(decimal_places=10, max_digits=20)),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("base_currency", "quote_currency", "date"),
+                        name="historicalrate_pair_date_unique",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,22 @@
+from django.db import models
+
+
+class RatesSnapshot(models.Model):
+    base_currency = models.CharField(max_length=3, unique=True)
+    timestamp = models.FloatField()
+    rates = models.JSONField()
+
+
+class HistoricalRate(models.Model):
+    date = models.DateField()
+    base_currency = models.CharField(max_length=3)
+    quote_currency = models.CharField(max_length=3)
+    rate = models.DecimalField(max_digits=20, decimal_places=10)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["base_currency", "quote_currency", "date"],
+                name="historicalrate_pair_date_unique",
+            ),
+        ]
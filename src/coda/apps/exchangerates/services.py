@@ -0,0 +1,114 @@
+import functools
+from collections.abc import Callable, Sequence
+from decimal import Decimal
+
+from django.db import connections
+from django.dispatch import Signal
+
+from coda.apps.exchangerates.caches import rates_cache
+from coda.apps.preferences.models import GlobalPreferences
+from coda.money import CachingCurrencyExchange, Currency, CurrencyExchange, Money, Rates
+from coda.money.exchange import cross_rate, round_rate
+from coda.money.exchangeratesapi import exchange_api
+from coda.money.moneyarray import MoneyArray
+from coda.money.refresh import BackgroundRefresher, RefreshStatus
+
+# sent with the refreshed ``exchange`` once a missing home currency snapshot has been fetched,
+# so receivers can fill in the home currency costs written without it
+home_rates_refreshed = Signal()
+
+
+def currency_exchange(wait_for_rates: bool = False) -> CurrencyExchange:
+    """
+    Returns the application's currency exchange, backed by the configured rates cache.
+    All rates are derived from the snapshot of the home currency. Rates expired for less
+    than a day are still used while they are refreshed in the background. Without usable
+    rates, a refresh is scheduled and ``RatesUnavailable`` is raised.
+
+    With ``wait_for_rates``, e.g. in management commands, expired rates are fetched right away.
+    """
+    return CachingCurrencyExchange(
+        rates_cache(),
+        exchange_api,
+        base_currency=GlobalPreferences.get_home_currency(),
+        refresher=None if wait_for_rates else background_refresher(),
+    )
+
+
+@functools.cache
+def background_refresher() -> BackgroundRefresher:
+    """
+    Returns the refresher shared by all currency exchanges of the process.
+    """
+    return BackgroundRefresher(on_status=_close_connections)
+
+
+def _close_connections(
+    currency: Currency, status: RefreshStatus, error: BaseException | None
+) -> None:
+    # finished refreshes are reported on the worker thread, which has its own database
+    # connections that are never closed by a request
+    if status != RefreshStatus.Running:
+        connections.close_all()
+
+
+def home_converter(exchange: CurrencyExchange | None = None) -> Callable[[Money], Decimal | None]:
+    """
+    Returns a function converting money into the home currency, used to fill the home currency
+    cost columns when data is written.
+
+    Without an ``exchange``, only the cached rates snapshot of the home currency is used, however
+    old it is, so writing data never waits for an exchange rate provider. Money that cannot be
+    converted this way is converted to ``None``. If the snapshot is missing, it is fetched in the
+    background and ``home_rates_refreshed`` is sent, so the missing costs are filled in then.
+
+    Rates are rounded like in ``home_amounts``, so both convert to the same cost.
+    """
+    home = GlobalPreferences.get_home_currency()
+    exchange = exchange or _cached_exchange(home)
+
+    def rounded_exchange(origin: Currency, target: Currency) -> Decimal:
+        return round_rate(exchange(origin, target))
+
+    def convert(money: Money) -> Decimal | None:
+        if money.currency == home:
+            return money.amount
+
+        try:
+            return money.convert_to(home, rounded_exchange).amount
+        except KeyError:
+            return None
+
+    return convert
+
+
+def home_amounts(
+    amounts: Sequence[Decimal], currencies: Sequence[str], exchange: CurrencyExchange
+) -> list[Decimal]:
+    """
+    Converts many amounts into the home currency at once, asking ``exchange`` once per currency.
+    """
+    home = GlobalPreferences.get_home_currency()
+    converted = MoneyArray.from_columns(amounts, currencies).convert_to(home, exchange)
+    return [money.amount for money in converted]
+
+
+def _cached_exchange(home: Currency) -> CurrencyExchange:
+    @functools.cache
+    def rates() -> Rates:
+        try:
+            return rates_cache()[home].rates
+        except KeyError:
+            background_refresher().submit(home, functools.partial(_refresh_home_rates, home))
+            return {}
+
+    def exchange(origin: Currency, target: Currency) -> Decimal:
+        return cross_rate(rates(), home, origin, target)
+
+    return exchange
+
+
+def _refresh_home_rates(home: Currency) -> None:
+    exchange = CachingCurrencyExchange(rates_cache(), exchange_api, base_currency=home)
+    exchange.refresh(home)
+    home_rates_refreshed.send(sender=CachingCurrencyExchange, exchange=exchange)
@@ -27,6 +27,8 @@ def parse_external_funding(external_funding: ExternalFundingDto) -> ExternalFund
 
 def parse_payment(cost: CostDto) -> Payment:
     return Payment(
-        amount=Money(str(cost["estimated_cost"]), Currency[cost["estimated_cost_currency"]]),
+        amount=Money(
+            str(cost["estimated_cost"]), Currency.from_code(cost["estimated_cost_currency"])
+        ),
         method=PaymentMethod(cost["payment_method"].lower()),
     )
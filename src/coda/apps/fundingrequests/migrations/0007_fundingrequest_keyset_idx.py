@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("authors", "0001_initial"),
+        ("fundingrequests", "0006_alter_fundingrequest_publication"),
+        ("publications", "0009_publication_subject_area_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="fundingrequest",
+            index=models.Index(fields=["-created_at", "-id"], name="fundingrequest_keyset_idx"),
+        ),
+    ]
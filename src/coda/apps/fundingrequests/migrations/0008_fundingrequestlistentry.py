@@ -0,0 +1,117 @@
+# Generated by Django 5.2.18 on 2026-10-18 02:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+
+TABLE = "fundingrequests_fundingrequestlistentry"
+COLUMNS = ["title", "submitter_name", "publisher_name"]
+
+
+def populate(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    FundingRequest = apps.get_model("fundingrequests", "FundingRequest")
+    FundingRequestListEntry = apps.get_model("fundingrequests", "FundingRequestListEntry")
+
+    entries = [
+        FundingRequestListEntry(
+            funding_request_id=request.id,
+            title=request.publication.title,
+            journal_title=request.publication.journal.title,
+            journal_eissn=request.publication.journal.eissn,
+            publisher_name=request.publication.journal.publisher.name,
+            submitter_name=request.submitter.name if request.submitter else "",
+            processing_status=request.processing_status,
+            estimated_cost=request.estimated_cost,
+            estimated_cost_currency=request.estimated_cost_currency,
+            label_ids=sorted(label.id for label in request.labels.all()),
+            created_at=request.created_at,
+            updated_at=request.updated_at,
+        )
+        for request in FundingRequest.objects.select_related(
+            "publication__journal__publisher", "submitter"
+        ).prefetch_related("labels")
+    ]
+    FundingRequestListEntry.objects.bulk_create(entries, batch_size=1000)
+
+
+def create_trigram_indexes(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    # trigram indexes serve icontains lookups, they are skipped without PostgreSQL and pg_trgm
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            return
+
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in COLUMNS:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{TABLE}_{column}_trgm_idx" ON "{TABLE}" '
+            f'USING gin ((UPPER("{column}"::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    if schema_editor.connection.vendor == "postgresql":
+        for column in COLUMNS:
+            schema_editor.execute(f'DROP INDEX IF EXISTS "{TABLE}_{column}_trgm_idx"')
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("fundingrequests", "0007_fundingrequest_keyset_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FundingRequestListEntry",
+            fields=[
+                (
+                    "funding_request",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="list_entry",
+                        serialize=False,
+                        to="fundingrequests.fundingrequest",
+                    ),
+                ),
+                ("title", models.TextField()),
+                ("journal_title", models.TextField()),
+                ("journal_eissn", models.CharField(max_length=9)),
+                ("publisher_name", models.CharField(max_length=255)),
+                ("submitter_name", models.CharField(blank=True, max_length=255)),
+                (
+                    "processing_status",
+                    models.CharField(
+                        choices=[
+                            ("approved", "Approved"),
+                            ("open", "In Progress"),
+                            ("rejected", "Rejected"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("estimated_cost", models.DecimalField(decimal_places=4, max_digits=10)),
+                ("estimated_cost_currency", models.CharField(max_length=3)),
+                ("label_ids", models.JSONField(default=list)),
+                ("created_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["-created_at", "-funding_request"],
+                        name="fundingrequest_list_keyset_idx",
+                    ),
+                    models.Index(
+                        fields=["processing_status"], name="fundingrequest_list_status_idx"
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(populate, migrations.RunPython.noop),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("authors", "0002_author_name_trgm_idx"),
+        ("fundingrequests", "0008_fundingrequestlistentry"),
+        ("publications", "0010_publication_title_trgm_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="fundingrequest",
+            name="estimated_cost_home",
+            field=models.DecimalField(decimal_places=4, max_digits=20, null=True),
+        ),
+        migrations.AddField(
+            model_name="fundingrequestlistentry",
+            name="estimated_cost_home",
+            field=models.DecimalField(decimal_places=4, max_digits=20, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="fundingrequest",
+            index=models.Index(fields=["estimated_cost_home"], name="fundingrequest_cost_home_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="fundingrequestlistentry",
+            index=models.Index(fields=["estimated_cost_home"], name="fundingrequest_list_cost_idx"),
+        ),
+    ]
@@ -57,6 +57,8 @@ class FundingRequest(models.Model):
     request_id = models.CharField(max_length=25, unique=True)
     estimated_cost = models.DecimalField(max_digits=10, decimal_places=4)
     estimated_cost_currency = models.CharField(max_length=3)
+    # estimated cost in the home currency, None while no exchange rate was available
+    estimated_cost_home = models.DecimalField(max_digits=20, decimal_places=4, null=True)
     payment_method = models.CharField(
         choices=PAYMENT_METHOD_CHOICES, default=PaymentMethod.Unknown.value
     )
@@ -72,6 +74,12 @@ class FundingRequest(models.Model):
         ExternalFunding, on_delete=models.SET_NULL, null=True, blank=True
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], name="fundingrequest_keyset_idx"),
+            models.Index(fields=["estimated_cost_home"], name="fundingrequest_cost_home_idx"),
+        ]
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         if not self.request_id:
@@ -80,14 +88,34 @@ class FundingRequest(models.Model):
     def get_absolute_url(self) -> str:
         return reverse("fundingrequests:detail", kwargs={"pk": self.pk})
 
-    def approve(self) -> None:
-        self.processing_status = Review.Approved.value
-        self.save()
 
-    def reject(self) -> None:
-        self.processing_status = Review.Rejected.value
-        self.save()
+class FundingRequestListEntry(models.Model):
+    """
+    Flat copy of the data shown in the funding request list, one row per funding request.
+    It is kept up to date by ``coda.apps.fundingrequests.readmodel``.
+    """
 
-    def open(self) -> None:
-        self.processing_status = Review.Open.value
-        self.save()
+    funding_request = models.OneToOneField(
+        FundingRequest, on_delete=models.CASCADE, primary_key=True, related_name="list_entry"
+    )
+    title = models.TextField()
+    journal_title = models.TextField()
+    journal_eissn = models.CharField(max_length=9)
+    publisher_name = models.CharField(max_length=255)
+    submitter_name = models.CharField(max_length=255, blank=True)
+    processing_status = models.CharField(max_length=20, choices=FundingRequest.PROCESSING_CHOICES)
+    estimated_cost = models.DecimalField(max_digits=10, decimal_places=4)
+    estimated_cost_currency = models.CharField(max_length=3)
+    estimated_cost_home = models.DecimalField(max_digits=20, decimal_places=4, null=True)
+    label_ids = models.JSONField(default=list)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["-created_at", "-funding_request"], name="fundingrequest_list_keyset_idx"
+            ),
+            models.Index(fields=["processing_status"], name="fundingrequest_list_status_idx"),
+            models.Index(fields=["estimated_cost_home"], name="fundingrequest_list_cost_idx"),
+        ]
@@ -0,0 +1,116 @@
+"""
+Maintains ``FundingRequestListEntry``, the denormalized table backing the funding request list.
+
+Every service of this app changing data shown in the list refreshes the affected entries in
+the same transaction, including the services updating the submitter or the publication of a
+funding request. Other apps do not know about the list. Label names are not copied, so renaming
+a label needs no refresh.
+
+Changes made any other way are not tracked. This covers journals and publishers, direct model
+saves, e.g. in the admin or a shell, and deleted labels. Run ``rebuild`` (the
+``rebuild_fundingrequest_list`` command) after such changes.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from decimal import Decimal
+from typing import Any
+
+from django.db import transaction
+from django.db.models import Q, QuerySet
+
+from coda.apps.fundingrequests.models import FundingRequest as FundingRequestModel
+from coda.apps.fundingrequests.models import FundingRequestListEntry
+from coda.apps.pagination import chunked
+from coda.fundingrequest import FundingRequestId, Review
+
+CHUNK_SIZE = 1000
+
+_SOURCE_FIELDS = {
+    "funding_request_id": "id",
+    "title": "publication__title",
+    "journal_title": "publication__journal__title",
+    "journal_eissn": "publication__journal__eissn",
+    "publisher_name": "publication__journal__publisher__name",
+    "submitter_name": "submitter__name",
+    "processing_status": "processing_status",
+    "estimated_cost": "estimated_cost",
+    "estimated_cost_currency": "estimated_cost_currency",
+    "estimated_cost_home": "estimated_cost_home",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+}
+
+
+def refresh(funding_requests: Q) -> None:
+    """
+    Recreates the list entries of all funding requests matching the given filter.
+    """
+    _write(FundingRequestModel.objects.filter(funding_requests))
+
+
+def set_processing_status(ids: Iterable[FundingRequestId], review: Review) -> None:
+    FundingRequestListEntry.objects.filter(pk__in=ids).update(processing_status=review.value)
+
+
+def set_home_cost(home_costs: Mapping[int, Decimal | None]) -> None:
+    FundingRequestListEntry.objects.bulk_update(
+        [
+            FundingRequestListEntry(funding_request_id=id, estimated_cost_home=cost)
+            for id, cost in home_costs.items()
+        ],
+        ["estimated_cost_home"],
+    )
+
+
+@transaction.atomic
+def rebuild() -> int:
+    """
+    Recreates the list entries of all funding requests and returns the number of entries.
+    """
+    FundingRequestListEntry.objects.all().delete()
+    return _write(FundingRequestModel.objects.all())
+
+
+def _write(funding_requests: QuerySet[FundingRequestModel]) -> int:
+    rows = (
+        funding_requests.order_by("id").values_list(*_SOURCE_FIELDS.values()).iterator(CHUNK_SIZE)
+    )
+    written = 0
+    for chunk in chunked(rows, CHUNK_SIZE):
+        entries = _as_entries(chunk)
+        FundingRequestListEntry.objects.bulk_create(
+            entries,
+            update_conflicts=True,
+            unique_fields=["funding_request"],
+            update_fields=[*list(_SOURCE_FIELDS)[1:], "label_ids"],
+        )
+        written += len(entries)
+
+    return written
+
+
+def _as_entries(rows: list[tuple[Any, ...]]) -> list[FundingRequestListEntry]:
+    labels = _label_ids([row[0] for row in rows])
+    entries = []
+    for row in rows:
+        fields = dict(zip(_SOURCE_FIELDS, row))
+        fields["submitter_name"] = fields["submitter_name"] or ""
+        entries.append(
+            FundingRequestListEntry(**fields, label_ids=labels[fields["funding_request_id"]])
+        )
+
+    return entries
+
+
+def _label_ids(ids: list[int]) -> dict[int, list[int]]:
+    labels = defaultdict(list)
+    assignments = (
+        FundingRequestModel.labels.through.objects.filter(fundingrequest_id__in=ids)
+        .order_by("label_id")
+        .values_list("fundingrequest_id", "label_id")
+    )
+    for id, label_id in assignments:
+        labels[id].append(label_id)
+
+    return labels
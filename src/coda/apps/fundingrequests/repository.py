@@ -1,15 +1,18 @@
 import datetime
+import enum
 from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import Self, cast
+from typing import NamedTuple, Self, TypeVar, cast
 
-from django.db.models import Q
+from django.db.models import Count, DateField, Exists, F, Model, OuterRef, Q, QuerySet
+from django.db.models.functions import TruncMonth
 
 from coda.apps.authors import services as author_services
-from coda.apps.fundingrequests.models import FundingOrganization
+from coda.apps.authors.models import Author as AuthorModel
+from coda.apps.fundingrequests.models import FundingOrganization, FundingRequestListEntry, Label
 from coda.apps.fundingrequests.models import FundingRequest as FundingRequestModel
 from coda.apps.publications import services as publication_services
-from coda.author import AuthorId
+from coda.apps.textsearch import relevance
 from coda.fundingrequest import (
     ExternalFunding,
     FundingOrganizationId,
@@ -20,9 +23,10 @@ from coda.fundingrequest import (
     Review,
 )
 from coda.money import Currency, Money
-from coda.publication import PublicationId
 from coda.string import NonEmptyStr
 
+_M = TypeVar("_M", bound=Model)
+
 
 def first() -> FundingRequest | None:
     model = FundingRequestModel.objects.first()
@@ -37,6 +41,34 @@ def get_by_id(id: FundingRequestId) -> FundingRequest:
     return as_domain_object(model)
 
 
+def get_many(ids: Iterable[FundingRequestId]) -> list[FundingRequest]:
+    """
+    Returns the funding requests with the given ids, in the given order.
+    Ids without a funding request are skipped.
+    """
+    ids = list(ids)
+    requests = {
+        request.id: request
+        for request in as_domain_objects(FundingRequestModel.objects.filter(pk__in=ids))
+        if request.id is not None
+    }
+    return [requests[id] for id in ids if id in requests]
+
+
+def as_domain_objects(models: QuerySet[FundingRequestModel]) -> list[FundingRequest]:
+    """
+    Converts all funding requests in ``models`` to domain objects
+    with a constant number of queries, independent of the number of requests.
+    """
+    models = models.select_related(
+        "external_funding",
+        "publication__publication_type",
+        "publication__subject_area",
+        "submitter__identifier",
+    ).prefetch_related("publication__links__type")
+    return [as_domain_object(model) for model in models]
+
+
 def as_domain_object(model: FundingRequestModel) -> FundingRequest:
     if model.processing_status == Review.Approved.value:
         constructor = FundingRequest.approved
@@ -47,10 +79,10 @@ def as_domain_object(model: FundingRequestModel) -> FundingRequest:
 
     return constructor(
         id=FundingRequestId(model.id),
-        publication=publication_services.get_by_id(PublicationId(model.publication_id)),
-        submitter=author_services.get_by_id(AuthorId(cast(int, model.submitter_id))),
+        publication=publication_services.as_domain_object(model.publication),
+        submitter=author_services.as_domain_object(cast(AuthorModel, model.submitter)),
         estimated_cost=Payment(
-            amount=Money(model.estimated_cost, Currency[model.estimated_cost_currency]),
+            amount=Money(model.estimated_cost, Currency.from_code(model.estimated_cost_currency)),
             method=PaymentMethod(model.payment_method),
         ),
         external_funding=(
@@ -85,6 +117,46 @@ class DateRange:
         return cls(start_date, end_date)
 
 
+class LabelMatch(enum.Enum):
+    Any = "any"
+    All = "all"
+
+
+def _has_labels(labels: Iterable[int], match: LabelMatch) -> Q:
+    FundingRequestLabel = FundingRequestModel.labels.through
+    if match == LabelMatch.Any:
+        return Q(
+            Exists(
+                FundingRequestLabel.objects.filter(
+                    fundingrequest_id=OuterRef("pk"), label_id__in=labels
+                )
+            )
+        )
+
+    query = Q()
+    for label in labels:
+        query = query & Q(
+            Exists(
+                FundingRequestLabel.objects.filter(fundingrequest_id=OuterRef("pk"), label_id=label)
+            )
+        )
+    return query
+
+
+class _SearchFields(NamedTuple):
+    title: str
+    submitter: str
+    publisher: str
+
+
+TITLE_FIELD = "publication__title"
+SUBMITTER_FIELD = "submitter__name"
+PUBLISHER_FIELD = "publication__journal__publisher__name"
+
+_FUNDINGREQUEST_FIELDS = _SearchFields(TITLE_FIELD, SUBMITTER_FIELD, PUBLISHER_FIELD)
+_LIST_ENTRY_FIELDS = _SearchFields("title", "submitter_name", "publisher_name")
+
+
 def search(
     *,
     title: str | None = None,
@@ -93,27 +165,150 @@ def search(
     processing_states: list[str] | None = None,
     date_range: DateRange | None = None,
     labels: Iterable[int] | None = None,
+    label_match: LabelMatch = LabelMatch.Any,
+    order_by_relevance: bool = False,
+    order_by_cost: bool = False,
 ) -> Iterable[FundingRequestModel]:
-    query = Q()
-    if title:
-        query = query & Q(publication__title__icontains=title)
+    query, terms = _search_filter(
+        _FUNDINGREQUEST_FIELDS,
+        title=title,
+        submitter=submitter,
+        publisher=publisher,
+        processing_states=processing_states,
+        date_range=date_range,
+        labels=labels,
+        label_match=label_match,
+    )
+    results = (
+        FundingRequestModel.objects.filter(query)
+        .select_related("publication__journal", "submitter")
+        .prefetch_related("labels")
+    )
+    return _ordered(results, terms, order_by_relevance, order_by_cost)
 
-    if submitter:
-        query = query & Q(submitter__name__icontains=submitter)
 
-    if publisher:
-        query = query & Q(publication__journal__publisher__name__icontains=publisher)
+def search_list_entries(
+    *,
+    title: str | None = None,
+    submitter: str | None = None,
+    publisher: str | None = None,
+    processing_states: list[str] | None = None,
+    date_range: DateRange | None = None,
+    labels: Iterable[int] | None = None,
+    label_match: LabelMatch = LabelMatch.Any,
+    order_by_relevance: bool = False,
+    order_by_cost: bool = False,
+) -> QuerySet[FundingRequestListEntry]:
+    """
+    Same as :func:`search`, but reads the denormalized list entries,
+    which need no joins to show a funding request in a listing.
+    """
+    query, terms = _search_filter(
+        _LIST_ENTRY_FIELDS,
+        title=title,
+        submitter=submitter,
+        publisher=publisher,
+        processing_states=processing_states,
+        date_range=date_range,
+        labels=labels,
+        label_match=label_match,
+    )
+    return _ordered(
+        FundingRequestListEntry.objects.filter(query), terms, order_by_relevance, order_by_cost
+    )
+
+
+def _search_filter(
+    fields: _SearchFields,
+    *,
+    title: str | None,
+    submitter: str | None,
+    publisher: str | None,
+    processing_states: list[str] | None,
+    date_range: DateRange | None,
+    labels: Iterable[int] | None,
+    label_match: LabelMatch,
+) -> tuple[Q, dict[str, str]]:
+    terms = {
+        field: term
+        for field, term in (
+            (fields.title, title),
+            (fields.submitter, submitter),
+            (fields.publisher, publisher),
+        )
+        if term
+    }
+
+    query = Q()
+    for field, term in terms.items():
+        query = query & Q(**{f"{field}__icontains": term})
 
     if processing_states:
         query = query & Q(processing_status__in=processing_states)
 
     if labels:
-        query = query & Q(labels__in=labels)
+        query = query & _has_labels(labels, label_match)
 
     if date_range:
         query = query & Q(created_at__gte=date_range.start, created_at__lte=date_range.end)
 
-    return FundingRequestModel.objects.filter(query).distinct().order_by("-created_at")
+    return query, terms
+
+
+def _ordered(
+    results: QuerySet[_M], terms: dict[str, str], order_by_relevance: bool, order_by_cost: bool
+) -> QuerySet[_M]:
+    if order_by_cost:
+        # most expensive first, requests without a home currency cost last
+        return results.order_by(F("estimated_cost_home").desc(nulls_last=True), "-created_at")
+
+    if order_by_relevance and terms:
+        ranked = cast(QuerySet[_M], results.annotate(relevance=relevance(terms)))
+        return ranked.order_by("-relevance", "-created_at")
+
+    return results.order_by("-created_at")
+
+
+def count_by_status() -> dict[str, int]:
+    """
+    Returns the number of funding requests per processing status in a single grouped query.
+    Every status is present in the result, even if no request has it.
+    """
+    counts = dict.fromkeys((review.value for review in Review), 0)
+    rows = (
+        FundingRequestModel.objects.order_by()
+        .values("processing_status")
+        .annotate(count=Count("id"))
+        .values_list("processing_status", "count")
+    )
+    counts.update(rows)
+    return counts
+
+
+def count_by_label() -> dict[int, int]:
+    rows = (
+        Label.objects.annotate(num_requests=Count("requests"))
+        .filter(num_requests__gt=0)
+        .values_list("id", "num_requests")
+    )
+    return dict(rows)
+
+
+def count_by_month(date_range: DateRange | None = None) -> dict[datetime.date, int]:
+    query = Q()
+    if date_range:
+        query = Q(created_at__gte=date_range.start, created_at__lte=date_range.end)
+
+    rows = (
+        FundingRequestModel.objects.filter(query)
+        .order_by()
+        .annotate(month=TruncMonth("created_at", output_field=DateField()))
+        .values("month")
+        .annotate(count=Count("id"))
+        .values_list("month", "count")
+        .order_by("month")
+    )
+    return dict(rows)
 
 
 def get_funding_organization(pk: int) -> FundingOrganization:
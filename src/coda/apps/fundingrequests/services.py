@@ -1,13 +1,34 @@
+from collections.abc import Collection, Iterable
+from typing import Any, NamedTuple
+
 from django.db import transaction
+from django.db.models import Q, QuerySet
+from django.dispatch import receiver
 
-from coda.apps.authors.services import author_create
+from coda.apps.authors.services import author_create, author_update
+from coda.apps.exchangerates.services import home_amounts, home_converter, home_rates_refreshed
+from coda.apps.fundingrequests import readmodel
 from coda.apps.fundingrequests import repository as fundingrequest_repository
 from coda.apps.fundingrequests.models import ExternalFunding as ExternalFundingModel
 from coda.apps.fundingrequests.models import FundingRequest as FundingRequestModel
 from coda.apps.fundingrequests.models import Label
+from coda.apps.pagination import chunked
 from coda.apps.publications import services as publication_services
+from coda.author import Author
+from coda.checks.checklist import CheckResult
+from coda.checks.costlimit import CostLimitCheck
 from coda.color import Color
-from coda.fundingrequest import ExternalFunding, FundingRequest, FundingRequestId, Payment, Review
+from coda.fundingrequest import (
+    ExternalFunding,
+    FundingRequest,
+    FundingRequestId,
+    Payment,
+    Review,
+    is_review_allowed,
+)
+from coda.money import CurrencyExchange, Money
+from coda.money.moneyarray import MoneyArray
+from coda.publication import Publication
 
 
 @transaction.atomic
@@ -22,7 +43,9 @@ def fundingrequest_create(fundingrequest: FundingRequest) -> FundingRequestId:
         payment_method=fundingrequest.estimated_cost.method.name.lower(),
         estimated_cost=fundingrequest.estimated_cost.amount.amount,
         estimated_cost_currency=fundingrequest.estimated_cost.amount.currency.value.code,
+        estimated_cost_home=home_converter()(fundingrequest.estimated_cost.amount),
     )
+    readmodel.refresh(Q(pk=request.pk))
 
     return FundingRequestId(request.pk)
 
@@ -42,7 +65,21 @@ def fundingrequest_funding_update(
     funding_request.payment_method = payment.method.name.lower()
     funding_request.estimated_cost = payment.amount.amount
     funding_request.estimated_cost_currency = payment.amount.currency.value.code
+    funding_request.estimated_cost_home = home_converter()(payment.amount)
     funding_request.save()
+    readmodel.refresh(Q(pk=fundingrequest_id))
+
+
+@transaction.atomic
+def fundingrequest_submitter_update(author: Author) -> None:
+    author_update(author)
+    readmodel.refresh(Q(submitter_id=author.id))
+
+
+@transaction.atomic
+def fundingrequest_publication_update(publication: Publication) -> None:
+    publication_services.publication_update(publication)
+    readmodel.refresh(Q(publication_id=publication.id))
 
 
 def fundingrequest_perform_review(id: FundingRequestId, review: Review) -> None:
@@ -51,6 +88,105 @@ def fundingrequest_perform_review(id: FundingRequestId, review: Review) -> None:
     FundingRequestModel.objects.filter(pk=id).update(
         processing_status=funding_request.review().value.lower()
     )
+    readmodel.set_processing_status([id], funding_request.review())
+
+
+class BulkReviewResult(NamedTuple):
+    reviewed: list[FundingRequestId]
+    skipped: list[FundingRequestId]
+
+
+@transaction.atomic
+def fundingrequests_perform_review(
+    ids: Iterable[FundingRequestId] | QuerySet[FundingRequestModel, int], review: Review
+) -> BulkReviewResult:
+    """
+    Reviews all given funding requests at once.
+    Requests for which the review is not a valid transition of their current status are skipped.
+    """
+    current_states = (
+        FundingRequestModel.objects.select_for_update()
+        .filter(pk__in=ids)
+        .values_list("id", "processing_status")
+        .order_by("id")
+    )
+
+    reviewed, skipped = [], []
+    for id, status in current_states:
+        if is_review_allowed(Review(status), review):
+            reviewed.append(FundingRequestId(id))
+        else:
+            skipped.append(FundingRequestId(id))
+
+    if reviewed:
+        FundingRequestModel.objects.filter(pk__in=reviewed).update(processing_status=review.value)
+        readmodel.set_processing_status(reviewed, review)
+
+    return BulkReviewResult(reviewed, skipped)
+
+
+def fundingrequests_prescreen(
+    limit: Money, exchange: CurrencyExchange
+) -> dict[FundingRequestId, CheckResult]:
+    """
+    Checks the estimated cost of every open funding request against ``limit`` in one pass.
+    The costs are read with a single query and converted with one rate per currency.
+    """
+    ids, amounts, currencies = [], [], []
+    open_requests = (
+        FundingRequestModel.objects.filter(processing_status=Review.Open.value)
+        .order_by("id")
+        .values_list("id", "estimated_cost", "estimated_cost_currency")
+    )
+    for id, amount, currency in open_requests:
+        ids.append(FundingRequestId(id))
+        amounts.append(amount)
+        currencies.append(currency)
+
+    results = CostLimitCheck(limit, exchange).check_costs(
+        MoneyArray.from_columns(amounts, currencies)
+    )
+    return dict(zip(ids, results))
+
+
+@transaction.atomic
+def fundingrequests_recompute_home_cost(
+    exchange: CurrencyExchange, missing_only: bool = False
+) -> int:
+    """
+    Recomputes the home currency cost of all funding requests, e.g. after the home currency
+    or the exchange rates changed. With ``missing_only``, only funding requests without a home
+    currency cost are updated. Returns the number of updated funding requests.
+    """
+    fundingrequests = FundingRequestModel.objects.all()
+    if missing_only:
+        fundingrequests = fundingrequests.filter(estimated_cost_home__isnull=True)
+
+    rows = (
+        fundingrequests.order_by("id")
+        .values_list("id", "estimated_cost", "estimated_cost_currency")
+        .iterator(readmodel.CHUNK_SIZE)
+    )
+    updated = 0
+    for chunk in chunked(rows, readmodel.CHUNK_SIZE):
+        ids, amounts, currencies = zip(*chunk)
+        home_costs = home_amounts(amounts, currencies, exchange)
+        FundingRequestModel.objects.bulk_update(
+            [
+                FundingRequestModel(pk=id, estimated_cost_home=cost)
+                for id, cost in zip(ids, home_costs)
+            ],
+            ["estimated_cost_home"],
+        )
+        readmodel.set_home_cost(dict(zip(ids, home_costs)))
+        updated += len(chunk)
+
+    return updated
+
+
+@receiver(home_rates_refreshed)
+def _fill_missing_home_costs(sender: Any, exchange: CurrencyExchange, **kwargs: Any) -> None:
+    fundingrequests_recompute_home_cost(exchange, missing_only=True)
 
 
 def external_funding_or_none(external_funding: ExternalFunding | None) -> int | None:
@@ -79,9 +215,35 @@ def label_create(name: str, color: Color) -> Label:
 
 def label_attach(funding_request: FundingRequestModel, label: Label) -> None:
     label.requests.add(funding_request)
-    label.save()
+    readmodel.refresh(Q(pk=funding_request.pk))
 
 
 def label_detach(funding_request: FundingRequestModel, label: Label) -> None:
     label.requests.remove(funding_request)
-    label.save()
+    readmodel.refresh(Q(pk=funding_request.pk))
+
+
+def labels_attach(
+    label: Label, ids: Collection[FundingRequestId] | QuerySet[FundingRequestModel, int]
+) -> None:
+    """
+    Attaches the label to all given funding requests with a single insert.
+    Funding requests that already have the label are left untouched.
+    """
+    LabelAssignment = FundingRequestModel.labels.through
+    LabelAssignment.objects.bulk_create(
+        [LabelAssignment(fundingrequest_id=id, label_id=label.pk) for id in ids],
+        ignore_conflicts=True,
+    )
+    readmodel.refresh(Q(pk__in=ids))
+
+
+def labels_detach(
+    label: Label, ids: Collection[FundingRequestId] | QuerySet[FundingRequestModel, int]
+) -> None:
+    """
+    Detaches the label from all given funding requests with a single delete.
+    """
+    LabelAssignment = FundingRequestModel.labels.through
+    LabelAssignment.objects.filter(label=label, fundingrequest_id__in=ids).delete()
+    readmodel.refresh(Q(pk__in=ids))
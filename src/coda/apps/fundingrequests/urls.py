@@ -1,7 +1,14 @@
 from django.urls import path
 
 from coda.apps.fundingrequests.views.detailview import fundingrequest_detail
-from coda.apps.fundingrequests.views.labels import LabelCreateView, attach_label, detach_label
+from coda.apps.fundingrequests.views.export import export_csv, export_parquet
+from coda.apps.fundingrequests.views.labels import (
+    LabelCreateView,
+    attach_label,
+    bulk_attach_label,
+    bulk_detach_label,
+    detach_label,
+)
 from coda.apps.fundingrequests.views.listview import fundingrequest_list
 from coda.apps.fundingrequests.views import review
 from coda.apps.fundingrequests.views.wizard.create import FundingRequestWizard
@@ -16,6 +23,8 @@ app_name = "fundingrequests"
 urlpatterns = [
     path("", fundingrequest_list, name="list"),
     path("<int:pk>/", fundingrequest_detail, name="detail"),
+    path("export.csv", export_csv, name="export_csv"),
+    path("export.parquet", export_parquet, name="export_parquet"),
     path("create/wizard/", FundingRequestWizard.as_view(), name="create_wizard"),
     path("update/submitter/<int:pk>/", UpdateSubmitterView.as_view(), name="update_submitter"),
     path(
@@ -27,8 +36,11 @@ urlpatterns = [
     path("approve/", review.approve, name="approve"),
     path("reject/", review.reject, name="reject"),
     path("open/", review.open, name="open"),
+    path("review/", review.bulk_review, name="bulk_review"),
     path("create_label/<int:next>", LabelCreateView.as_view(), name="label_create"),
     path("attach_label/", attach_label, name="label_attach"),
     path("detach_label/", detach_label, name="label_detach"),
+    path("bulk_attach_label/", bulk_attach_label, name="label_bulk_attach"),
+    path("bulk_detach_label/", bulk_detach_label, name="label_bulk_detach"),
     path("partial/add-linkrow/", add_linkrow, name="partial_add_linkrow"),
 ]
@@ -75,7 +75,7 @@ def request_viewmodel(fr: FundingRequestModel) -> RequestViewModel:
         labels=fr.labels.all(),
         created_at=fr.created_at,
         updated_at=fr.updated_at,
-        estimated_cost=Money(fr.estimated_cost, Currency[fr.estimated_cost_currency]),
+        estimated_cost=Money(fr.estimated_cost, Currency.from_code(fr.estimated_cost_currency)),
         review_status=Review(fr.processing_status).value,
     )
 
@@ -0,0 +1,140 @@
+import csv
+import shutil
+import tempfile
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+from django.contrib.auth.decorators import login_required
+from django.db.models import QuerySet
+from django.http import FileResponse, HttpRequest, StreamingHttpResponse
+
+from coda.apps.fundingrequests import repository
+from coda.apps.fundingrequests.models import FundingRequest as FundingRequestModel
+from coda.apps.fundingrequests.views import listview
+from coda.apps.pagination import chunked
+
+CHUNK_SIZE = 2000
+LABEL_SEPARATOR = "; "
+
+# the primary key comes first, it is used to look up the labels of each row
+COLUMNS = {
+    "id": "id",
+    "request_id": "request_id",
+    "title": repository.TITLE_FIELD,
+    "journal": "publication__journal__title",
+    "publisher": repository.PUBLISHER_FIELD,
+    "submitter": repository.SUBMITTER_FIELD,
+    "status": "processing_status",
+    "estimated_cost": "estimated_cost",
+    "currency": "estimated_cost_currency",
+}
+
+# the submitter may be missing, so the types of a chunk cannot be inferred from its values
+SCHEMA = pl.Schema(
+    {
+        "id": pl.Int64(),
+        "request_id": pl.String(),
+        "title": pl.String(),
+        "journal": pl.String(),
+        "publisher": pl.String(),
+        "submitter": pl.String(),
+        "status": pl.String(),
+        "estimated_cost": pl.Decimal(10, 4),
+        "currency": pl.String(),
+        "labels": pl.String(),
+    }
+)
+
+
+@login_required
+def export_csv(request: HttpRequest) -> StreamingHttpResponse:
+    """
+    Streams all funding requests matching the list filters as CSV.
+    Rows are written as they are read from the database, so memory use does not grow
+    with the number of exported requests.
+    """
+    response = StreamingHttpResponse(
+        _csv_lines(rows(listview.query(request))), content_type="text/csv"
+    )
+    response["Content-Disposition"] = 'attachment; filename="fundingrequests.csv"'
+    return response
+
+
+@login_required
+def export_parquet(request: HttpRequest) -> FileResponse:
+    """
+    Exports all funding requests matching the list filters as a Parquet file.
+    Every chunk of rows is written to a temporary file of its own, which polars then streams
+    into the exported file, so memory use does not grow with the number of exported requests.
+    """
+    # closed by the response once it has been sent
+    output = tempfile.TemporaryFile()  # noqa: SIM115
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for number, chunk in enumerate(chunked(rows(listview.query(request)), CHUNK_SIZE)):
+            paths.append(path := Path(directory) / f"{number}.parquet")
+            pl.DataFrame(chunk, schema=SCHEMA, orient="row").write_parquet(path)
+
+        if paths:
+            pl.scan_parquet(paths).sink_parquet(exported := Path(directory) / "export.parquet")
+            with exported.open("rb") as file:
+                shutil.copyfileobj(file, output)
+        else:
+            pl.DataFrame(schema=SCHEMA).write_parquet(output)
+
+    output.seek(0)
+    return FileResponse(
+        output,
+        as_attachment=True,
+        filename="fundingrequests.parquet",
+        content_type="application/vnd.apache.parquet",
+    )
+
+
+def rows(queryset: QuerySet[FundingRequestModel]) -> Iterator[tuple[Any, ...]]:
+    """
+    Yields one row per funding request in the order of ``COLUMNS``, followed by its label names.
+    The queryset is read in chunks with one additional query per chunk for the labels.
+    """
+    values = (
+        queryset.prefetch_related(None)
+        .values_list(*COLUMNS.values())
+        .iterator(chunk_size=CHUNK_SIZE)
+    )
+    for chunk in chunked(values, CHUNK_SIZE):
+        labels = _label_names([row[0] for row in chunk])
+        for row in chunk:
+            yield (*row, LABEL_SEPARATOR.join(labels[row[0]]))
+
+
+def _label_names(ids: list[int]) -> dict[int, list[str]]:
+    names = defaultdict(list)
+    assignments = (
+        FundingRequestModel.labels.through.objects.filter(fundingrequest_id__in=ids)
+        .order_by("label__name")
+        .values_list("fundingrequest_id", "label__name")
+    )
+    for id, name in assignments:
+        names[id].append(name)
+
+    return names
+
+
+def _csv_lines(rows: Iterable[tuple[Any, ...]]) -> Iterator[str]:
+    buffer = _LineBuffer()
+    writer = csv.writer(buffer)
+    yield writer.writerow([*COLUMNS, "labels"])
+    for row in rows:
+        yield writer.writerow(row)
+
+
+class _LineBuffer:
+    """
+    File-like object handing each line written by ``csv.writer`` straight back to the caller.
+    """
+
+    def write(self, value: str) -> str:
+        return value
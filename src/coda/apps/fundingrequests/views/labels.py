@@ -2,6 +2,7 @@ from typing import Any
 
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.exceptions import BadRequest
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse
@@ -11,6 +12,7 @@ from django.views.generic import CreateView
 from coda.apps.fundingrequests import services
 from coda.apps.fundingrequests.forms import LabelForm
 from coda.apps.fundingrequests.models import FundingRequest, Label
+from coda.apps.fundingrequests.views import listview
 
 
 class LabelCreateView(LoginRequiredMixin, CreateView[Label, LabelForm]):
@@ -30,8 +32,8 @@ class LabelCreateView(LoginRequiredMixin, CreateView[Label, LabelForm]):
 @login_required
 @require_POST
 def attach_label(request: HttpRequest) -> HttpResponse:
-    funding_request = get_object_or_404(FundingRequest, pk=request.POST["fundingrequest"])
-    label = get_object_or_404(Label, pk=request.POST["label"])
+    funding_request = get_object_or_404(FundingRequest, pk=posted_id(request, "fundingrequest"))
+    label = get_object_or_404(Label, pk=posted_id(request, "label"))
     services.label_attach(funding_request, label)
     return redirect(reverse("fundingrequests:detail", kwargs={"pk": funding_request.pk}))
 
@@ -39,7 +41,34 @@ def attach_label(request: HttpRequest) -> HttpResponse:
 @login_required
 @require_POST
 def detach_label(request: HttpRequest) -> HttpResponse:
-    funding_request = get_object_or_404(FundingRequest, pk=request.POST["fundingrequest"])
-    label = get_object_or_404(Label, pk=request.POST["label"])
+    funding_request = get_object_or_404(FundingRequest, pk=posted_id(request, "fundingrequest"))
+    label = get_object_or_404(Label, pk=posted_id(request, "label"))
     services.label_detach(funding_request, label)
     return redirect(reverse("fundingrequests:detail", kwargs={"pk": funding_request.pk}))
+
+
+@login_required
+@require_POST
+def bulk_attach_label(request: HttpRequest) -> HttpResponse:
+    label = get_object_or_404(Label, pk=posted_id(request, "label"))
+    services.labels_attach(label, listview.selected_ids(request))
+    return listview.redirect_to_list(request)
+
+
+@login_required
+@require_POST
+def bulk_detach_label(request: HttpRequest) -> HttpResponse:
+    label = get_object_or_404(Label, pk=posted_id(request, "label"))
+    services.labels_detach(label, listview.selected_ids(request))
+    return listview.redirect_to_list(request)
+
+
+def posted_id(request: HttpRequest, name: str) -> int:
+    """
+    Returns the id posted as ``name``. Raises ``BadRequest`` if it is missing or not a number.
+    """
+    value = request.POST.get(name, "")
+    if not value.isdecimal():
+        raise BadRequest(f"Invalid {name} id")
+
+    return int(value)
@@ -1,57 +1,173 @@
+import dataclasses
 import datetime
-from collections.abc import Iterable
+import enum
+import hashlib
+from collections.abc import Iterable, Mapping
 from typing import Any, NamedTuple, cast
 
 from django.contrib.auth.decorators import login_required
-from django.core.paginator import Page, Paginator
+from django.core.cache import cache
+from django.core.exceptions import BadRequest
+from django.core.paginator import Paginator
 from django.db.models import QuerySet
 from django.http import HttpRequest, HttpResponse
-from django.shortcuts import render
+from django.shortcuts import redirect, render
+from django.urls import reverse
+from django.utils.http import urlencode
 
 from coda.apps.fundingrequests import repository
 from coda.apps.fundingrequests.models import FundingRequest as FundingRequestModel
-from coda.apps.fundingrequests.models import Label
-from coda.author import Author
+from coda.apps.fundingrequests.models import FundingRequestListEntry, Label
+from coda.apps.pagination import Cursor, approximate_count, keyset_paginate
+from coda.fundingrequest import FundingRequestId
 
 TEMPLATE_NAME = "fundingrequests/fundingrequest_list.html"
+PAGE_SIZE = 10
+COUNT_CACHE_TIMEOUT = 60
+PAGING_PARAMS = {"after", "before", "page", "order"}
+
+
+class ListOrder(enum.Enum):
+    Newest = "newest"
+    Relevance = "relevance"
+    Cost = "cost"
+
+
+ORDER_NAMES = {
+    ListOrder.Newest: "Newest first",
+    ListOrder.Relevance: "Best match first",
+    ListOrder.Cost: "Highest cost first",
+}
 
 
 @login_required
 def fundingrequest_list(request: HttpRequest) -> HttpResponse:
-    paginator = Paginator(query(request), per_page=10)
-    page = paginator.get_page(request.GET.get("page"))
-    return render(request, TEMPLATE_NAME, get_context_data(page))
+    """
+    Lists the funding requests matching the search filters, newest first by default.
+    The newest first listing is paginated by cursor. Other orders cannot be resumed
+    from a cursor and are paginated by page number.
+    """
+    order = parse_order(request.GET.get("order"))
+    if order == ListOrder.Newest:
+        entries = repository.search_list_entries(**search_args(request))
+        page = keyset_paginate(
+            entries,
+            PAGE_SIZE,
+            after=parse_cursor(request.GET.get("after")),
+            before=parse_cursor(request.GET.get("before")),
+        )
+        page = dataclasses.replace(page, approximate_count=cached_count(request, entries))
+        return render(request, TEMPLATE_NAME, get_context_data(page.object_list) | {"page": page})
+
+    entries = repository.search_list_entries(
+        **search_args(request),
+        order_by_relevance=order == ListOrder.Relevance,
+        order_by_cost=order == ListOrder.Cost,
+    )
+    page_obj = Paginator(entries, PAGE_SIZE).get_page(request.GET.get("page"))
+    return render(request, TEMPLATE_NAME, get_context_data(page_obj) | {"page_obj": page_obj})
+
+
+def parse_cursor(token: str | None) -> Cursor | None:
+    if not token:
+        return None
 
+    try:
+        return Cursor.decode(token)
+    except ValueError as e:
+        raise BadRequest("Invalid cursor") from e
 
-def get_context_data(page: Page[FundingRequestModel]) -> dict[str, Any]:
+
+def cached_count(request: HttpRequest, entries: QuerySet[FundingRequestListEntry]) -> int:
+    """
+    Returns the approximate number of ``entries``. It is cached per search for a minute,
+    so paging through the results does not count them again on every page.
+    """
+    search = sorted(
+        (key, value)
+        for key, values in request.GET.lists()
+        if key not in PAGING_PARAMS
+        for value in values
+    )
+    digest = hashlib.sha256(urlencode(search).encode()).hexdigest()
+    return cast(
+        int,
+        cache.get_or_set(
+            f"fundingrequests:list_count:{digest}",
+            lambda: approximate_count(entries),
+            COUNT_CACHE_TIMEOUT,
+        ),
+    )
+
+
+def get_context_data(entries: Iterable[FundingRequestListEntry]) -> dict[str, Any]:
+    labels = {label.pk: label for label in Label.objects.all()}
     return {
-        "labels": Label.objects.all(),
+        "labels": labels.values(),
         "processing_states": FundingRequestModel.PROCESSING_CHOICES,
-        "funding_requests": list(map(as_viewmodel, page.object_list)),
-        "page_obj": page,
+        "orders": [(order.value, ORDER_NAMES[order]) for order in ListOrder],
+        "funding_requests": [as_viewmodel(entry, labels) for entry in entries],
     }
 
 
 def query(request: HttpRequest) -> QuerySet[FundingRequestModel]:
+    return cast(QuerySet[FundingRequestModel], repository.search(**search_args(request)))
+
+
+def search_args(request: HttpRequest) -> dict[str, Any]:
     search_type = request.GET.get("search_type")
+    terms: dict[str, Any]
     if search_type in ["title", "submitter", "publisher"]:
-        search_args = {search_type: request.GET.get("search_term")}
+        terms = {search_type: request.GET.get("search_term")}
     else:
-        search_args = {}
+        terms = {}
 
     start_date = request.GET.get("start_date")
     end_date = request.GET.get("end_date")
-    date_range = repository.DateRange.try_fromisoformat(start=start_date, end=end_date)
+    return {
+        **terms,
+        "date_range": repository.DateRange.try_fromisoformat(start=start_date, end=end_date),
+        "labels": list(map(int, request.GET.getlist("labels"))),
+        "label_match": parse_label_match(request.GET.get("label_match")),
+        "processing_states": request.GET.getlist("processing_status"),
+    }
 
-    return cast(
-        QuerySet[FundingRequestModel],
-        repository.search(
-            **search_args,
-            date_range=date_range,
-            labels=list(map(int, request.GET.getlist("labels"))),
-            processing_states=request.GET.getlist("processing_status"),
-        ),
-    )
+
+def selected_ids(
+    request: HttpRequest,
+) -> list[FundingRequestId] | QuerySet[FundingRequestModel, int]:
+    """
+    Returns the funding requests selected for a bulk action. With ``scope=search``, these are
+    all funding requests matching the search filters in the query string, otherwise the posted ids.
+    Raises ``BadRequest`` if a posted id is not a number.
+    """
+    if request.POST.get("scope") == "search":
+        return query(request).values_list("id", flat=True)
+
+    ids = request.POST.getlist("fundingrequest")
+    if not all(id.isdecimal() for id in ids):
+        raise BadRequest("Invalid funding request id")
+
+    return [FundingRequestId(int(id)) for id in ids]
+
+
+def redirect_to_list(request: HttpRequest) -> HttpResponse:
+    list_url = reverse("fundingrequests:list")
+    return redirect(f"{list_url}?{request.GET.urlencode()}" if request.GET else list_url)
+
+
+def parse_order(value: str | None) -> ListOrder:
+    try:
+        return ListOrder(value)
+    except ValueError:
+        return ListOrder.Newest
+
+
+def parse_label_match(value: str | None) -> repository.LabelMatch:
+    try:
+        return repository.LabelMatch(value)
+    except ValueError:
+        return repository.LabelMatch.Any
 
 
 class ListViewModel(NamedTuple):
@@ -66,15 +182,15 @@ class ListViewModel(NamedTuple):
     status: str
 
 
-def as_viewmodel(funding_request: FundingRequestModel) -> ListViewModel:
+def as_viewmodel(entry: FundingRequestListEntry, labels: Mapping[int, Label]) -> ListViewModel:
     return ListViewModel(
-        id=funding_request.id,
-        url=funding_request.get_absolute_url(),
-        publication_title=funding_request.publication.title,
-        submitter_name=cast(Author, funding_request.submitter).name,
-        journal_title=funding_request.publication.journal.title,
-        journal_url=funding_request.publication.journal.get_absolute_url(),
-        updated_at=funding_request.updated_at,
-        labels=funding_request.labels.all(),
-        status=funding_request.processing_status,
+        id=entry.pk,
+        url=reverse("fundingrequests:detail", kwargs={"pk": entry.pk}),
+        publication_title=entry.title,
+        submitter_name=entry.submitter_name,
+        journal_title=entry.journal_title,
+        journal_url=reverse("journals:detail", kwargs={"eissn": entry.journal_eissn}),
+        updated_at=entry.updated_at,
+        labels=[labels[id] for id in entry.label_ids if id in labels],
+        status=entry.processing_status,
     )
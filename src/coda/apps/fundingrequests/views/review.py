@@ -1,13 +1,14 @@
 from collections.abc import Callable
 
+from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import redirect
 from django.urls import reverse
 from django.views.decorators.http import require_POST
 
-from coda.apps.fundingrequests.models import FundingRequest as FundingRequestModel
-from coda.apps.fundingrequests.services import fundingrequest_perform_review
+from coda.apps.fundingrequests.services import fundingrequests_perform_review
+from coda.apps.fundingrequests.views import listview
 from coda.fundingrequest import FundingRequestId, Review
 
 
@@ -15,16 +16,44 @@ def fundingrequest_action(review: Review) -> Callable[[HttpRequest], HttpRespons
     @login_required
     @require_POST
     def post(request: HttpRequest) -> HttpResponse:
-        try:
-            id = FundingRequestId(int(request.POST["fundingrequest"]))
-            fundingrequest_perform_review(id, review)
-            return redirect(reverse("fundingrequests:detail", kwargs={"pk": id}))
-        except FundingRequestModel.DoesNotExist:
+        value = request.POST.get("fundingrequest", "")
+        if not value.isdecimal():
+            return HttpResponse(status=400)
+
+        id = FundingRequestId(int(value))
+        result = fundingrequests_perform_review([id], review)
+        if result.skipped:
+            messages.warning(
+                request, "The status of this funding request does not allow this review."
+            )
+        elif not result.reviewed:
             return HttpResponse(status=404)
 
+        return redirect(reverse("fundingrequests:detail", kwargs={"pk": id}))
+
     return post
 
 
 approve = fundingrequest_action(Review.Approved)
 reject = fundingrequest_action(Review.Rejected)
 open = fundingrequest_action(Review.Open)
+
+
+@login_required
+@require_POST
+def bulk_review(request: HttpRequest) -> HttpResponse:
+    try:
+        review = Review(request.POST["review"])
+    except (KeyError, ValueError):
+        return HttpResponse(status=400)
+
+    result = fundingrequests_perform_review(listview.selected_ids(request), review)
+    messages.info(request, f"Updated {len(result.reviewed)} funding requests.")
+    if result.skipped:
+        messages.warning(
+            request,
+            f"Skipped {len(result.skipped)} funding requests "
+            "whose status does not allow this review.",
+        )
+
+    return listview.redirect_to_list(request)
@@ -5,7 +5,6 @@ from django.http import HttpRequest
 from django.urls import reverse
 
 from coda.apps.authors.dto import parse_author, to_author_dto
-from coda.apps.authors.services import author_update
 from coda.apps.fundingrequests import repository as fundingrequest_repository
 from coda.apps.fundingrequests import services
 from coda.apps.fundingrequests.dto import (
@@ -22,7 +21,6 @@ from coda.apps.fundingrequests.views.wizard.wizardsteps import (
     SubmitterStep,
 )
 from coda.apps.publications.dto import parse_publication, to_publication_dto
-from coda.apps.publications.services import publication_update
 from coda.apps.wizard import SessionStore, Wizard
 
 
@@ -38,7 +36,7 @@ class UpdateSubmitterView(LoginRequiredMixin, Wizard):
         store = self.get_store()
         fr = fundingrequest_repository.get_by_id(self.kwargs["pk"])
         author = parse_author(store["submitter"], fr.submitter.id)
-        author_update(author)
+        services.fundingrequest_submitter_update(author)
 
     def prepare(self, request: HttpRequest) -> None:
         store = self.get_store()
@@ -58,7 +56,7 @@ class UpdatePublicationView(LoginRequiredMixin, Wizard):
     def complete(self, /, **kwargs: Any) -> None:
         pk = kwargs["pk"]
         fr = fundingrequest_repository.get_by_id(pk)
-        publication_update(
+        services.fundingrequest_publication_update(
             parse_publication(publication_dto_from(self.get_store()), fr.publication.id)
         )
 
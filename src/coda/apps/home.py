@@ -2,19 +2,29 @@ from typing import cast
 
 from django.conf import settings
 from django.contrib import messages
-from django.db.models.manager import BaseManager
+from django.core.cache import cache
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import render
 
 from coda.apps.fundingrequests import repository
-from coda.apps.fundingrequests.models import FundingRequest
+from coda.apps.invoices.services import invoices_total_spent
 from coda.fundingrequest import Review
+from coda.money import Money
+
+COUNTS_CACHE_KEY = "home:fundingrequest_counts"
+COUNTS_CACHE_TIMEOUT = 60
+TOTAL_SPENT_CACHE_KEY = "home:invoices_total_spent"
 
 
 def view(request: HttpRequest) -> HttpResponse:
-    open_requests = repository.search(processing_states=[Review.Open.value])
-    rejected_requests = repository.search(processing_states=[Review.Rejected.value])
-    approved_requests = repository.search(processing_states=[Review.Approved.value])
+    counts = cast(
+        dict[str, int],
+        cache.get_or_set(COUNTS_CACHE_KEY, repository.count_by_status, COUNTS_CACHE_TIMEOUT),
+    )
+    total_spent = cast(
+        Money,
+        cache.get_or_set(TOTAL_SPENT_CACHE_KEY, invoices_total_spent, COUNTS_CACHE_TIMEOUT),
+    )
 
     if settings.CODA_DEMO_MODE:
         messages.warning(request, "CODA is running in demo mode.")
@@ -24,9 +34,10 @@ def view(request: HttpRequest) -> HttpResponse:
         request,
         "pages/home.html",
         {
-            "num_requests": FundingRequest.objects.count(),
-            "num_open_requests": cast(BaseManager[FundingRequest], open_requests).count(),
-            "num_rejected_requests": cast(BaseManager[FundingRequest], rejected_requests).count(),
-            "num_approved_requests": cast(BaseManager[FundingRequest], approved_requests).count(),
+            "num_requests": sum(counts.values()),
+            "num_open_requests": counts[Review.Open.value],
+            "num_rejected_requests": counts[Review.Rejected.value],
+            "num_approved_requests": counts[Review.Approved.value],
+            "total_spent": total_spent,
         },
     )
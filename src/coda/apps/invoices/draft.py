@@ -0,0 +1,119 @@
+import re
+import time
+import uuid
+from collections.abc import Mapping
+from typing import Any
+
+from django.contrib.sessions.backends.base import SessionBase
+from django.http import HttpRequest
+
+from coda.apps.wizard import SessionStore, Store
+
+STORE_PREFIX = "invoice-draft-"
+DRAFT_ID_PATTERN = re.compile(r"[0-9a-f]{32}")
+# abandoned drafts are removed once they are older or there are more of them
+MAX_DRAFT_AGE = 24 * 60 * 60
+MAX_DRAFTS = 10
+
+PositionData = dict[str, Any]
+
+
+class InvoiceDraft:
+    """
+    Positions of the invoice that is being created, kept in a :class:`Store` between requests.
+
+    Every position gets a ``key`` that stays the same while the draft exists, so single
+    positions can be changed or removed without sending or re-rendering all other positions.
+
+    Each draft has its own ``id``, which the create page posts with every request. Drafts
+    opened in different browser tabs of the same session are therefore kept apart.
+    """
+
+    def __init__(self, id: str, store: Store) -> None:
+        self.id = id
+        self.store = store
+
+    @classmethod
+    def new(cls, request: HttpRequest) -> "InvoiceDraft":
+        """
+        Starts a new draft. Drafts older than ``MAX_DRAFT_AGE`` seconds are removed from
+        the session, as are all but the newest drafts, so at most ``MAX_DRAFTS`` are kept.
+        """
+        now = time.time()
+        _prune_drafts(request.session, now)
+        draft = cls.of(request, uuid.uuid4().hex)
+        draft.store["created"] = now
+        return draft
+
+    @classmethod
+    def of(cls, request: HttpRequest, id: str) -> "InvoiceDraft":
+        """
+        Returns the draft with the given ``id``, raises ``ValueError`` for malformed ids.
+        """
+        if not DRAFT_ID_PATTERN.fullmatch(id):
+            raise ValueError(f"Invalid invoice draft id {id!r}")
+
+        return cls(id, SessionStore(STORE_PREFIX + id, request))
+
+    @property
+    def _positions(self) -> dict[str, PositionData]:
+        positions: dict[str, PositionData] | None = self.store.get("positions")
+        if positions is None:
+            positions = {}
+            self.store["positions"] = positions
+
+        return positions
+
+    def positions(self) -> list[PositionData]:
+        return list(self._positions.values())
+
+    def keep(self, keys: set[int]) -> None:
+        """
+        Removes all positions whose key is not in ``keys``.
+        """
+        for key in [int(key) for key in self._positions if int(key) not in keys]:
+            self.remove(key)
+
+    def get(self, key: int) -> PositionData | None:
+        return self._positions.get(str(key))
+
+    def add(self, position: PositionData) -> PositionData:
+        key = int(self.store.get("next_key", 1))
+        self.store["next_key"] = key + 1
+        self._positions[str(key)] = position = position | {"key": key}
+        return position
+
+    def update(self, key: int, changes: Mapping[str, Any]) -> PositionData | None:
+        """
+        Changes some fields of a position and returns it, or ``None`` if there is no such position.
+        """
+        position = self.get(key)
+        if position is not None:
+            position.update(changes)
+
+        return position
+
+    def remove(self, key: int) -> None:
+        self._positions.pop(str(key), None)
+
+    def clear(self) -> None:
+        self.store.clear()
+
+    def save(self) -> None:
+        self.store.save()
+
+
+def _prune_drafts(session: SessionBase, now: float) -> None:
+    # drafts cleared after creating their invoice have no creation time and count as expired
+    created = {
+        key: float(session[key].get("created", 0))
+        for key in list(session.keys())
+        if key.startswith(STORE_PREFIX)
+    }
+    recent = sorted(
+        (key for key, timestamp in created.items() if now - timestamp < MAX_DRAFT_AGE),
+        key=created.__getitem__,
+        reverse=True,
+    )
+    for key in created.keys() - set(recent[: MAX_DRAFTS - 1]):
+        del session[key]
@@ -0,0 +1,311 @@
+"""
+Bulk import of invoices from CSV files and OpenCost XML.
+
+Files are read row by row into :class:`ImportRow` entries, one per invoice position.
+Creditors and publications are resolved through lookup maps loaded once per import,
+so validating a row never queries the database. The resulting invoices are written
+in batches, each batch in its own transaction.
+"""
+
+import csv
+import datetime
+import xml.etree.ElementTree as ET
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from typing import IO, NamedTuple
+
+from django.db import transaction
+
+from coda.apps.invoices.models import Creditor
+from coda.apps.invoices.models import Invoice as InvoiceModel
+from coda.apps.invoices.services import invoices_create
+from coda.apps.pagination import chunked
+from coda.apps.publications.models import Link
+from coda.doi import strip_resolver
+from coda.invoice import CostType, CreditorId, Invoice, ItemType, PaymentStatus, Position, TaxRate
+from coda.money import Currency, Money
+from coda.publication import PublicationId
+
+BATCH_SIZE = 500
+
+CSV_FIELDS = ("invoice_number", "invoice_date", "creditor", "amount", "currency", "cost_type")
+
+# largest amount the position cost column can store
+MAX_AMOUNT = Decimal(10**6)
+
+_Key = tuple[CreditorId, str]
+
+
+class ImportRow(NamedTuple):
+    """
+    One invoice position as read from a file, before validation.
+    ``row`` is the line number in a CSV file or the number of the cost entry in OpenCost XML.
+    """
+
+    row: int
+    invoice_number: str
+    invoice_date: str
+    creditor: str
+    amount: str
+    currency: str
+    cost_type: str
+    doi: str = ""
+    description: str = ""
+    tax_rate: str = ""
+    status: str = ""
+
+
+class RowError(NamedTuple):
+    row: int
+    message: str
+
+
+@dataclass(slots=True)
+class ImportReport:
+    invoices: int = 0
+    positions: int = 0
+    skipped: int = 0
+    errors: list[RowError] = field(default_factory=list)
+
+
+def parse_csv(lines: Iterable[str]) -> Iterator[ImportRow]:
+    """
+    Parses CSV with a header row containing at least the columns in ``CSV_FIELDS``, one row
+    per position. Optional columns are doi, description, tax_rate (as a fraction, e.g. 0.19)
+    and status. Rows with the same creditor and invoice number belong to the same invoice.
+    """
+    reader = csv.DictReader(lines)
+    missing = [name for name in CSV_FIELDS if name not in (reader.fieldnames or [])]
+    if missing:
+        raise ValueError(f"Missing columns {', '.join(missing)}")
+
+    for row in reader:
+        yield ImportRow(
+            reader.line_num, *((row.get(name) or "").strip() for name in ImportRow._fields[1:])
+        )
+
+
+def parse_opencost(source: IO[bytes]) -> Iterator[ImportRow]:
+    """
+    Parses OpenCost XML into one row per ``cost_data`` entry of every invoice of a publication.
+    The invoicing party is the creditor and the publication is identified by its DOI.
+    Invoiced amounts are preferred over paid amounts. Every publication element is
+    discarded once it was read, so memory use does not grow with the size of the file.
+    """
+    entry = 0
+    for _, element in ET.iterparse(source):
+        if _local_name(element) != "publication":
+            continue
+
+        doi = next(
+            (
+                _text(identifier, "value")
+                for identifier in _children(element, "primary_identifier", "identifier")
+                if _text(identifier, "type").lower() == "doi"
+            ),
+            "",
+        )
+        for invoice in _children(element, "invoice"):
+            for cost in _children(invoice, "cost_data"):
+                entry += 1
+                invoiced = _text(cost, "amount_invoiced")
+                yield ImportRow(
+                    row=entry,
+                    invoice_number=_text(invoice, "invoice_number"),
+                    invoice_date=_text(invoice, "invoice_date"),
+                    creditor=_text(invoice, "invoicing_party"),
+                    amount=invoiced or _text(cost, "amount_paid"),
+                    currency=_text(cost, "currency_invoiced" if invoiced else "currency"),
+                    cost_type=_text(cost, "type"),
+                    doi=doi,
+                )
+
+        element.clear()
+
+
+def import_invoices(rows: Iterable[ImportRow], batch_size: int = BATCH_SIZE) -> ImportReport:
+    """
+    Creates one invoice per creditor and invoice number from the given rows.
+
+    Every invalid row is reported, and its invoice is skipped as a whole, as are invoices
+    that were imported before. Nothing is written before all rows are validated. The valid
+    invoices are then created ``batch_size`` at a time, each batch in its own transaction.
+    """
+    lookups = _Lookups.load()
+    report = ImportReport()
+    drafts: dict[_Key, _Draft] = {}
+    invalid: set[_Key] = set()
+    for row in rows:
+        key: _Key | None = None
+        try:
+            key = (lookups.creditor(row.creditor), _required(row.invoice_number, "invoice number"))
+            if key in lookups.existing:
+                raise ValueError(f"Invoice {row.invoice_number} was already imported")
+
+            draft = drafts.get(key)
+            if draft is None:
+                draft = drafts[key] = _Draft.of(row, key[0])
+
+            draft.add(_position(row, lookups))
+        except ValueError as e:
+            report.errors.append(RowError(row.row, str(e)))
+            if key is not None:
+                invalid.add(key)
+
+    report.skipped = len(invalid)
+    valid = [draft for key, draft in drafts.items() if key not in invalid]
+    for batch in chunked(valid, batch_size):
+        with transaction.atomic():
+            invoices_create([draft.invoice() for draft in batch])
+
+        report.invoices += len(batch)
+        report.positions += sum(len(draft.positions) for draft in batch)
+
+    return report
+
+
+@dataclass(frozen=True, slots=True)
+class _Lookups:
+    creditors: dict[str, CreditorId]
+    publications: dict[str, PublicationId]
+    existing: set[_Key]
+
+    @classmethod
+    def load(cls) -> "_Lookups":
+        return cls(
+            creditors={
+                _name_key(name): CreditorId(pk)
+                for pk, name in Creditor.objects.values_list("pk", "name")
+            },
+            publications={
+                _doi_key(value): PublicationId(pk)
+                for value, pk in Link.objects.filter(type__name="DOI").values_list(
+                    "value", "publication_id"
+                )
+            },
+            existing={
+                (CreditorId(creditor), number)
+                for creditor, number in InvoiceModel.objects.values_list("creditor_id", "number")
+            },
+        )
+
+    def creditor(self, name: str) -> CreditorId:
+        try:
+            return self.creditors[_name_key(_required(name, "creditor"))]
+        except KeyError:
+            raise ValueError(f"Unknown creditor {name}") from None
+
+    def publication(self, doi: str) -> PublicationId:
+        try:
+            return self.publications[_doi_key(doi)]
+        except KeyError:
+            raise ValueError(f"Unknown DOI {doi}") from None
+
+
+@dataclass(slots=True)
+class _Draft:
+    number: str
+    date: datetime.date
+    creditor: CreditorId
+    status: PaymentStatus
+    positions: list[Position[ItemType]] = field(default_factory=list)
+
+    @classmethod
+    def of(cls, row: ImportRow, creditor: CreditorId) -> "_Draft":
+        try:
+            date = datetime.date.fromisoformat(row.invoice_date)
+        except ValueError:
+            raise ValueError(f"Invalid invoice date {row.invoice_date!r}") from None
+
+        try:
+            status = PaymentStatus(row.status.lower() or PaymentStatus.Unpaid.value)
+        except ValueError:
+            raise ValueError(f"Invalid status {row.status!r}") from None
+
+        return cls(row.invoice_number, date, creditor, status)
+
+    def add(self, position: Position[ItemType]) -> None:
+        currency = self.positions[0].cost.currency if self.positions else position.cost.currency
+        if position.cost.currency != currency:
+            raise ValueError(
+                f"Currency {position.cost.currency.code} differs from "
+                f"the invoice currency {currency.code}"
+            )
+
+        self.positions.append(position)
+
+    def invoice(self) -> Invoice:
+        return Invoice.new(self.number, self.date, self.creditor, self.positions, self.status)
+
+
+def _position(row: ImportRow, lookups: _Lookups) -> Position[ItemType]:
+    item: ItemType = (
+        lookups.publication(row.doi)
+        if row.doi
+        else _required(row.description, "DOI or description")
+    )
+    amount = _decimal(row.amount, "amount")
+    if abs(amount) >= MAX_AMOUNT:
+        raise ValueError(f"Amount {row.amount} is too large")
+
+    try:
+        currency = Currency.from_code(row.currency.upper())
+    except KeyError:
+        raise ValueError(f"Unknown currency {row.currency!r}") from None
+
+    try:
+        cost_type = CostType(row.cost_type.lower())
+    except ValueError:
+        raise ValueError(f"Invalid cost type {row.cost_type!r}") from None
+
+    tax_rate = _decimal(row.tax_rate or "0", "tax rate")
+    if not 0 <= tax_rate < 1:
+        raise ValueError(f"Tax rate {row.tax_rate} is not a fraction between 0 and 1")
+
+    return Position(
+        item=item,
+        cost=Money(amount, currency),
+        cost_type=cost_type,
+        tax_rate=TaxRate(tax_rate),
+    )
+
+
+def _required(value: str, name: str) -> str:
+    if not value:
+        raise ValueError(f"Missing {name}")
+
+    return value
+
+
+def _decimal(value: str, name: str) -> Decimal:
+    try:
+        number = Decimal(value)
+    except InvalidOperation:
+        raise ValueError(f"Invalid {name} {value!r}") from None
+
+    if not number.is_finite():
+        raise ValueError(f"Invalid {name} {value!r}")
+
+    return number
+
+
+def _name_key(name: str) -> str:
+    return " ".join(name.split()).casefold()
+
+
+def _doi_key(doi: str) -> str:
+    return strip_resolver(doi).lower()
+
+
+def _local_name(element: ET.Element) -> str:
+    # OpenCost files declare a default namespace, which ElementTree prefixes to every tag
+    return element.tag.rpartition("}")[2]
+
+
+def _children(element: ET.Element, *names: str) -> list[ET.Element]:
+    return [child for child in element if _local_name(child) in names]
+
+
+def _text(element: ET.Element, name: str) -> str:
+    return next(((child.text or "").strip() for child in _children(element, name)), "")
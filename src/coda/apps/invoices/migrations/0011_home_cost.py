@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("invoices", "0010_invoice_status"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="position",
+            name="cost_amount_home",
+            field=models.DecimalField(decimal_places=4, max_digits=20, null=True),
+        ),
+    ]
@@ -0,0 +1,123 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:22
+
+import itertools
+from collections import defaultdict
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any
+
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+
+CHUNK_SIZE = 1000
+
+# minor units of the currencies known when this migration was written, inlined so that
+# the migration keeps computing the same totals when coda.money changes
+_CODES_BY_MINOR_UNITS = {
+    0: "BIF CLP DJF GNF ISK JPY KMF KRW PYG RWF UGX UYI VND VUV XAF XOF XPF",
+    2: (
+        "AED AFN ALL AMD ANG AOA ARS AUD AWG AZN BAM BBD BDT BGN BMD BND BOB BOV BRL BSD BTN "
+        "BWP BYN BZD CAD CDF CHE CHF CHW CNY COP COU CRC CUC CUP CVE CZK DKK DOP DZD EGP ERN "
+        "ETB EUR FJD FKP GBP GEL GHS GIP GMD GTQ GYD HKD HNL HTG HUF IDR ILS INR IRR JMD KES "
+        "KGS KHR KPW KYD KZT LAK LBP LKR LRD LSL MAD MDL MGA MKD MMK MNT MOP MRU MUR MVR MWK "
+        "MXN MXV MYR MZN NAD NGN NIO NOK NPR NZD PAB PEN PGK PHP PKR PLN QAR RON RSD RUB SAR "
+        "SBD SCR SDG SEK SGD SHP SLE SLL SOS SRD SSP STN SVC SYP SZL THB TJS TMT TOP TRY TTD "
+        "TWD TZS UAH USD USN UYU UZS VED VES WST XCD YER ZAR ZMW ZWL"
+    ),
+    3: "BHD IQD JOD KWD LYD OMR TND",
+    4: "CLF UYW",
+}
+MINOR_UNITS = {
+    code: units for units, codes in _CODES_BY_MINOR_UNITS.items() for code in codes.split()
+}
+
+
+def populate(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    Invoice = apps.get_model("invoices", "Invoice")
+    Position = apps.get_model("invoices", "Position")
+
+    ids = Invoice.objects.order_by("id").values_list("id", flat=True).iterator(CHUNK_SIZE)
+    while chunk := list(itertools.islice(ids, CHUNK_SIZE)):
+        positions = defaultdict(list)
+        rows = (
+            Position.objects.filter(invoice_id__in=chunk)
+            .order_by("id")
+            .values_list("invoice_id", "cost_amount", "cost_currency", "tax_rate")
+        )
+        for invoice_id, *position in rows:
+            positions[invoice_id].append(position)
+
+        Invoice.objects.bulk_update(
+            [Invoice(pk=id, **_totals(positions[id])) for id in chunk],
+            ["currency", "net_amount", "tax_amount", "total_amount"],
+        )
+
+
+def _totals(positions: list[list[Any]]) -> dict[str, Any]:
+    """
+    Computes the totals of an invoice from its positions like ``coda.invoice.Invoice`` did
+    when this migration was written: in the currency of the first position, with the tax of
+    every position rounded half up to its currency's minor units.
+    """
+    currency = positions[0][1] if positions else "EUR"
+    no_totals = {"currency": currency, "net_amount": None, "tax_amount": None, "total_amount": None}
+    if any(position_currency not in MINOR_UNITS for _, position_currency, _ in positions):
+        # positions with unknown currency codes have no total, the invoice stays listed
+        return no_totals
+
+    net = tax = Decimal(0)
+    for amount, position_currency, tax_rate in positions:
+        position_tax = _round(amount * tax_rate, position_currency)
+        if position_currency != currency and not (
+            net == 0 and amount == 0 and tax == 0 and position_tax == 0
+        ):
+            # positions in different currencies have no total, like in the domain model
+            return no_totals
+
+        net += amount
+        tax += position_tax
+
+    return {
+        "currency": currency,
+        "net_amount": _round(net, currency),
+        "tax_amount": _round(tax, currency),
+        "total_amount": _round(net + tax, currency),
+    }
+
+
+def _round(amount: Decimal, currency: str) -> Decimal:
+    return amount.quantize(Decimal(1).scaleb(-MINOR_UNITS[currency]), rounding=ROUND_HALF_UP)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("invoices", "0011_home_cost"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="invoice",
+            name="currency",
+            field=models.CharField(default="EUR", max_length=3),
+        ),
+        migrations.AddField(
+            model_name="invoice",
+            name="net_amount",
+            field=models.DecimalField(decimal_places=4, max_digits=14, null=True),
+        ),
+        migrations.AddField(
+            model_name="invoice",
+            name="tax_amount",
+            field=models.DecimalField(decimal_places=4, max_digits=14, null=True),
+        ),
+        migrations.AddField(
+            model_name="invoice",
+            name="total_amount",
+            field=models.DecimalField(decimal_places=4, max_digits=14, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="invoice",
+            index=models.Index(fields=["currency", "total_amount"], name="invoice_total_idx"),
+        ),
+        migrations.RunPython(populate, migrations.RunPython.noop),
+    ]
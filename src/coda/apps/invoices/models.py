@@ -24,6 +24,17 @@ class Invoice(models.Model):
     number = models.CharField(max_length=255)
     status = models.CharField(max_length=255, default="unpaid")
     comment = models.TextField(blank=True)
+    # totals of all positions in the invoice currency, maintained by the invoice services,
+    # None if the positions are in different currencies
+    currency = models.CharField(max_length=3, default="EUR")
+    net_amount = models.DecimalField(max_digits=14, decimal_places=4, null=True)
+    tax_amount = models.DecimalField(max_digits=14, decimal_places=4, null=True)
+    total_amount = models.DecimalField(max_digits=14, decimal_places=4, null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["currency", "total_amount"], name="invoice_total_idx"),
+        ]
 
     def get_absolute_url(self) -> str:
         return reverse("invoices:detail", kwargs={"pk": self.pk})
@@ -34,6 +45,8 @@ class Position(models.Model):
     publication = models.ForeignKey(Publication, on_delete=models.CASCADE, null=True)
     cost_amount = models.DecimalField(max_digits=10, decimal_places=4)
     cost_currency = models.CharField(max_length=3)
+    # cost in the home currency, None while no exchange rate was available
+    cost_amount_home = models.DecimalField(max_digits=20, decimal_places=4, null=True)
     cost_type = models.CharField(max_length=255, default="other")
     tax_rate = models.DecimalField(max_digits=10, decimal_places=4, default=0)
     funding_source = models.ForeignKey(FundingSource, on_delete=models.CASCADE, null=True)
@@ -1,5 +1,16 @@
+from collections.abc import Callable, Sequence
+from decimal import Decimal
+from typing import Any
+
+from django.db import transaction
+from django.db.models import QuerySet, Sum
+from django.dispatch import receiver
+
+from coda.apps.exchangerates.services import home_amounts, home_converter, home_rates_refreshed
 from coda.apps.invoices.models import Invoice as InvoiceModel
 from coda.apps.invoices.models import Position as PositionModel
+from coda.apps.pagination import chunked
+from coda.apps.preferences.models import GlobalPreferences
 from coda.invoice import (
     CostType,
     CreditorId,
@@ -11,9 +22,11 @@ from coda.invoice import (
     Position,
     TaxRate,
 )
-from coda.money import Currency, Money
+from coda.money import Currency, CurrencyExchange, Money
 from coda.publication import PublicationId
 
+CHUNK_SIZE = 1000
+
 
 def get_by_id(invoice_id: InvoiceId) -> Invoice:
     return as_domain_object(InvoiceModel.objects.get(id=invoice_id))
@@ -33,7 +46,7 @@ def as_domain_object(model: InvoiceModel) -> Invoice:
                     if position.publication_id
                     else position.description
                 ),
-                cost=Money(position.cost_amount, Currency[position.cost_currency]),
+                cost=Money(position.cost_amount, Currency.from_code(position.cost_currency)),
                 cost_type=CostType(position.cost_type),
                 tax_rate=TaxRate(position.tax_rate),
                 funding_source=(
@@ -49,41 +62,158 @@ def as_domain_object(model: InvoiceModel) -> Invoice:
 
 
 def invoice_create(invoice: Invoice) -> InvoiceId:
-    m = InvoiceModel.objects.create(
+    m = _invoice_model(invoice)
+    m.save(force_insert=True)
+
+    to_home = home_converter()
+    PositionModel.objects.bulk_create(
+        [_position_model(position, m.id, to_home) for position in invoice.positions]
+    )
+
+    return InvoiceId(m.id)
+
+
+def invoices_create(invoices: Sequence[Invoice]) -> list[InvoiceId]:
+    """
+    Creates many invoices at once, inserting all invoices and then all of their positions
+    in batches of ``CHUNK_SIZE`` rows. Callers decide about the surrounding transaction.
+    """
+    models = InvoiceModel.objects.bulk_create(
+        [_invoice_model(invoice) for invoice in invoices], batch_size=CHUNK_SIZE
+    )
+
+    to_home = home_converter()
+    PositionModel.objects.bulk_create(
+        [
+            _position_model(position, m.id, to_home)
+            for invoice, m in zip(invoices, models)
+            for position in invoice.positions
+        ],
+        batch_size=CHUNK_SIZE,
+    )
+
+    return [InvoiceId(m.id) for m in models]
+
+
+def _invoice_model(invoice: Invoice) -> InvoiceModel:
+    net, tax, total = _total_amounts(invoice)
+    return InvoiceModel(
         number=invoice.number,
         date=invoice.date,
         creditor_id=invoice.creditor,
         comment=invoice.comment,
         status=invoice.status.value,
+        currency=invoice.currency().code,
+        net_amount=net,
+        tax_amount=tax,
+        total_amount=total,
     )
 
-    def _create_position(pos: Position[ItemType]) -> PositionModel:
-        match pos.item:
-            case int(pub_id):
-                return PositionModel(
-                    publication_id=pub_id,
-                    cost_amount=pos.cost.amount,
-                    cost_currency=pos.cost.currency.code,
-                    cost_type=pos.cost_type.value,
-                    tax_rate=pos.tax_rate,
-                    funding_source_id=pos.funding_source,
-                    invoice_id=m.id,
-                )
-            case str(description):
-                return PositionModel(
-                    description=description,
-                    cost_amount=pos.cost.amount,
-                    cost_currency=pos.cost.currency.code,
-                    cost_type=pos.cost_type.value,
-                    tax_rate=pos.tax_rate,
-                    funding_source_id=pos.funding_source,
-                    invoice_id=m.id,
-                )
-            case _:
-                raise ValueError("Invalid position item")
 
-    PositionModel.objects.bulk_create(
-        [_create_position(position) for position in invoice.positions]
+def _position_model(
+    pos: Position[ItemType], invoice_id: int, to_home: Callable[[Money], Decimal | None]
+) -> PositionModel:
+    match pos.item:
+        case int(pub_id):
+            return PositionModel(
+                publication_id=pub_id,
+                cost_amount=pos.cost.amount,
+                cost_currency=pos.cost.currency.code,
+                cost_amount_home=to_home(pos.cost),
+                cost_type=pos.cost_type.value,
+                tax_rate=pos.tax_rate,
+                funding_source_id=pos.funding_source,
+                invoice_id=invoice_id,
+            )
+        case str(description):
+            return PositionModel(
+                description=description,
+                cost_amount=pos.cost.amount,
+                cost_currency=pos.cost.currency.code,
+                cost_amount_home=to_home(pos.cost),
+                cost_type=pos.cost_type.value,
+                tax_rate=pos.tax_rate,
+                funding_source_id=pos.funding_source,
+                invoice_id=invoice_id,
+            )
+        case _:
+            raise ValueError("Invalid position item")
+
+
+def _total_amounts(invoice: Invoice) -> tuple[Decimal | None, Decimal | None, Decimal | None]:
+    try:
+        return invoice.net().amount, invoice.tax().amount, invoice.total().amount
+    except TypeError:
+        return None, None, None
+
+
+def stored_totals(model: InvoiceModel) -> tuple[Money, Money, Money] | None:
+    """
+    Returns the net, tax and total amount of an invoice as stored by ``invoice_create``,
+    without loading its positions. Invoices with positions in different currencies
+    have no totals.
+    """
+    if model.net_amount is None or model.tax_amount is None or model.total_amount is None:
+        return None
+
+    currency = Currency.from_code(model.currency)
+    return (
+        Money(model.net_amount, currency),
+        Money(model.tax_amount, currency),
+        Money(model.total_amount, currency),
     )
 
-    return InvoiceId(m.id)
+
+def invoices_above(minimum: Money) -> QuerySet[InvoiceModel]:
+    """
+    Returns all invoices in the currency of ``minimum`` with a total above it.
+    The stored totals are indexed together with the currency, so no positions are read.
+    """
+    return InvoiceModel.objects.filter(
+        currency=minimum.currency.code, total_amount__gt=minimum.amount
+    )
+
+
+def invoices_total_spent() -> Money:
+    """
+    Returns the net cost of all invoice positions in the home currency, summed up in the database.
+    Positions without a home currency cost yet are not included.
+    """
+    total = PositionModel.objects.aggregate(total=Sum("cost_amount_home"))["total"]
+    return Money(total or 0, GlobalPreferences.get_home_currency())
+
+
+@transaction.atomic
+def positions_recompute_home_cost(exchange: CurrencyExchange, missing_only: bool = False) -> int:
+    """
+    Recomputes the home currency cost of all invoice positions, e.g. after the home currency
+    or the exchange rates changed. With ``missing_only``, only positions without a home
+    currency cost are updated. Returns the number of updated positions.
+    """
+    positions = PositionModel.objects.all()
+    if missing_only:
+        positions = positions.filter(cost_amount_home__isnull=True)
+
+    rows = (
+        positions.order_by("id")
+        .values_list("id", "cost_amount", "cost_currency")
+        .iterator(CHUNK_SIZE)
+    )
+    updated = 0
+    for chunk in chunked(rows, CHUNK_SIZE):
+        ids, amounts, currencies = zip(*chunk)
+        PositionModel.objects.bulk_update(
+            [
+                PositionModel(pk=id, cost_amount_home=cost)
+                for id, cost in zip(ids, home_amounts(amounts, currencies, exchange))
+            ],
+            ["cost_amount_home"],
+        )
+        updated += len(chunk)
+
+    return updated
+
+
+@receiver(home_rates_refreshed)
+def _fill_missing_home_costs(sender: Any, exchange: CurrencyExchange, **kwargs: Any) -> None:
+    positions_recompute_home_cost(exchange, missing_only=True)
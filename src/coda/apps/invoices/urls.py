@@ -6,6 +6,7 @@ from coda.apps.invoices.views.create import (
     get_total,
     remove_position,
     search_publications,
+    update_position,
 )
 from coda.apps.invoices.views.creditor import (
     CreditorCreateView,
@@ -23,7 +24,8 @@ urlpatterns = [
     path("create/", create_invoice, name="create"),
     path("create/search-publications/", search_publications, name="pub_search"),
     path("create/add-position/", add_position, name="add_position"),
-    path("create/remove-position/", remove_position, name="remove_position"),
+    path("create/positions/<int:key>/", update_position, name="update_position"),
+    path("create/positions/<int:key>/remove/", remove_position, name="remove_position"),
     path("create/total/", get_total, name="get_total"),
     path("creditors/", CreditorListView.as_view(), name="creditor_list"),
     path("creditors/<int:pk>/", CreditorDetailView.as_view(), name="creditor_detail"),
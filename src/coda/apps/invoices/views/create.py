@@ -1,44 +1,83 @@
 import datetime
+from decimal import Decimal, InvalidOperation
 from typing import Any
 
 from django.contrib.auth.decorators import login_required
+from django.core.exceptions import BadRequest
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import redirect, render
+from django.views.decorators.cache import cache_control
+from django.views.decorators.vary import vary_on_cookie
 
+from coda.apps.fundingrequests.models import FundingRequest
+from coda.apps.invoices.draft import InvoiceDraft
 from coda.apps.invoices.forms import InvoiceForm
+from coda.apps.invoices.importing import MAX_AMOUNT
 from coda.apps.invoices.services import invoice_create
-from coda.apps.publications.models import Publication
+from coda.apps.publications.models import Link, Publication
+from coda.apps.textsearch import relevance
+from coda.doi import strip_resolver
 from coda.invoice import CostType, CreditorId, Invoice, InvoiceId, Position, Positions, TaxRate
 from coda.money import Currency, Money
 from coda.publication import PublicationId
 
 DEFAULT_TAX_RATE_PERCENTAGE = 19
+COST_TYPES = {cost_type.value for cost_type in CostType}
+
+SEARCH_LIMIT = 20
+MIN_TITLE_SEARCH_LENGTH = 3
+# seconds the browser may reuse the results for a search term
+SEARCH_MAX_AGE = 60
 
 
 @login_required
 def create_invoice(request: HttpRequest) -> HttpResponse:
+    if request.method == "GET":
+        draft = InvoiceDraft.new(request)
+    else:
+        draft = posted_draft(request)
+
     if request.POST.get("action") == "create":
-        if new_id := save_invoice(request):
+        apply_position_changes(request, draft)
+        if new_id := save_invoice(request, draft):
+            draft.clear()
+            draft.save()
             return redirect("invoices:detail", pk=new_id)
 
+    draft.save()
+    positions = draft.positions()
     return render(
         request,
         "invoices/create.html",
         {
             "form": InvoiceForm(request.POST if request.POST else None),
+            "draft_id": draft.id,
             "currencies": list(Currency),
             "cost_types": [ct.value for ct in CostType],
-            "positions": existing_positions(request),
-        },
+            "positions": positions,
+        }
+        | invoice_total_context(positions, posted_currency(request)),
     )
 
 
-def save_invoice(request: HttpRequest) -> InvoiceId | None:
+def posted_draft(request: HttpRequest) -> InvoiceDraft:
+    try:
+        return InvoiceDraft.of(request, request.POST.get("draft", ""))
+    except ValueError:
+        raise BadRequest("Invalid invoice draft") from None
+
+
+def posted_currency(request: HttpRequest) -> Currency:
+    try:
+        return Currency.from_code(request.POST.get("currency", "EUR"))
+    except KeyError:
+        raise BadRequest("Unknown currency") from None
+
+
+def save_invoice(request: HttpRequest, draft: InvoiceDraft) -> InvoiceId | None:
     form = InvoiceForm(request.POST)
     if form.is_valid():
-        number_of_positions = int(request.POST.get("number-of-positions", 0))
-        positions = [parse_position_data(request, i) for i in range(1, number_of_positions + 1)]
-        return invoice_create(parse_invoice(form, positions))
+        return invoice_create(parse_invoice(form, draft.positions()))
 
     return None
 
@@ -80,114 +119,180 @@ def parse_into_position_list(positions: list[dict[str, Any]], currency: Currency
 
 
 @login_required
+@cache_control(private=True, max_age=SEARCH_MAX_AGE)
+@vary_on_cookie
 def search_publications(request: HttpRequest) -> HttpResponse:
-    query = request.POST.get("q", "")
-    if query:
-        publications = Publication.objects.filter(title__icontains=query)
-    else:
-        publications = Publication.objects.none()
+    search_results = [search_result_for(pub) for pub in find_publications(request.GET.get("q", ""))]
+    return render(
+        request, "invoices/publication_search_results.html", {"publications": search_results}
+    )
+
+
+def find_publications(term: str, limit: int = SEARCH_LIMIT) -> list[Publication]:
+    """
+    Returns at most ``limit`` publications for the publication picker, together with their
+    funding requests. Publications whose DOI or funding request id equals ``term`` come first,
+    followed by publications with ``term`` in their title, best matches first.
+    Titles are only searched for terms of at least ``MIN_TITLE_SEARCH_LENGTH`` characters,
+    shorter terms cannot use the trigram index on titles.
+    """
+    term = term.strip()
+    if not term:
+        return []
+
+    publications = Publication.objects.select_related("fundingrequest")
+    exact = _exact_matches(term)
+    found = list(publications.filter(pk__in=exact)[:limit]) if exact else []
+    if len(term) >= MIN_TITLE_SEARCH_LENGTH and len(found) < limit:
+        by_title = (
+            publications.filter(title__icontains=term)
+            .exclude(pk__in=exact)
+            .annotate(relevance=relevance({"title": term}))
+            .order_by("-relevance", "title")
+        )
+        found.extend(by_title[: limit - len(found)])
+
+    return found
+
+
+def _exact_matches(term: str) -> list[int]:
+    doi = strip_resolver(term)
+    ids: list[int] = []
+    if doi.startswith("10."):
+        ids.extend(
+            Link.objects.filter(type__name="DOI", value__iexact=doi).values_list(
+                "publication_id", flat=True
+            )
+        )
+
+    if term.lower().startswith("coda-"):
+        ids.extend(
+            FundingRequest.objects.filter(request_id=term.lower()).values_list(
+                "publication_id", flat=True
+            )
+        )
 
-    search_results = [search_result_for(pub) for pub in publications]
-    return render(request, "invoices/search_publications.html", {"publications": search_results})
+    return ids
 
 
 @login_required
 def add_position(request: HttpRequest) -> HttpResponse:
-    positions = assemble_positions(request)
+    draft = posted_draft(request)
+    added = [
+        draft.add(position)
+        for position in (
+            parse_added_free_position(request),
+            parse_added_publication_position(request),
+        )
+        if position is not None
+    ]
+    draft.save()
+    return render_position_changes(request, draft, added)
 
-    return render(
-        request,
-        "invoices/invoice_positions.html",
-        {"positions": positions, "cost_types": [ct.value for ct in CostType]}
-        | invoice_total_context(positions, request.POST.get("currency", "EUR")),
-    )
+
+@login_required
+def update_position(request: HttpRequest, key: int) -> HttpResponse:
+    draft = posted_draft(request)
+    position = draft.update(key, parse_position_changes(request, key))
+    draft.save()
+    return render_position_changes(request, draft, [position] if position else [])
 
 
 @login_required
-def remove_position(request: HttpRequest) -> HttpResponse:
-    positions = existing_positions(request)
-    if remove_position := request.POST.get("remove-position"):
-        positions.pop(int(remove_position) - 1)
+def remove_position(request: HttpRequest, key: int) -> HttpResponse:
+    draft = posted_draft(request)
+    draft.remove(key)
+    draft.save()
+    return render_position_changes(request, draft, [])
+
 
+@login_required
+def get_total(request: HttpRequest) -> HttpResponse:
+    positions = posted_draft(request).positions()
     return render(
         request,
-        "invoices/invoice_positions.html",
-        {"positions": positions, "cost_types": [ct.value for ct in CostType]}
-        | invoice_total_context(positions, request.POST.get("currency", "EUR")),
+        "invoices/position_totals.html",
+        {"positions": positions} | invoice_total_context(positions, posted_currency(request)),
     )
 
 
-@login_required
-def get_total(request: HttpRequest) -> HttpResponse:
+def render_position_changes(
+    request: HttpRequest, draft: InvoiceDraft, changed: list[dict[str, Any]]
+) -> HttpResponse:
+    """
+    Renders only the changed position rows, followed by the totals of all positions,
+    which replace the displayed totals out of band.
+    """
+    positions = draft.positions()
     return render(
         request,
-        "invoices/invoice_positions.html",
+        "invoices/position_changes.html",
         {
-            "positions": existing_positions(request),
+            "changed": changed,
+            "positions": positions,
             "cost_types": [ct.value for ct in CostType],
         }
-        | invoice_total_context(assemble_positions(request), request.POST.get("currency", "EUR")),
+        | invoice_total_context(positions, posted_currency(request)),
     )
 
 
-def invoice_total_context(positions: list[dict[str, Any]], currency: str) -> dict[str, Any]:
-    _currency = Currency.from_code(currency)
-    _tmp_invoice = temp_invoice(positions, _currency)
+def invoice_total_context(positions: list[dict[str, Any]], currency: Currency) -> dict[str, Any]:
+    _tmp_invoice = temp_invoice(positions, currency)
     return {
         "tax": _tmp_invoice.tax().amount,
         "total": _tmp_invoice.total().amount,
     }
 
 
-def assemble_positions(request: HttpRequest) -> list[dict[str, Any]]:
-    positions = existing_positions(request)
-    if free_position := parse_added_free_position(request):
-        positions.append(free_position)
-
-    if new_publication_position := parse_added_publication_position(request):
-        positions.append(new_publication_position)
+def apply_position_changes(request: HttpRequest, draft: InvoiceDraft) -> None:
+    """
+    Applies the posted values of all positions to the draft, in case a change of a single
+    position did not reach the server before the invoice was submitted. Positions that are
+    not part of the submitted form are dropped from the draft.
+    """
+    draft.keep({int(key) for key in request.POST.getlist("positions") if key.isdecimal()})
+    for position in draft.positions():
+        draft.update(position["key"], parse_position_changes(request, position["key"]))
 
-    return positions
 
-
-def existing_positions(request: HttpRequest) -> list[dict[str, Any]]:
-    number_of_positions = int(request.POST.get("number-of-positions", 0))
-    positions = [parse_position_data(request, i) for i in range(1, number_of_positions + 1)]
-    return positions
-
-
-def parse_position_data(request: HttpRequest, index: int) -> dict[str, Any]:
-    if request.POST.get(f"position-{index}-type") == "free":
-        return parse_free_position(request, index)
-    else:
-        return parse_publication_position(request, index)
+def parse_position_changes(request: HttpRequest, key: int) -> dict[str, Any]:
+    fields = {
+        "description": (f"position-{key}-description", ""),
+        "cost_amount": (f"position-{key}-cost", "0.00"),
+        "cost_type": (f"position-{key}-cost-type", CostType.Other.value),
+        "tax_rate": (f"position-{key}-taxrate", "0"),
+    }
+    return validated(
+        {
+            field: request.POST.get(name) or default
+            for field, (name, default) in fields.items()
+            if name in request.POST
+        }
+    )
 
 
-def parse_free_position(request: HttpRequest, index: int) -> dict[str, Any]:
-    return parse_common_position_data(request, index) | {
-        "type": "free",
-        "description": request.POST.get(f"position-{index}-description", ""),
-    }
+def validated(position: dict[str, Any]) -> dict[str, Any]:
+    """
+    Returns the posted ``position`` fields if they can be turned into a :class:`Position`,
+    otherwise raises ``BadRequest``, so invalid values are never stored in the draft.
+    """
+    if "cost_amount" in position:
+        try:
+            amount = Decimal(position["cost_amount"])
+        except InvalidOperation:
+            raise BadRequest("Invalid cost") from None
 
+        if not amount.is_finite() or not 0 <= amount < MAX_AMOUNT:
+            raise BadRequest("Invalid cost")
 
-def parse_publication_position(request: HttpRequest, index: int) -> dict[str, Any]:
-    return parse_common_position_data(request, index) | {
-        "type": "publication",
-        "id": request.POST.get(f"position-{index}-id", "0"),
-        "title": request.POST.get(f"position-{index}-title", ""),
-        "funding_request": {
-            "request_id": request.POST.get(f"position-{index}-fundingrequest-id", ""),
-            "url": request.POST.get(f"position-{index}-fundingrequest-url", ""),
-        },
-    }
+    if "cost_type" in position and position["cost_type"] not in COST_TYPES:
+        raise BadRequest("Invalid cost type")
 
+    tax_rate = position.get("tax_rate", "0")
+    if not tax_rate.isdecimal() or int(tax_rate) > 100:
+        raise BadRequest("Invalid tax rate")
 
-def parse_common_position_data(request: HttpRequest, index: int) -> dict[str, Any]:
-    return {
-        "cost_amount": request.POST.get(f"position-{index}-cost", "0.00"),
-        "cost_type": request.POST.get(f"position-{index}-cost-type", CostType.Other.value),
-        "tax_rate": request.POST.get(f"position-{index}-taxrate", "0"),
-    }
+    return position
 
 
 def parse_added_publication_position(request: HttpRequest) -> dict[str, Any] | None:
@@ -195,7 +300,7 @@ def parse_added_publication_position(request: HttpRequest) -> dict[str, Any] | N
     if publication_id is None:
         return None
 
-    publication = Publication.objects.get(pk=publication_id)
+    publication = Publication.objects.select_related("fundingrequest").get(pk=publication_id)
     return {
         "type": "publication",
         "id": str(publication.id),
@@ -211,13 +316,15 @@ def parse_added_free_position(request: HttpRequest) -> dict[str, Any] | None:
     if request.POST.get("action") != "add-free-position":
         return None
 
-    return {
-        "type": "free",
-        "description": request.POST.get("free-position-description", ""),
-        "cost_amount": request.POST.get("free-position-cost", "0.00"),
-        "cost_type": request.POST.get("free-position-cost-type", CostType.Other.value),
-        "tax_rate": request.POST.get("free-position-taxrate", "0"),
-    }
+    return validated(
+        {
+            "type": "free",
+            "description": request.POST.get("free-position-description", ""),
+            "cost_amount": request.POST.get("free-position-cost") or "0.00",
+            "cost_type": request.POST.get("free-position-cost-type", CostType.Other.value),
+            "tax_rate": request.POST.get("free-position-taxrate") or "0",
+        }
+    )
 
 
 def search_result_for(publication: Publication) -> dict[str, Any]:
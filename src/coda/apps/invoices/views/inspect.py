@@ -1,34 +1,125 @@
 import datetime
-from typing import NamedTuple, cast
+from collections.abc import Iterable, Mapping
+from decimal import Decimal, InvalidOperation
+from typing import NamedTuple
 
 from django.contrib.auth.decorators import login_required
+from django.core.paginator import Paginator
+from django.db.models import F, QuerySet
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import get_object_or_404, render
+from django.urls import reverse
 
-from coda.apps.authors.models import Author
 from coda.apps.fundingrequests.models import FundingRequest
 from coda.apps.invoices.models import Invoice as InvoiceModel
-from coda.apps.invoices.services import as_domain_object
+from coda.apps.invoices.services import as_domain_object, invoices_above, stored_totals
+from coda.apps.preferences.models import GlobalPreferences
 from coda.apps.publications.models import Publication
-from coda.invoice import FundingSourceId, ItemType, Position
-from coda.money import Money
+from coda.invoice import FundingSourceId, ItemType, PaymentStatus, Position
+from coda.money import Currency, Money
+
+PAGE_SIZE = 20
 
 
 @login_required
 def invoice_list(request: HttpRequest) -> HttpResponse:
-    invoices = map(invoice_viewmodel, InvoiceModel.objects.all())
-    return render(request, "invoices/list.html", {"invoices": invoices})
+    currency = _currency(request)
+    page = Paginator(list_query(request, currency), PAGE_SIZE).get_page(request.GET.get("page"))
+    return render(
+        request,
+        "invoices/list.html",
+        {
+            "invoices": [invoice_list_viewmodel(model) for model in page.object_list],
+            "page_obj": page,
+            "currencies": list(Currency),
+            "selected_currency": currency.code,
+        },
+    )
+
+
+def list_query(request: HttpRequest, currency: Currency) -> QuerySet[InvoiceModel]:
+    """
+    Returns the invoices for the list view, optionally limited to totals above ``min_total``
+    in ``currency``. With ``sort=total``, only invoices in ``currency`` are listed, largest
+    total first, as totals in different currencies cannot be compared. Only the stored totals
+    are read, so no positions are loaded.
+    """
+    minimum = _decimal(request.GET.get("min_total", ""))
+    queryset = (
+        invoices_above(Money(minimum, currency))
+        if minimum is not None
+        else InvoiceModel.objects.all()
+    ).select_related("creditor")
+
+    if request.GET.get("sort") == "total":
+        return queryset.filter(currency=currency.code).order_by(
+            F("total_amount").desc(nulls_last=True), "-id"
+        )
+
+    return queryset.order_by("-date", "-id")
+
+
+def _currency(request: HttpRequest) -> Currency:
+    try:
+        return Currency.from_code(request.GET.get("currency", ""))
+    except KeyError:
+        return GlobalPreferences.get_home_currency()
+
+
+def _decimal(value: str) -> Decimal | None:
+    try:
+        number = Decimal(value)
+    except InvalidOperation:
+        return None
+
+    return number if number.is_finite() else None
 
 
 @login_required
 def invoice_detail(request: HttpRequest, pk: int) -> HttpResponse:
-    invoice_model = get_object_or_404(InvoiceModel, pk=pk)
-    return render(request, "invoices/detail.html", {"invoice": invoice_viewmodel(invoice_model)})
+    invoice_model = get_object_or_404(invoices(), pk=pk)
+    return render(
+        request, "invoices/detail.html", {"invoice": invoice_viewmodels([invoice_model])[0]}
+    )
+
+
+def invoices() -> QuerySet[InvoiceModel]:
+    return InvoiceModel.objects.select_related("creditor").prefetch_related("positions")
+
+
+def invoice_viewmodels(invoice_models: Iterable[InvoiceModel]) -> list["InvoiceViewModel"]:
+    """
+    Creates the view models of many invoices at once. The publications and funding requests
+    of all positions are loaded with one query each, however many invoices there are.
+    """
+    invoice_models = list(invoice_models)
+    publication_ids = {
+        position.publication_id
+        for invoice_model in invoice_models
+        for position in invoice_model.positions.all()
+        if position.publication_id
+    }
+    publications = _publications(publication_ids)
+    return [invoice_viewmodel(invoice_model, publications) for invoice_model in invoice_models]
 
 
-def invoice_viewmodel(invoice_model: InvoiceModel) -> "InvoiceViewModel":
+def invoice_list_viewmodel(invoice_model: InvoiceModel) -> "InvoiceListViewModel":
+    return InvoiceListViewModel(
+        url=invoice_model.get_absolute_url(),
+        status=PaymentStatus(invoice_model.status).name,
+        number=invoice_model.number,
+        date=invoice_model.date,
+        creditor_name=invoice_model.creditor.name,
+        total=totals[2] if (totals := stored_totals(invoice_model)) else None,
+    )
+
+
+def invoice_viewmodel(
+    invoice_model: InvoiceModel, publications: Mapping[int, "PublicationViewModel"]
+) -> "InvoiceViewModel":
     creditor_name = invoice_model.creditor.name
     invoice = as_domain_object(invoice_model)
+    _, tax, total = stored_totals(invoice_model) or (None, None, None)
     return InvoiceViewModel(
         url=invoice_model.get_absolute_url(),
         status=invoice.status.name,
@@ -37,26 +128,49 @@ def invoice_viewmodel(invoice_model: InvoiceModel) -> "InvoiceViewModel":
         creditor=invoice.creditor,
         creditor_name=creditor_name,
         positions=[
-            position_viewmodel(position, i) for i, position in enumerate(invoice.positions, start=1)
+            position_viewmodel(position, i, publications)
+            for i, position in enumerate(invoice.positions, start=1)
         ],
-        tax=invoice.tax(),
-        total=invoice.total(),
+        tax=tax,
+        total=total,
     )
 
 
-def position_viewmodel(position: Position[ItemType], number: int) -> "PositionViewModel":
+def _publications(ids: Iterable[int]) -> dict[int, "PublicationViewModel"]:
+    ids = list(ids)
+    if not ids:
+        return {}
+
+    funding_requests = {
+        publication_id: FundingRequestViewModel(
+            url=reverse("fundingrequests:detail", kwargs={"pk": pk}), request_id=request_id
+        )
+        for publication_id, pk, request_id in FundingRequest.objects.filter(
+            publication_id__in=ids
+        ).values_list("publication_id", "pk", "request_id")
+    }
+    rows = Publication.objects.filter(pk__in=ids).values_list(
+        "pk", "title", "submitting_author__name"
+    )
+    return {
+        pk: PublicationViewModel(
+            title=title,
+            submitter=submitter or "",
+            related_funding_request=funding_requests.get(pk),
+        )
+        for pk, title, submitter in rows
+    }
+
+
+def position_viewmodel(
+    position: Position[ItemType], number: int, publications: Mapping[int, "PublicationViewModel"]
+) -> "PositionViewModel":
     match position.item:
         case int(pub_id):
-            publication = get_object_or_404(Publication, pk=pub_id)
+            publication = publications[pub_id]
             publication_title = publication.title
-            submitter = cast(Author, publication.submitting_author).name
-            related_request = FundingRequest.objects.filter(publication_id=position.item).first()
-            related_funding_request = None
-            if related_request:
-                related_funding_request = FundingRequestViewModel(
-                    url=related_request.get_absolute_url(),
-                    request_id=related_request.request_id,
-                )
+            submitter = publication.submitter
+            related_funding_request = publication.related_funding_request
         case str(description):
             publication_title = description
             submitter = ""
@@ -78,6 +192,12 @@ class FundingRequestViewModel(NamedTuple):
     request_id: str
 
 
+class PublicationViewModel(NamedTuple):
+    title: str
+    submitter: str
+    related_funding_request: FundingRequestViewModel | None
+
+
 class PositionViewModel(NamedTuple):
     number: str
     name: str
@@ -96,5 +216,14 @@ class InvoiceViewModel(NamedTuple):
     creditor: int
     creditor_name: str
     positions: list[PositionViewModel]
-    tax: Money
-    total: Money
+    tax: Money | None
+    total: Money | None
+
+
+class InvoiceListViewModel(NamedTuple):
+    url: str
+    status: str
+    number: str
+    date: datetime.date
+    creditor_name: str
+    total: Money | None
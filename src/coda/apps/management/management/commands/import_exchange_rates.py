@@ -0,0 +1,36 @@
+from pathlib import Path
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+
+from coda.apps.exchangerates.history import import_rates, parse_csv, parse_json
+
+
+class Command(BaseCommand):
+    help = "Imports historical exchange rates from a CSV or JSON file"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        super().add_arguments(parser)
+        parser.add_argument("path", type=Path, help="CSV or JSON file with date, base, quote, rate")
+        parser.add_argument(
+            "--format", choices=["csv", "json"], help="File format, defaults to the file extension"
+        )
+
+    @transaction.atomic
+    def handle(self, *args: Any, **options: Any) -> None:
+        path: Path = options["path"]
+        format = options["format"] or path.suffix.lstrip(".").lower()
+        try:
+            with path.open(newline="") as f:
+                match format:
+                    case "csv":
+                        count = import_rates(parse_csv(f))
+                    case "json":
+                        count = import_rates(parse_json(f.read()))
+                    case _:
+                        raise CommandError(f"Unsupported format: {format}")
+        except (OSError, ValueError, KeyError) as e:
+            raise CommandError(f"Could not import {path}: {e}") from e
+
+        self.stdout.write(f"Imported {count} exchange rates")
@@ -0,0 +1,48 @@
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from coda.apps.invoices.importing import BATCH_SIZE, import_invoices, parse_csv, parse_opencost
+
+
+class Command(BaseCommand):
+    help = "Imports invoices from a CSV or OpenCost XML file"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        super().add_arguments(parser)
+        parser.add_argument("path", type=Path, help="CSV or OpenCost XML file with positions")
+        parser.add_argument(
+            "--format", choices=["csv", "xml"], help="File format, defaults to the file extension"
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BATCH_SIZE,
+            help="Number of invoices written per transaction",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        path: Path = options["path"]
+        format = options["format"] or path.suffix.lstrip(".").lower()
+        try:
+            match format:
+                case "csv":
+                    with path.open(newline="") as f:
+                        report = import_invoices(parse_csv(f), options["batch_size"])
+                case "xml":
+                    with path.open("rb") as f:
+                        report = import_invoices(parse_opencost(f), options["batch_size"])
+                case _:
+                    raise CommandError(f"Unsupported format: {format}")
+        except (OSError, ValueError, ET.ParseError) as e:
+            raise CommandError(f"Could not import {path}: {e}") from e
+
+        for error in report.errors:
+            self.stderr.write(f"Row {error.row}: {error.message}")
+
+        self.stdout.write(
+            f"Imported {report.invoices} invoices with {report.positions} positions, "
+            f"skipped {report.skipped} invoices with errors"
+        )
@@ -0,0 +1,43 @@
+from decimal import Decimal, InvalidOperation
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from coda.apps.exchangerates.services import currency_exchange
+from coda.apps.fundingrequests.services import fundingrequests_prescreen
+from coda.apps.preferences.models import GlobalPreferences
+from coda.checks.checklist import CheckResult
+from coda.money import Currency, Money
+
+
+class Command(BaseCommand):
+    help = "Checks the estimated cost of all open funding requests against a cost limit"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        super().add_arguments(parser)
+        parser.add_argument("limit", help="Highest acceptable estimated cost")
+        parser.add_argument(
+            "--currency", help="Currency code of the limit, defaults to the home currency"
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        try:
+            currency = (
+                Currency.from_code(options["currency"])
+                if options["currency"]
+                else GlobalPreferences.get_home_currency()
+            )
+            limit = Money(Decimal(options["limit"]), currency)
+        except (KeyError, InvalidOperation) as e:
+            raise CommandError(
+                f"Invalid cost limit: {options['limit']} {options['currency']}"
+            ) from e
+
+        results = fundingrequests_prescreen(limit, currency_exchange(wait_for_rates=True))
+        over_limit = [id for id, result in results.items() if result == CheckResult.FAILURE]
+        for id in over_limit:
+            self.stdout.write(f"Funding request {id} exceeds {limit.amount} {currency.code}")
+
+        self.stdout.write(
+            f"Checked {len(results)} open funding requests, {len(over_limit)} over limit"
+        )
@@ -0,0 +1,13 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from coda.apps.fundingrequests import readmodel
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the denormalized funding request list from the funding requests"
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        count = readmodel.rebuild()
+        self.stdout.write(f"Rebuilt {count} funding request list entries")
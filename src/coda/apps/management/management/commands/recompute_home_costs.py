@@ -0,0 +1,26 @@
+from typing import Any
+
+import httpx
+from django.core.management.base import BaseCommand, CommandError
+
+from coda.apps.exchangerates.services import currency_exchange
+from coda.apps.fundingrequests.services import fundingrequests_recompute_home_cost
+from coda.apps.invoices.services import positions_recompute_home_cost
+from coda.money.exchangeratesapi import CircuitOpen
+
+
+class Command(BaseCommand):
+    help = "Recomputes all costs in the home currency, e.g. after the home currency changed"
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        exchange = currency_exchange(wait_for_rates=True)
+        try:
+            requests = fundingrequests_recompute_home_cost(exchange)
+            positions = positions_recompute_home_cost(exchange)
+        except (KeyError, httpx.HTTPError, CircuitOpen) as e:
+            raise CommandError(f"Could not get exchange rates: {e!r}") from e
+
+        self.stdout.write(
+            f"Recomputed home currency costs of {requests} funding requests "
+            f"and {positions} invoice positions"
+        )
@@ -0,0 +1,135 @@
+import base64
+import binascii
+import datetime
+import itertools
+import json
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any, Generic, NamedTuple, Protocol, Self, TypeVar
+
+from django.db import connections
+from django.db.models import Model, Q, QuerySet
+
+
+class Listed(Protocol):
+    """
+    A row that can be paginated by cursor.
+    """
+
+    @property
+    def created_at(self) -> datetime.datetime: ...
+
+    @property
+    def pk(self) -> Any: ...
+
+
+M = TypeVar("M", bound=Model)
+L = TypeVar("L", bound=Listed)
+T = TypeVar("T")
+
+
+class Cursor(NamedTuple):
+    """
+    Position of a row in a listing ordered by ``(-created_at, -id)``.
+    """
+
+    created_at: datetime.datetime
+    id: int
+
+    @classmethod
+    def of(cls, row: Listed) -> Self:
+        return cls(row.created_at, row.pk)
+
+    def encode(self) -> str:
+        raw = f"{self.created_at.isoformat()}|{self.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @classmethod
+    def decode(cls, token: str) -> Self:
+        try:
+            created_at, id = base64.urlsafe_b64decode(token.encode()).decode().split("|")
+            return cls(datetime.datetime.fromisoformat(created_at), int(id))
+        except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+            raise ValueError(f"Invalid cursor: {token}") from e
+
+
+@dataclass(frozen=True, slots=True)
+class KeysetPage(Generic[L]):
+    object_list: list[L]
+    next_cursor: Cursor | None = None
+    previous_cursor: Cursor | None = None
+    approximate_count: int | None = None
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+
+def keyset_paginate(
+    queryset: QuerySet[Any, L],
+    per_page: int,
+    *,
+    after: Cursor | None = None,
+    before: Cursor | None = None,
+    with_count: bool = False,
+) -> KeysetPage[L]:
+    """
+    Returns the page of ``queryset`` directly after (older than) or before (newer than)
+    the given cursor, newest first. Unlike offset pagination, the cost of a page does not
+    depend on how deep into the listing it is, as long as ``(created_at, id)`` is indexed.
+    """
+    count = approximate_count(queryset) if with_count else None
+
+    if before is not None:
+        newer = Q(created_at__gt=before.created_at) | Q(
+            created_at=before.created_at, pk__gt=before.id
+        )
+        rows = list(queryset.filter(newer).order_by("created_at", "pk")[: per_page + 1])
+        has_previous = len(rows) > per_page
+        rows = rows[:per_page][::-1]
+        return KeysetPage(
+            object_list=rows,
+            next_cursor=Cursor.of(rows[-1]) if rows else None,
+            previous_cursor=Cursor.of(rows[0]) if rows and has_previous else None,
+            approximate_count=count,
+        )
+
+    if after is not None:
+        older = Q(created_at__lt=after.created_at) | Q(created_at=after.created_at, pk__lt=after.id)
+        queryset = queryset.filter(older)
+
+    rows = list(queryset.order_by("-created_at", "-pk")[: per_page + 1])
+    has_next = len(rows) > per_page
+    rows = rows[:per_page]
+    return KeysetPage(
+        object_list=rows,
+        next_cursor=Cursor.of(rows[-1]) if rows and has_next else None,
+        previous_cursor=Cursor.of(rows[0]) if rows and after is not None else None,
+        approximate_count=count,
+    )
+
+
+def approximate_count(queryset: QuerySet[M]) -> int:
+    """
+    Returns the planner's row estimate for ``queryset`` on PostgreSQL,
+    which avoids scanning all matching rows. Other databases fall back to an exact count.
+    """
+    if connections[queryset.db].vendor != "postgresql":
+        return queryset.count()
+
+    plan = json.loads(queryset.order_by().explain(format="json"))
+    if isinstance(plan, list):
+        plan = plan[0]
+
+    return int(plan["Plan"]["Plan Rows"])
+
+
+def chunked(iterable: Iterable[T], size: int) -> Iterator[list[T]]:
+    """
+    Splits ``iterable`` into consecutive lists of ``size`` items, the last one may be shorter.
+    """
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:37
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("publications", "0010_publication_title_trgm_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="link",
+            index=models.Index(
+                django.db.models.functions.text.Upper("value"), name="link_value_upper_idx"
+            ),
+        ),
+    ]
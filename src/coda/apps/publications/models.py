@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Upper
 
 from coda.apps.authors.models import Author
 from coda.apps.journals.models import Journal
@@ -83,3 +84,9 @@ class Link(models.Model):
     type = models.ForeignKey(LinkType, on_delete=models.CASCADE)
     value = models.TextField()
     publication = models.ForeignKey(Publication, on_delete=models.CASCADE, related_name="links")
+
+    class Meta:
+        indexes = [
+            # DOIs are case-insensitive and looked up with iexact, which compares UPPER(value)
+            models.Index(Upper("value"), name="link_value_upper_idx"),
+        ]
@@ -41,10 +41,14 @@ def as_domain_link(link_type: str, value: str) -> Link:
 
 def get_by_id(publication_id: PublicationId) -> Publication:
     model = PublicationModel.objects.get(pk=publication_id)
+    return as_domain_object(model)
+
+
+def as_domain_object(model: PublicationModel) -> Publication:
     state = _deserialize_publication_state(model)
 
     return Publication(
-        id=publication_id,
+        id=PublicationId(model.id),
         title=NonEmptyStr(model.title),
         license=License[model.license],
         open_access_type=OpenAccessType[model.open_access_type],
@@ -0,0 +1,82 @@
+"""
+Case-insensitive substring search backed by PostgreSQL trigram indexes.
+
+On PostgreSQL, Django translates ``icontains`` into ``UPPER(column::text) LIKE UPPER(%s)``.
+The GIN indexes created by the ``*_trgm_idx`` migrations are built on exactly that expression,
+so the planner can use them for ``icontains`` filters without changing query semantics.
+Databases without ``pg_trgm`` (e.g. SQLite in tests) keep scanning.
+
+Matches are ranked in tiers: exact matches first, then prefix matches, then other substring
+matches. Within a tier, values more similar to the term as a whole rank higher, by trigram
+similarity where ``pg_trgm`` is available and by relative length elsewhere.
+"""
+
+import functools
+import operator
+import time
+from collections.abc import Mapping
+from typing import Any, cast
+
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import Case, Expression, FloatField, Value, When
+from django.db.models.functions import Cast, Length
+
+TRIGRAM_CHECK_INTERVAL = 5 * 60
+
+_trigram_support: dict[str, tuple[float, bool]] = {}
+
+
+def has_trigram_support(using: str = DEFAULT_DB_ALIAS) -> bool:
+    """
+    Returns whether ``pg_trgm`` is installed in the database. The answer is remembered for
+    ``TRIGRAM_CHECK_INTERVAL`` seconds, so installing the extension later is picked up
+    without a restart.
+    """
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return False
+
+    now = time.monotonic()
+    if using in _trigram_support:
+        checked_at, supported = _trigram_support[using]
+        if now - checked_at < TRIGRAM_CHECK_INTERVAL:
+            return supported
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        supported = cursor.fetchone() is not None
+
+    _trigram_support[using] = (now, supported)
+    return supported
+
+
+def relevance(terms: Mapping[str, str], using: str = DEFAULT_DB_ALIAS) -> Expression:
+    """
+    Returns an expression scoring how well the given fields match their search terms.
+    Higher is better. The score of multiple fields is the sum of the individual scores.
+    """
+    scores = [_field_relevance(field, term, using) for field, term in terms.items()]
+    return cast(Expression, functools.reduce(operator.add, scores))
+
+
+def _field_relevance(field: str, term: str, using: str) -> Any:
+    # the tiers are one apart and the similarity within a tier is at most 1
+    tier = Case(
+        When(**{f"{field}__iexact": term}, then=Value(3.0)),
+        When(**{f"{field}__istartswith": term}, then=Value(2.0)),
+        When(**{f"{field}__icontains": term}, then=Value(1.0)),
+        default=Value(0.0),
+        output_field=FloatField(),
+    )
+    if has_trigram_support(using):
+        return tier + TrigramSimilarity(field, term)
+
+    return tier + Case(
+        When(
+            **{f"{field}__icontains": term},
+            then=Value(len(term) + 1.0) / (Cast(Length(field), FloatField()) + 1.0),
+        ),
+        default=Value(0.0),
+        output_field=FloatField(),
+    )
@@ -1,7 +1,11 @@
+from collections.abc import Iterable
 from typing import Protocol
 
+import polars as pl
+
 from coda.checks.checklist import CheckResult
 from coda.money import CurrencyExchange, Money
+from coda.money.moneyarray import MINOR, MoneyArray
 
 
 class Application(Protocol):
@@ -16,9 +20,23 @@ class CostLimitCheck:
         self.converter = converter
 
     def __call__(self, app: Application) -> CheckResult:
-        converted_cost = app.cost.convert_to(self.limit.currency, self.converter)
+        return self.check_all([app])[0]
+
+    def check_all(self, apps: Iterable[Application]) -> list[CheckResult]:
+        """
+        Checks many applications at once and returns their results in order.
+        """
+        return self.check_costs(MoneyArray.from_money(app.cost for app in apps))
+
+    def check_costs(self, costs: MoneyArray) -> list[CheckResult]:
+        """
+        Checks many costs at once and returns their results in order.
+        The converter is asked once per currency, so all costs are converted with the same rates.
+        Converted costs are rounded to the minor units of the limit's currency, which the limit
+        is given in exactly.
+        """
+        limit = int(self.limit.amount.scaleb(self.limit.currency.minor_units))
+        converted = costs.convert_to(self.limit.currency, self.converter)
+        within_limit = converted.frame.select(pl.col(MINOR) <= limit).to_series()
 
-        if converted_cost <= self.limit:
-            return CheckResult.SUCCESS
-        else:
-            return CheckResult.FAILURE
+        return [CheckResult.SUCCESS if ok else CheckResult.FAILURE for ok in within_limit]
@@ -3,6 +3,20 @@ from typing import Any
 
 from coda.string import NonEmptyStr
 
+RESOLVER_PREFIXES = ("https://doi.org/", "http://doi.org/", "https://dx.doi.org/", "doi:")
+
+
+def strip_resolver(value: str) -> str:
+    """
+    Returns the bare DOI of a DOI link, e.g. ``10.1000/182`` for ``https://doi.org/10.1000/182``.
+    """
+    value = value.strip()
+    for prefix in RESOLVER_PREFIXES:
+        if value.lower().startswith(prefix):
+            return value[len(prefix) :]
+
+    return value
+
 
 class Doi:
     __match_args__ = ("_doi",)
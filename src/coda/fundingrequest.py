@@ -17,6 +17,16 @@ class Review(enum.Enum):
     Withdrawn = "withdrawn"
 
 
+def is_review_allowed(current: Review, review: Review) -> bool:
+    """
+    Open requests can be reviewed, reviewed requests can only be re-opened.
+    """
+    if review == Review.Open:
+        return current != Review.Open
+
+    return current == Review.Open
+
+
 class ExternalFunding(NamedTuple):
     organization: FundingOrganizationId
     project_id: NonEmptyStr
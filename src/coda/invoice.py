@@ -81,18 +81,16 @@ class Invoice:
     ) -> Self:
         return cls(None, number, date, creditor, positions, status, comment)
 
-    def _get_currency(self) -> Currency:
+    def currency(self) -> Currency:
         if not self.positions:
             return Currency.EUR
         return next(iter(self.positions)).cost.currency
 
     def tax(self) -> Money:
-        return sum(
-            (pos.cost * pos.tax_rate for pos in self.positions), Money(0, self._get_currency())
-        )
+        return Money.sum((pos.cost * pos.tax_rate for pos in self.positions), self.currency())
 
     def net(self) -> Money:
-        return sum((pos.cost for pos in self.positions), Money(0, self._get_currency()))
+        return Money.sum((pos.cost for pos in self.positions), self.currency())
 
     def total(self) -> Money:
         return self.net() + self.tax()
@@ -1,13 +1,23 @@
-from ._currency import Currency, CurrencyDetails
-from .exchange import CachingCurrencyExchange, Rates, RatesLookup
+from ._currency import (
+    Currency,
+    CurrencyDetails,
+    currencies_by_code,
+    currencies_by_numeric,
+    currency_codes,
+)
+from .exchange import CachingCurrencyExchange, Rates, RatesCache, RatesLookup
 from ._money import CurrencyExchange, Money
 
 __all__ = [
     "Currency",
     "CurrencyDetails",
+    "currencies_by_code",
+    "currencies_by_numeric",
+    "currency_codes",
     "Money",
     "CurrencyExchange",
     "CachingCurrencyExchange",
     "Rates",
+    "RatesCache",
     "RatesLookup",
 ]
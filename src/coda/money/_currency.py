@@ -1,189 +1,203 @@
+import functools
+from collections.abc import Mapping
 from enum import Enum
-from typing import NamedTuple, cast
+from types import MappingProxyType
+from typing import NamedTuple
 
 
 class CurrencyDetails(NamedTuple):
     code: str
     name: str
     minor_units: int
+    numeric: int
 
 
 class Currency(Enum):
-    AED = CurrencyDetails(code="AED", name="UAE Dirham", minor_units=2)
-    AFN = CurrencyDetails(code="AFN", name="Afghani", minor_units=2)
-    ALL = CurrencyDetails(code="ALL", name="Lek", minor_units=2)
-    AMD = CurrencyDetails(code="AMD", name="Armenian Dram", minor_units=2)
-    ANG = CurrencyDetails(code="ANG", name="Netherlands Antillean Guilder", minor_units=2)
-    AOA = CurrencyDetails(code="AOA", name="Kwanza", minor_units=2)
-    ARS = CurrencyDetails(code="ARS", name="Argentine Peso", minor_units=2)
-    AUD = CurrencyDetails(code="AUD", name="Australian Dollar", minor_units=2)
-    AWG = CurrencyDetails(code="AWG", name="Aruban Florin", minor_units=2)
-    AZN = CurrencyDetails(code="AZN", name="Azerbaijan Manat", minor_units=2)
-    BAM = CurrencyDetails(code="BAM", name="Convertible Mark", minor_units=2)
-    BBD = CurrencyDetails(code="BBD", name="Barbados Dollar", minor_units=2)
-    BDT = CurrencyDetails(code="BDT", name="Taka", minor_units=2)
-    BGN = CurrencyDetails(code="BGN", name="Bulgarian Lev", minor_units=2)
-    BHD = CurrencyDetails(code="BHD", name="Bahraini Dinar", minor_units=3)
-    BIF = CurrencyDetails(code="BIF", name="Burundi Franc", minor_units=0)
-    BMD = CurrencyDetails(code="BMD", name="Bermudian Dollar", minor_units=2)
-    BND = CurrencyDetails(code="BND", name="Brunei Dollar", minor_units=2)
-    BOB = CurrencyDetails(code="BOB", name="Boliviano", minor_units=2)
-    BOV = CurrencyDetails(code="BOV", name="Mvdol", minor_units=2)
-    BRL = CurrencyDetails(code="BRL", name="Brazilian Real", minor_units=2)
-    BSD = CurrencyDetails(code="BSD", name="Bahamian Dollar", minor_units=2)
-    BTN = CurrencyDetails(code="BTN", name="Ngultrum", minor_units=2)
-    BWP = CurrencyDetails(code="BWP", name="Pula", minor_units=2)
-    BYN = CurrencyDetails(code="BYN", name="Belarusian Ruble", minor_units=2)
-    BZD = CurrencyDetails(code="BZD", name="Belize Dollar", minor_units=2)
-    CAD = CurrencyDetails(code="CAD", name="Canadian Dollar", minor_units=2)
-    CDF = CurrencyDetails(code="CDF", name="Congolese Franc", minor_units=2)
-    CHE = CurrencyDetails(code="CHE", name="WIR Euro", minor_units=2)
-    CHF = CurrencyDetails(code="CHF", name="Swiss Franc", minor_units=2)
-    CHW = CurrencyDetails(code="CHW", name="WIR Franc", minor_units=2)
-    CLF = CurrencyDetails(code="CLF", name="Unidad de Fomento", minor_units=4)
-    CLP = CurrencyDetails(code="CLP", name="Chilean Peso", minor_units=0)
-    CNY = CurrencyDetails(code="CNY", name="Yuan Renminbi", minor_units=2)
-    COP = CurrencyDetails(code="COP", name="Colombian Peso", minor_units=2)
-    COU = CurrencyDetails(code="COU", name="Unidad de Valor Real", minor_units=2)
-    CRC = CurrencyDetails(code="CRC", name="Costa Rican Colon", minor_units=2)
-    CUC = CurrencyDetails(code="CUC", name="Peso Convertible", minor_units=2)
-    CUP = CurrencyDetails(code="CUP", name="Cuban Peso", minor_units=2)
-    CVE = CurrencyDetails(code="CVE", name="Cabo Verde Escudo", minor_units=2)
-    CZK = CurrencyDetails(code="CZK", name="Czech Koruna", minor_units=2)
-    DJF = CurrencyDetails(code="DJF", name="Djibouti Franc", minor_units=0)
-    DKK = CurrencyDetails(code="DKK", name="Danish Krone", minor_units=2)
-    DOP = CurrencyDetails(code="DOP", name="Dominican Peso", minor_units=2)
-    DZD = CurrencyDetails(code="DZD", name="Algerian Dinar", minor_units=2)
-    EGP = CurrencyDetails(code="EGP", name="Egyptian Pound", minor_units=2)
-    ERN = CurrencyDetails(code="ERN", name="Nakfa", minor_units=2)
-    ETB = CurrencyDetails(code="ETB", name="Ethiopian Birr", minor_units=2)
-    EUR = CurrencyDetails(code="EUR", name="Euro", minor_units=2)
-    FJD = CurrencyDetails(code="FJD", name="Fiji Dollar", minor_units=2)
-    FKP = CurrencyDetails(code="FKP", name="Falkland Islands Pound", minor_units=2)
-    GBP = CurrencyDetails(code="GBP", name="Pound Sterling", minor_units=2)
-    GEL = CurrencyDetails(code="GEL", name="Lari", minor_units=2)
-    GHS = CurrencyDetails(code="GHS", name="Ghana Cedi", minor_units=2)
-    GIP = CurrencyDetails(code="GIP", name="Gibraltar Pound", minor_units=2)
-    GMD = CurrencyDetails(code="GMD", name="Dalasi", minor_units=2)
-    GNF = CurrencyDetails(code="GNF", name="Guinean Franc", minor_units=0)
-    GTQ = CurrencyDetails(code="GTQ", name="Quetzal", minor_units=2)
-    GYD = CurrencyDetails(code="GYD", name="Guyana Dollar", minor_units=2)
-    HKD = CurrencyDetails(code="HKD", name="Hong Kong Dollar", minor_units=2)
-    HNL = CurrencyDetails(code="HNL", name="Lempira", minor_units=2)
-    HTG = CurrencyDetails(code="HTG", name="Gourde", minor_units=2)
-    HUF = CurrencyDetails(code="HUF", name="Forint", minor_units=2)
-    IDR = CurrencyDetails(code="IDR", name="Rupiah", minor_units=2)
-    ILS = CurrencyDetails(code="ILS", name="New Israeli Sheqel", minor_units=2)
-    INR = CurrencyDetails(code="INR", name="Indian Rupee", minor_units=2)
-    IQD = CurrencyDetails(code="IQD", name="Iraqi Dinar", minor_units=3)
-    IRR = CurrencyDetails(code="IRR", name="Iranian Rial", minor_units=2)
-    ISK = CurrencyDetails(code="ISK", name="Iceland Krona", minor_units=0)
-    JMD = CurrencyDetails(code="JMD", name="Jamaican Dollar", minor_units=2)
-    JOD = CurrencyDetails(code="JOD", name="Jordanian Dinar", minor_units=3)
-    JPY = CurrencyDetails(code="JPY", name="Yen", minor_units=0)
-    KES = CurrencyDetails(code="KES", name="Kenyan Shilling", minor_units=2)
-    KGS = CurrencyDetails(code="KGS", name="Som", minor_units=2)
-    KHR = CurrencyDetails(code="KHR", name="Riel", minor_units=2)
-    KMF = CurrencyDetails(code="KMF", name="Comorian Franc ", minor_units=0)
-    KPW = CurrencyDetails(code="KPW", name="North Korean Won", minor_units=2)
-    KRW = CurrencyDetails(code="KRW", name="Won", minor_units=0)
-    KWD = CurrencyDetails(code="KWD", name="Kuwaiti Dinar", minor_units=3)
-    KYD = CurrencyDetails(code="KYD", name="Cayman Islands Dollar", minor_units=2)
-    KZT = CurrencyDetails(code="KZT", name="Tenge", minor_units=2)
-    LAK = CurrencyDetails(code="LAK", name="Lao Kip", minor_units=2)
-    LBP = CurrencyDetails(code="LBP", name="Lebanese Pound", minor_units=2)
-    LKR = CurrencyDetails(code="LKR", name="Sri Lanka Rupee", minor_units=2)
-    LRD = CurrencyDetails(code="LRD", name="Liberian Dollar", minor_units=2)
-    LSL = CurrencyDetails(code="LSL", name="Loti", minor_units=2)
-    LYD = CurrencyDetails(code="LYD", name="Libyan Dinar", minor_units=3)
-    MAD = CurrencyDetails(code="MAD", name="Moroccan Dirham", minor_units=2)
-    MDL = CurrencyDetails(code="MDL", name="Moldovan Leu", minor_units=2)
-    MGA = CurrencyDetails(code="MGA", name="Malagasy Ariary", minor_units=2)
-    MKD = CurrencyDetails(code="MKD", name="Denar", minor_units=2)
-    MMK = CurrencyDetails(code="MMK", name="Kyat", minor_units=2)
-    MNT = CurrencyDetails(code="MNT", name="Tugrik", minor_units=2)
-    MOP = CurrencyDetails(code="MOP", name="Pataca", minor_units=2)
-    MRU = CurrencyDetails(code="MRU", name="Ouguiya", minor_units=2)
-    MUR = CurrencyDetails(code="MUR", name="Mauritius Rupee", minor_units=2)
-    MVR = CurrencyDetails(code="MVR", name="Rufiyaa", minor_units=2)
-    MWK = CurrencyDetails(code="MWK", name="Malawi Kwacha", minor_units=2)
-    MXN = CurrencyDetails(code="MXN", name="Mexican Peso", minor_units=2)
-    MXV = CurrencyDetails(code="MXV", name="Mexican Unidad de Inversion (UDI)", minor_units=2)
-    MYR = CurrencyDetails(code="MYR", name="Malaysian Ringgit", minor_units=2)
-    MZN = CurrencyDetails(code="MZN", name="Mozambique Metical", minor_units=2)
-    NAD = CurrencyDetails(code="NAD", name="Namibia Dollar", minor_units=2)
-    NGN = CurrencyDetails(code="NGN", name="Naira", minor_units=2)
-    NIO = CurrencyDetails(code="NIO", name="Cordoba Oro", minor_units=2)
-    NOK = CurrencyDetails(code="NOK", name="Norwegian Krone", minor_units=2)
-    NPR = CurrencyDetails(code="NPR", name="Nepalese Rupee", minor_units=2)
-    NZD = CurrencyDetails(code="NZD", name="New Zealand Dollar", minor_units=2)
-    OMR = CurrencyDetails(code="OMR", name="Rial Omani", minor_units=3)
-    PAB = CurrencyDetails(code="PAB", name="Balboa", minor_units=2)
-    PEN = CurrencyDetails(code="PEN", name="Sol", minor_units=2)
-    PGK = CurrencyDetails(code="PGK", name="Kina", minor_units=2)
-    PHP = CurrencyDetails(code="PHP", name="Philippine Peso", minor_units=2)
-    PKR = CurrencyDetails(code="PKR", name="Pakistan Rupee", minor_units=2)
-    PLN = CurrencyDetails(code="PLN", name="Zloty", minor_units=2)
-    PYG = CurrencyDetails(code="PYG", name="Guarani", minor_units=0)
-    QAR = CurrencyDetails(code="QAR", name="Qatari Rial", minor_units=2)
-    RON = CurrencyDetails(code="RON", name="Romanian Leu", minor_units=2)
-    RSD = CurrencyDetails(code="RSD", name="Serbian Dinar", minor_units=2)
-    RUB = CurrencyDetails(code="RUB", name="Russian Ruble", minor_units=2)
-    RWF = CurrencyDetails(code="RWF", name="Rwanda Franc", minor_units=0)
-    SAR = CurrencyDetails(code="SAR", name="Saudi Riyal", minor_units=2)
-    SBD = CurrencyDetails(code="SBD", name="Solomon Islands Dollar", minor_units=2)
-    SCR = CurrencyDetails(code="SCR", name="Seychelles Rupee", minor_units=2)
-    SDG = CurrencyDetails(code="SDG", name="Sudanese Pound", minor_units=2)
-    SEK = CurrencyDetails(code="SEK", name="Swedish Krona", minor_units=2)
-    SGD = CurrencyDetails(code="SGD", name="Singapore Dollar", minor_units=2)
-    SHP = CurrencyDetails(code="SHP", name="Saint Helena Pound", minor_units=2)
-    SLE = CurrencyDetails(code="SLE", name="Leone", minor_units=2)
-    SLL = CurrencyDetails(code="SLL", name="Leone", minor_units=2)
-    SOS = CurrencyDetails(code="SOS", name="Somali Shilling", minor_units=2)
-    SRD = CurrencyDetails(code="SRD", name="Surinam Dollar", minor_units=2)
-    SSP = CurrencyDetails(code="SSP", name="South Sudanese Pound", minor_units=2)
-    STN = CurrencyDetails(code="STN", name="Dobra", minor_units=2)
-    SVC = CurrencyDetails(code="SVC", name="El Salvador Colon", minor_units=2)
-    SYP = CurrencyDetails(code="SYP", name="Syrian Pound", minor_units=2)
-    SZL = CurrencyDetails(code="SZL", name="Lilangeni", minor_units=2)
-    THB = CurrencyDetails(code="THB", name="Baht", minor_units=2)
-    TJS = CurrencyDetails(code="TJS", name="Somoni", minor_units=2)
-    TMT = CurrencyDetails(code="TMT", name="Turkmenistan New Manat", minor_units=2)
-    TND = CurrencyDetails(code="TND", name="Tunisian Dinar", minor_units=3)
-    TOP = CurrencyDetails(code="TOP", name="Pa’anga", minor_units=2)
-    TRY = CurrencyDetails(code="TRY", name="Turkish Lira", minor_units=2)
-    TTD = CurrencyDetails(code="TTD", name="Trinidad and Tobago Dollar", minor_units=2)
-    TWD = CurrencyDetails(code="TWD", name="New Taiwan Dollar", minor_units=2)
-    TZS = CurrencyDetails(code="TZS", name="Tanzanian Shilling", minor_units=2)
-    UAH = CurrencyDetails(code="UAH", name="Hryvnia", minor_units=2)
-    UGX = CurrencyDetails(code="UGX", name="Uganda Shilling", minor_units=0)
-    USD = CurrencyDetails(code="USD", name="US Dollar", minor_units=2)
-    USN = CurrencyDetails(code="USN", name="US Dollar (Next day)", minor_units=2)
-    UYI = CurrencyDetails(code="UYI", name="Uruguay Peso en Unidades Indexadas (UI)", minor_units=0)
-    UYU = CurrencyDetails(code="UYU", name="Peso Uruguayo", minor_units=2)
-    UYW = CurrencyDetails(code="UYW", name="Unidad Previsional", minor_units=4)
-    UZS = CurrencyDetails(code="UZS", name="Uzbekistan Sum", minor_units=2)
-    VED = CurrencyDetails(code="VED", name="Bolívar Soberano", minor_units=2)
-    VES = CurrencyDetails(code="VES", name="Bolívar Soberano", minor_units=2)
-    VND = CurrencyDetails(code="VND", name="Dong", minor_units=0)
-    VUV = CurrencyDetails(code="VUV", name="Vatu", minor_units=0)
-    WST = CurrencyDetails(code="WST", name="Tala", minor_units=2)
-    XAF = CurrencyDetails(code="XAF", name="CFA Franc BEAC", minor_units=0)
-    XCD = CurrencyDetails(code="XCD", name="East Caribbean Dollar", minor_units=2)
-    XOF = CurrencyDetails(code="XOF", name="CFA Franc BCEAO", minor_units=0)
-    XPF = CurrencyDetails(code="XPF", name="CFP Franc", minor_units=0)
-    YER = CurrencyDetails(code="YER", name="Yemeni Rial", minor_units=2)
-    ZAR = CurrencyDetails(code="ZAR", name="Rand", minor_units=2)
-    ZMW = CurrencyDetails(code="ZMW", name="Zambian Kwacha", minor_units=2)
-    ZWL = CurrencyDetails(code="ZWL", name="Zimbabwe Dollar", minor_units=2)
+    AED = CurrencyDetails(code="AED", name="UAE Dirham", minor_units=2, numeric=784)
+    AFN = CurrencyDetails(code="AFN", name="Afghani", minor_units=2, numeric=971)
+    ALL = CurrencyDetails(code="ALL", name="Lek", minor_units=2, numeric=8)
+    AMD = CurrencyDetails(code="AMD", name="Armenian Dram", minor_units=2, numeric=51)
+    ANG = CurrencyDetails(
+        code="ANG", name="Netherlands Antillean Guilder", minor_units=2, numeric=532
+    )
+    AOA = CurrencyDetails(code="AOA", name="Kwanza", minor_units=2, numeric=973)
+    ARS = CurrencyDetails(code="ARS", name="Argentine Peso", minor_units=2, numeric=32)
+    AUD = CurrencyDetails(code="AUD", name="Australian Dollar", minor_units=2, numeric=36)
+    AWG = CurrencyDetails(code="AWG", name="Aruban Florin", minor_units=2, numeric=533)
+    AZN = CurrencyDetails(code="AZN", name="Azerbaijan Manat", minor_units=2, numeric=944)
+    BAM = CurrencyDetails(code="BAM", name="Convertible Mark", minor_units=2, numeric=977)
+    BBD = CurrencyDetails(code="BBD", name="Barbados Dollar", minor_units=2, numeric=52)
+    BDT = CurrencyDetails(code="BDT", name="Taka", minor_units=2, numeric=50)
+    BGN = CurrencyDetails(code="BGN", name="Bulgarian Lev", minor_units=2, numeric=975)
+    BHD = CurrencyDetails(code="BHD", name="Bahraini Dinar", minor_units=3, numeric=48)
+    BIF = CurrencyDetails(code="BIF", name="Burundi Franc", minor_units=0, numeric=108)
+    BMD = CurrencyDetails(code="BMD", name="Bermudian Dollar", minor_units=2, numeric=60)
+    BND = CurrencyDetails(code="BND", name="Brunei Dollar", minor_units=2, numeric=96)
+    BOB = CurrencyDetails(code="BOB", name="Boliviano", minor_units=2, numeric=68)
+    BOV = CurrencyDetails(code="BOV", name="Mvdol", minor_units=2, numeric=984)
+    BRL = CurrencyDetails(code="BRL", name="Brazilian Real", minor_units=2, numeric=986)
+    BSD = CurrencyDetails(code="BSD", name="Bahamian Dollar", minor_units=2, numeric=44)
+    BTN = CurrencyDetails(code="BTN", name="Ngultrum", minor_units=2, numeric=64)
+    BWP = CurrencyDetails(code="BWP", name="Pula", minor_units=2, numeric=72)
+    BYN = CurrencyDetails(code="BYN", name="Belarusian Ruble", minor_units=2, numeric=933)
+    BZD = CurrencyDetails(code="BZD", name="Belize Dollar", minor_units=2, numeric=84)
+    CAD = CurrencyDetails(code="CAD", name="Canadian Dollar", minor_units=2, numeric=124)
+    CDF = CurrencyDetails(code="CDF", name="Congolese Franc", minor_units=2, numeric=976)
+    CHE = CurrencyDetails(code="CHE", name="WIR Euro", minor_units=2, numeric=947)
+    CHF = CurrencyDetails(code="CHF", name="Swiss Franc", minor_units=2, numeric=756)
+    CHW = CurrencyDetails(code="CHW", name="WIR Franc", minor_units=2, numeric=948)
+    CLF = CurrencyDetails(code="CLF", name="Unidad de Fomento", minor_units=4, numeric=990)
+    CLP = CurrencyDetails(code="CLP", name="Chilean Peso", minor_units=0, numeric=152)
+    CNY = CurrencyDetails(code="CNY", name="Yuan Renminbi", minor_units=2, numeric=156)
+    COP = CurrencyDetails(code="COP", name="Colombian Peso", minor_units=2, numeric=170)
+    COU = CurrencyDetails(code="COU", name="Unidad de Valor Real", minor_units=2, numeric=970)
+    CRC = CurrencyDetails(code="CRC", name="Costa Rican Colon", minor_units=2, numeric=188)
+    CUC = CurrencyDetails(code="CUC", name="Peso Convertible", minor_units=2, numeric=931)
+    CUP = CurrencyDetails(code="CUP", name="Cuban Peso", minor_units=2, numeric=192)
+    CVE = CurrencyDetails(code="CVE", name="Cabo Verde Escudo", minor_units=2, numeric=132)
+    CZK = CurrencyDetails(code="CZK", name="Czech Koruna", minor_units=2, numeric=203)
+    DJF = CurrencyDetails(code="DJF", name="Djibouti Franc", minor_units=0, numeric=262)
+    DKK = CurrencyDetails(code="DKK", name="Danish Krone", minor_units=2, numeric=208)
+    DOP = CurrencyDetails(code="DOP", name="Dominican Peso", minor_units=2, numeric=214)
+    DZD = CurrencyDetails(code="DZD", name="Algerian Dinar", minor_units=2, numeric=12)
+    EGP = CurrencyDetails(code="EGP", name="Egyptian Pound", minor_units=2, numeric=818)
+    ERN = CurrencyDetails(code="ERN", name="Nakfa", minor_units=2, numeric=232)
+    ETB = CurrencyDetails(code="ETB", name="Ethiopian Birr", minor_units=2, numeric=230)
+    EUR = CurrencyDetails(code="EUR", name="Euro", minor_units=2, numeric=978)
+    FJD = CurrencyDetails(code="FJD", name="Fiji Dollar", minor_units=2, numeric=242)
+    FKP = CurrencyDetails(code="FKP", name="Falkland Islands Pound", minor_units=2, numeric=238)
+    GBP = CurrencyDetails(code="GBP", name="Pound Sterling", minor_units=2, numeric=826)
+    GEL = CurrencyDetails(code="GEL", name="Lari", minor_units=2, numeric=981)
+    GHS = CurrencyDetails(code="GHS", name="Ghana Cedi", minor_units=2, numeric=936)
+    GIP = CurrencyDetails(code="GIP", name="Gibraltar Pound", minor_units=2, numeric=292)
+    GMD = CurrencyDetails(code="GMD", name="Dalasi", minor_units=2, numeric=270)
+    GNF = CurrencyDetails(code="GNF", name="Guinean Franc", minor_units=0, numeric=324)
+    GTQ = CurrencyDetails(code="GTQ", name="Quetzal", minor_units=2, numeric=320)
+    GYD = CurrencyDetails(code="GYD", name="Guyana Dollar", minor_units=2, numeric=328)
+    HKD = CurrencyDetails(code="HKD", name="Hong Kong Dollar", minor_units=2, numeric=344)
+    HNL = CurrencyDetails(code="HNL", name="Lempira", minor_units=2, numeric=340)
+    HTG = CurrencyDetails(code="HTG", name="Gourde", minor_units=2, numeric=332)
+    HUF = CurrencyDetails(code="HUF", name="Forint", minor_units=2, numeric=348)
+    IDR = CurrencyDetails(code="IDR", name="Rupiah", minor_units=2, numeric=360)
+    ILS = CurrencyDetails(code="ILS", name="New Israeli Sheqel", minor_units=2, numeric=376)
+    INR = CurrencyDetails(code="INR", name="Indian Rupee", minor_units=2, numeric=356)
+    IQD = CurrencyDetails(code="IQD", name="Iraqi Dinar", minor_units=3, numeric=368)
+    IRR = CurrencyDetails(code="IRR", name="Iranian Rial", minor_units=2, numeric=364)
+    ISK = CurrencyDetails(code="ISK", name="Iceland Krona", minor_units=0, numeric=352)
+    JMD = CurrencyDetails(code="JMD", name="Jamaican Dollar", minor_units=2, numeric=388)
+    JOD = CurrencyDetails(code="JOD", name="Jordanian Dinar", minor_units=3, numeric=400)
+    JPY = CurrencyDetails(code="JPY", name="Yen", minor_units=0, numeric=392)
+    KES = CurrencyDetails(code="KES", name="Kenyan Shilling", minor_units=2, numeric=404)
+    KGS = CurrencyDetails(code="KGS", name="Som", minor_units=2, numeric=417)
+    KHR = CurrencyDetails(code="KHR", name="Riel", minor_units=2, numeric=116)
+    KMF = CurrencyDetails(code="KMF", name="Comorian Franc ", minor_units=0, numeric=174)
+    KPW = CurrencyDetails(code="KPW", name="North Korean Won", minor_units=2, numeric=408)
+    KRW = CurrencyDetails(code="KRW", name="Won", minor_units=0, numeric=410)
+    KWD = CurrencyDetails(code="KWD", name="Kuwaiti Dinar", minor_units=3, numeric=414)
+    KYD = CurrencyDetails(code="KYD", name="Cayman Islands Dollar", minor_units=2, numeric=136)
+    KZT = CurrencyDetails(code="KZT", name="Tenge", minor_units=2, numeric=398)
+    LAK = CurrencyDetails(code="LAK", name="Lao Kip", minor_units=2, numeric=418)
+    LBP = CurrencyDetails(code="LBP", name="Lebanese Pound", minor_units=2, numeric=422)
+    LKR = CurrencyDetails(code="LKR", name="Sri Lanka Rupee", minor_units=2, numeric=144)
+    LRD = CurrencyDetails(code="LRD", name="Liberian Dollar", minor_units=2, numeric=430)
+    LSL = CurrencyDetails(code="LSL", name="Loti", minor_units=2, numeric=426)
+    LYD = CurrencyDetails(code="LYD", name="Libyan Dinar", minor_units=3, numeric=434)
+    MAD = CurrencyDetails(code="MAD", name="Moroccan Dirham", minor_units=2, numeric=504)
+    MDL = CurrencyDetails(code="MDL", name="Moldovan Leu", minor_units=2, numeric=498)
+    MGA = CurrencyDetails(code="MGA", name="Malagasy Ariary", minor_units=2, numeric=969)
+    MKD = CurrencyDetails(code="MKD", name="Denar", minor_units=2, numeric=807)
+    MMK = CurrencyDetails(code="MMK", name="Kyat", minor_units=2, numeric=104)
+    MNT = CurrencyDetails(code="MNT", name="Tugrik", minor_units=2, numeric=496)
+    MOP = CurrencyDetails(code="MOP", name="Pataca", minor_units=2, numeric=446)
+    MRU = CurrencyDetails(code="MRU", name="Ouguiya", minor_units=2, numeric=929)
+    MUR = CurrencyDetails(code="MUR", name="Mauritius Rupee", minor_units=2, numeric=480)
+    MVR = CurrencyDetails(code="MVR", name="Rufiyaa", minor_units=2, numeric=462)
+    MWK = CurrencyDetails(code="MWK", name="Malawi Kwacha", minor_units=2, numeric=454)
+    MXN = CurrencyDetails(code="MXN", name="Mexican Peso", minor_units=2, numeric=484)
+    MXV = CurrencyDetails(
+        code="MXV", name="Mexican Unidad de Inversion (UDI)", minor_units=2, numeric=979
+    )
+    MYR = CurrencyDetails(code="MYR", name="Malaysian Ringgit", minor_units=2, numeric=458)
+    MZN = CurrencyDetails(code="MZN", name="Mozambique Metical", minor_units=2, numeric=943)
+    NAD = CurrencyDetails(code="NAD", name="Namibia Dollar", minor_units=2, numeric=516)
+    NGN = CurrencyDetails(code="NGN", name="Naira", minor_units=2, numeric=566)
+    NIO = CurrencyDetails(code="NIO", name="Cordoba Oro", minor_units=2, numeric=558)
+    NOK = CurrencyDetails(code="NOK", name="Norwegian Krone", minor_units=2, numeric=578)
+    NPR = CurrencyDetails(code="NPR", name="Nepalese Rupee", minor_units=2, numeric=524)
+    NZD = CurrencyDetails(code="NZD", name="New Zealand Dollar", minor_units=2, numeric=554)
+    OMR = CurrencyDetails(code="OMR", name="Rial Omani", minor_units=3, numeric=512)
+    PAB = CurrencyDetails(code="PAB", name="Balboa", minor_units=2, numeric=590)
+    PEN = CurrencyDetails(code="PEN", name="Sol", minor_units=2, numeric=604)
+    PGK = CurrencyDetails(code="PGK", name="Kina", minor_units=2, numeric=598)
+    PHP = CurrencyDetails(code="PHP", name="Philippine Peso", minor_units=2, numeric=608)
+    PKR = CurrencyDetails(code="PKR", name="Pakistan Rupee", minor_units=2, numeric=586)
+    PLN = CurrencyDetails(code="PLN", name="Zloty", minor_units=2, numeric=985)
+    PYG = CurrencyDetails(code="PYG", name="Guarani", minor_units=0, numeric=600)
+    QAR = CurrencyDetails(code="QAR", name="Qatari Rial", minor_units=2, numeric=634)
+    RON = CurrencyDetails(code="RON", name="Romanian Leu", minor_units=2, numeric=946)
+    RSD = CurrencyDetails(code="RSD", name="Serbian Dinar", minor_units=2, numeric=941)
+    RUB = CurrencyDetails(code="RUB", name="Russian Ruble", minor_units=2, numeric=643)
+    RWF = CurrencyDetails(code="RWF", name="Rwanda Franc", minor_units=0, numeric=646)
+    SAR = CurrencyDetails(code="SAR", name="Saudi Riyal", minor_units=2, numeric=682)
+    SBD = CurrencyDetails(code="SBD", name="Solomon Islands Dollar", minor_units=2, numeric=90)
+    SCR = CurrencyDetails(code="SCR", name="Seychelles Rupee", minor_units=2, numeric=690)
+    SDG = CurrencyDetails(code="SDG", name="Sudanese Pound", minor_units=2, numeric=938)
+    SEK = CurrencyDetails(code="SEK", name="Swedish Krona", minor_units=2, numeric=752)
+    SGD = CurrencyDetails(code="SGD", name="Singapore Dollar", minor_units=2, numeric=702)
+    SHP = CurrencyDetails(code="SHP", name="Saint Helena Pound", minor_units=2, numeric=654)
+    SLE = CurrencyDetails(code="SLE", name="Leone", minor_units=2, numeric=925)
+    SLL = CurrencyDetails(code="SLL", name="Leone", minor_units=2, numeric=694)
+    SOS = CurrencyDetails(code="SOS", name="Somali Shilling", minor_units=2, numeric=706)
+    SRD = CurrencyDetails(code="SRD", name="Surinam Dollar", minor_units=2, numeric=968)
+    SSP = CurrencyDetails(code="SSP", name="South Sudanese Pound", minor_units=2, numeric=728)
+    STN = CurrencyDetails(code="STN", name="Dobra", minor_units=2, numeric=930)
+    SVC = CurrencyDetails(code="SVC", name="El Salvador Colon", minor_units=2, numeric=222)
+    SYP = CurrencyDetails(code="SYP", name="Syrian Pound", minor_units=2, numeric=760)
+    SZL = CurrencyDetails(code="SZL", name="Lilangeni", minor_units=2, numeric=748)
+    THB = CurrencyDetails(code="THB", name="Baht", minor_units=2, numeric=764)
+    TJS = CurrencyDetails(code="TJS", name="Somoni", minor_units=2, numeric=972)
+    TMT = CurrencyDetails(code="TMT", name="Turkmenistan New Manat", minor_units=2, numeric=934)
+    TND = CurrencyDetails(code="TND", name="Tunisian Dinar", minor_units=3, numeric=788)
+    TOP = CurrencyDetails(code="TOP", name="Pa’anga", minor_units=2, numeric=776)
+    TRY = CurrencyDetails(code="TRY", name="Turkish Lira", minor_units=2, numeric=949)
+    TTD = CurrencyDetails(code="TTD", name="Trinidad and Tobago Dollar", minor_units=2, numeric=780)
+    TWD = CurrencyDetails(code="TWD", name="New Taiwan Dollar", minor_units=2, numeric=901)
+    TZS = CurrencyDetails(code="TZS", name="Tanzanian Shilling", minor_units=2, numeric=834)
+    UAH = CurrencyDetails(code="UAH", name="Hryvnia", minor_units=2, numeric=980)
+    UGX = CurrencyDetails(code="UGX", name="Uganda Shilling", minor_units=0, numeric=800)
+    USD = CurrencyDetails(code="USD", name="US Dollar", minor_units=2, numeric=840)
+    USN = CurrencyDetails(code="USN", name="US Dollar (Next day)", minor_units=2, numeric=997)
+    UYI = CurrencyDetails(
+        code="UYI", name="Uruguay Peso en Unidades Indexadas (UI)", minor_units=0, numeric=940
+    )
+    UYU = CurrencyDetails(code="UYU", name="Peso Uruguayo", minor_units=2, numeric=858)
+    UYW = CurrencyDetails(code="UYW", name="Unidad Previsional", minor_units=4, numeric=927)
+    UZS = CurrencyDetails(code="UZS", name="Uzbekistan Sum", minor_units=2, numeric=860)
+    VED = CurrencyDetails(code="VED", name="Bolívar Soberano", minor_units=2, numeric=926)
+    VES = CurrencyDetails(code="VES", name="Bolívar Soberano", minor_units=2, numeric=928)
+    VND = CurrencyDetails(code="VND", name="Dong", minor_units=0, numeric=704)
+    VUV = CurrencyDetails(code="VUV", name="Vatu", minor_units=0, numeric=548)
+    WST = CurrencyDetails(code="WST", name="Tala", minor_units=2, numeric=882)
+    XAF = CurrencyDetails(code="XAF", name="CFA Franc BEAC", minor_units=0, numeric=950)
+    XCD = CurrencyDetails(code="XCD", name="East Caribbean Dollar", minor_units=2, numeric=951)
+    XOF = CurrencyDetails(code="XOF", name="CFA Franc BCEAO", minor_units=0, numeric=952)
+    XPF = CurrencyDetails(code="XPF", name="CFP Franc", minor_units=0, numeric=953)
+    YER = CurrencyDetails(code="YER", name="Yemeni Rial", minor_units=2, numeric=886)
+    ZAR = CurrencyDetails(code="ZAR", name="Rand", minor_units=2, numeric=710)
+    ZMW = CurrencyDetails(code="ZMW", name="Zambian Kwacha", minor_units=2, numeric=967)
+    ZWL = CurrencyDetails(code="ZWL", name="Zimbabwe Dollar", minor_units=2, numeric=932)
 
     @staticmethod
     def from_code(code: str) -> "Currency":
-        return cast(Currency, getattr(Currency, code))
+        return currencies_by_code()[code]
 
     @staticmethod
-    def allcodes() -> set[str]:
-        return {c.code for c in Currency}
+    def from_numeric(numeric: int) -> "Currency":
+        return currencies_by_numeric()[numeric]
+
+    @staticmethod
+    def allcodes() -> frozenset[str]:
+        return currency_codes()
 
     @property
     def code(self) -> str:
@@ -196,3 +210,25 @@ class Currency(Enum):
     @property
     def minor_units(self) -> int:
         return self.value.minor_units
+
+    @property
+    def numeric(self) -> int:
+        return self.value.numeric
+
+
+# The lookup tables are built on first use, so importing this module stays cheap.
+
+
+@functools.cache
+def currencies_by_code() -> Mapping[str, Currency]:
+    return MappingProxyType({c.code: c for c in Currency})
+
+
+@functools.cache
+def currencies_by_numeric() -> Mapping[int, Currency]:
+    return MappingProxyType({c.numeric: c for c in Currency})
+
+
+@functools.cache
+def currency_codes() -> frozenset[str]:
+    return frozenset(currencies_by_code())
@@ -1,3 +1,5 @@
+import functools
+from collections.abc import Iterable
 from decimal import Decimal
 from types import NotImplementedType
 from typing import Protocol
@@ -6,15 +8,39 @@ from ._currency import Currency
 
 
 class CurrencyExchange(Protocol):
-    def __call__(self, origin: Currency, target: Currency) -> Decimal:
-        ...
+    def __call__(self, origin: Currency, target: Currency) -> Decimal: ...
+
+
+@functools.cache
+def _quantizer(currency: Currency) -> Decimal:
+    return Decimal("0.1") ** currency.minor_units
 
 
 class Money:
+    __slots__ = ("amount", "currency")
+
     def __init__(self, amount: str | int | Decimal, currency: Currency) -> None:
         self.amount = self._half_round_up(currency, Decimal(amount))
         self.currency = currency
 
+    @classmethod
+    def sum(cls, monies: Iterable["Money"], currency: Currency) -> "Money":
+        """
+        Adds up ``monies`` starting from zero in ``currency``.
+        The result is the same as folding with ``+``, without creating intermediate objects.
+        """
+        total = Decimal(0)
+        for money in monies:
+            if not isinstance(money, Money):
+                raise TypeError("Cannot compare money to non-money")
+
+            if money.currency != currency and not (total == 0 and money.amount == 0):
+                raise TypeError("Cannot compare money in different currencies")
+
+            total += money.amount
+
+        return cls(total, currency)
+
     def convert_to(self, target_currency: Currency, exchange: CurrencyExchange) -> "Money":
         if self.currency == target_currency:
             return self
@@ -25,14 +51,22 @@ class Money:
         return self.amount * exchange(self.currency, target_currency)
 
     def _half_round_up(self, target_currency: Currency, ex: Decimal) -> Decimal:
-        return ex.quantize(
-            Decimal("0.1") ** target_currency.minor_units,
-            rounding="ROUND_HALF_UP",
-        )
+        return ex.quantize(_quantizer(target_currency), rounding="ROUND_HALF_UP")
 
     def __eq__(self, v: object) -> bool | NotImplementedType:
+        # money in different currencies is unequal rather than incomparable, as it is hashable
+        if isinstance(v, Money) and self.currency != v.currency:
+            return self.amount == 0 and v.amount == 0
+
         return self.amount == self._comparable_money(v).amount
 
+    def __hash__(self) -> int:
+        # zero is equal in every currency, so it must hash the same in every currency
+        if self.amount == 0:
+            return hash(self.amount)
+
+        return hash((self.amount, self.currency))
+
     def __lt__(self, v: object) -> bool | NotImplementedType:
         return self.amount < self._comparable_money(v).amount
 
@@ -1,8 +1,9 @@
 from datetime import datetime, timedelta
-from decimal import Decimal
-from typing import Callable, NamedTuple, Protocol, TypeAlias
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Callable, NamedTuple, Protocol, Self, TypeAlias
 
 from coda.money import Currency
+from coda.money.refresh import BackgroundRefresher
 
 Rates: TypeAlias = dict[Currency, Decimal]
 
@@ -11,46 +12,148 @@ class RatesSnapshot(NamedTuple):
     timestamp: float
     rates: Rates
 
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "timestamp": self.timestamp,
+            "rates": {currency.code: str(rate) for currency, rate in self.rates.items()},
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            timestamp=float(data["timestamp"]),
+            rates={Currency.from_code(code): Decimal(rate) for code, rate in data["rates"].items()},
+        )
+
 
 RatesLookup: TypeAlias = dict[Currency, RatesSnapshot]
 
 
+class RatesCache(Protocol):
+    """
+    Storage for the latest rates snapshot of each base currency.
+    A plain ``RatesLookup`` dict is the simplest implementation.
+    Looking up a currency without a snapshot raises ``KeyError``.
+    """
+
+    def __getitem__(self, currency: Currency) -> RatesSnapshot: ...
+
+    def __setitem__(self, currency: Currency, snapshot: RatesSnapshot) -> None: ...
+
+
 class ExchangeProvider(Protocol):
-    def __call__(self, currency: Currency) -> Rates:
-        ...
+    def __call__(self, currency: Currency) -> Rates: ...
 
 
 Calendar: TypeAlias = Callable[[], datetime]
 
 
+CROSS_RATE_PLACES = 10
+
+
+def cross_rate(rates: Rates, base: Currency, origin: Currency, target: Currency) -> Decimal:
+    """
+    Derives the ``origin`` to ``target`` rate from rates quoted against ``base``
+    as ``base→target / base→origin``.
+    The result is rounded half up to ``CROSS_RATE_PLACES`` decimal places.
+    Amounts converted with it are rounded to the target's minor units by ``Money`` as usual.
+    """
+    if origin == target:
+        return Decimal(1)
+
+    to_target = Decimal(1) if target == base else rates[target]
+    to_origin = Decimal(1) if origin == base else rates[origin]
+    return round_rate(to_target / to_origin)
+
+
+def round_rate(rate: Decimal) -> Decimal:
+    """
+    Rounds ``rate`` half up to ``CROSS_RATE_PLACES`` decimal places.
+    Every stored home currency cost is converted with a rate rounded this way.
+    """
+    return rate.quantize(Decimal(1).scaleb(-CROSS_RATE_PLACES), rounding=ROUND_HALF_UP)
+
+
+class RatesUnavailable(KeyError):
+    """
+    Raised when no usable rates are cached and new ones are fetched in the background.
+    """
+
+
 class CachingCurrencyExchange:
+    """
+    Looks up exchange rates and caches one snapshot per base currency for a day.
+
+    With a ``base_currency``, only that currency's snapshot is fetched and cached,
+    and every other pair is derived from it with :func:`cross_rate`.
+
+    With a ``refresher``, expired snapshots up to ``max_stale`` past their expiry are still served
+    while the refresher fetches new rates in the background (stale-while-revalidate).
+    The provider is then never called by the caller: for missing snapshots or snapshots older
+    than that, a refresh is scheduled and :class:`RatesUnavailable` is raised.
+    """
+
     def __init__(
         self,
-        cache: RatesLookup,
+        cache: RatesCache,
         exchange_provider: ExchangeProvider,
         calendar: Calendar = datetime.now,
+        base_currency: Currency | None = None,
+        refresher: BackgroundRefresher | None = None,
+        max_stale: timedelta = timedelta(days=1),
     ) -> None:
         self.cache = cache
         self.exchange_provider = exchange_provider
         self.calendar = calendar
+        self.base_currency = base_currency
+        self.refresher = refresher
+        self.max_stale = max_stale
+
+    def __call__(self, origin: Currency, target: Currency) -> Decimal:
+        return self.rate(origin, target)
 
     def rate(self, from_currency: Currency, to_currency: Currency) -> Decimal:
+        base = self.base_currency
+        if base is None or from_currency == base:
+            return self._lookup(from_currency, lambda rates: rates[to_currency])
+
+        return self._lookup(base, lambda rates: cross_rate(rates, base, from_currency, to_currency))
+
+    def _lookup(self, from_currency: Currency, get_rate: Callable[[Rates], Decimal]) -> Decimal:
         try:
-            return self._rate_from_cache(from_currency).rates[to_currency]
+            cached = self.cache[from_currency]
+            if not self._expired(cached.timestamp):
+                return get_rate(cached.rates)
+
+            if self.refresher and self._servable_stale(cached.timestamp):
+                rate = get_rate(cached.rates)
+                self.refresher.submit(from_currency, lambda: self.refresh(from_currency))
+                return rate
         except KeyError:
-            rates = self.exchange_provider(from_currency)
-            self._store(from_currency, rates)
-            return rates[to_currency]
+            pass
 
-    def _rate_from_cache(self, from_currency: Currency) -> RatesSnapshot:
-        cached = self.cache[from_currency]
-        if self._expired(cached.timestamp):
-            raise KeyError
+        if self.refresher:
+            self.refresher.submit(from_currency, lambda: self.refresh(from_currency))
+            raise RatesUnavailable(from_currency)
 
-        return cached
+        return get_rate(self.refresh(from_currency))
+
+    def refresh(self, from_currency: Currency) -> Rates:
+        """
+        Fetches new rates of ``from_currency`` from the provider and caches them.
+        """
+        rates = self.exchange_provider(from_currency)
+        self._store(from_currency, rates)
+        return rates
 
     def _expired(self, timestamp: float) -> bool:
-        return self.calendar() >= datetime.fromtimestamp(timestamp) + timedelta(days=1)
+        return self.calendar() >= self._expiry(timestamp)
+
+    def _servable_stale(self, timestamp: float) -> bool:
+        return self.calendar() < self._expiry(timestamp) + self.max_stale
+
+    def _expiry(self, timestamp: float) -> datetime:
+        return datetime.fromtimestamp(timestamp) + timedelta(days=1)
 
     def _store(self, from_currency: Currency, rates: Rates) -> None:
         self.cache[from_currency] = RatesSnapshot(
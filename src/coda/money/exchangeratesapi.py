@@ -1,24 +1,228 @@
+import asyncio
+import functools
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 from typing import TypedDict
 
 import httpx
 
-from coda.money import Currency
-
+from coda.money import Currency, currencies_by_code
 
 EXCHANGERATE_API_OPEN = "https://open.er-api.com/v6/latest/{currency}"
 
+DEFAULT_TIMEOUT = httpx.Timeout(5.0, connect=2.0)
+DEFAULT_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=5)
+
 
 class ExchangeRateApiJsonSchema(TypedDict):
     rates: dict[str, float]
 
 
-def exchange_api(currency: Currency) -> dict[Currency, Decimal]:
-    result = httpx.get(EXCHANGERATE_API_OPEN.format(currency=currency.value.code))
-    result.raise_for_status()
+class CircuitOpen(RuntimeError):
+    pass
+
+
+class CircuitBreaker:
+    """
+    Stops calling a failing provider for ``reset_after`` seconds
+    once ``failure_threshold`` calls in a row have failed.
+    After that, a single trial call decides whether the circuit closes again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_after: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_after = reset_after
+        self.clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        with self._lock:
+            if self._opened_at is None:
+                return
+
+            if self.clock() - self._opened_at < self.reset_after:
+                raise CircuitOpen("Exchange rate provider is unavailable")
+
+            # half open: let this call through, the next failure opens the circuit again
+            self._opened_at = None
+            self._failures = self.failure_threshold - 1
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._opened_at = self.clock()
+
+
+class _RetryPolicy:
+    def __init__(self, retries: int, backoff: float, breaker: CircuitBreaker) -> None:
+        self.retries = retries
+        self.backoff = backoff
+        self.breaker = breaker
+
+    def delay(self, attempt: int) -> float:
+        return float(self.backoff * 2**attempt)
+
+    @staticmethod
+    def should_retry(error: Exception) -> bool:
+        if isinstance(error, httpx.HTTPStatusError):
+            status = error.response.status_code
+            return status == 429 or status >= 500
+
+        return isinstance(error, httpx.TransportError)
+
+
+class ExchangeRateApi:
+    """
+    Exchange provider for the open exchangerate-api.com endpoint.
+
+    All requests share one ``httpx.Client``, so connections are kept alive between calls.
+    Every request is bounded by ``timeout``. Connection errors, 5xx and 429 responses are
+    retried ``retries`` times with exponential backoff. Repeated failures open a circuit breaker,
+    so callers fail fast instead of waiting for an unavailable upstream.
+    """
+
+    def __init__(
+        self,
+        client: httpx.Client | None = None,
+        *,
+        url: str = EXCHANGERATE_API_OPEN,
+        timeout: httpx.Timeout = DEFAULT_TIMEOUT,
+        retries: int = 2,
+        backoff: float = 0.5,
+        breaker: CircuitBreaker | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.client = client or httpx.Client(timeout=timeout, limits=DEFAULT_LIMITS)
+        self.url = url
+        self.timeout = timeout
+        self.sleep = sleep
+        self.policy = _RetryPolicy(retries, backoff, breaker or CircuitBreaker())
 
-    exchange_data: ExchangeRateApiJsonSchema = result.json()
-    rates = exchange_data["rates"]
-    rates = {code: rate for code, rate in rates.items() if code in Currency.allcodes()}
+    def __call__(self, currency: Currency) -> dict[Currency, Decimal]:
+        return _parse_rates(self._get_json(currency))
 
-    return {Currency.from_code(code): Decimal(rate) for code, rate in rates.items()}
+    def fetch_many(self, currencies: Iterable[Currency]) -> dict[Currency, dict[Currency, Decimal]]:
+        """
+        Fetches the rates of several base currencies concurrently over the shared client.
+        """
+        currencies = list(currencies)
+        if not currencies:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(len(currencies), 8)) as executor:
+            return dict(zip(currencies, executor.map(self, currencies)))
+
+    def close(self) -> None:
+        self.client.close()
+
+    def _get_json(self, currency: Currency) -> ExchangeRateApiJsonSchema:
+        attempt = 0
+        while True:
+            self.policy.breaker.before_call()
+            try:
+                response = self.client.get(
+                    self.url.format(currency=currency.code), timeout=self.timeout
+                )
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                self.policy.breaker.record_failure()
+                if attempt >= self.policy.retries or not self.policy.should_retry(e):
+                    raise
+
+                self.sleep(self.policy.delay(attempt))
+                attempt += 1
+            else:
+                self.policy.breaker.record_success()
+                result: ExchangeRateApiJsonSchema = response.json()
+                return result
+
+
+class AsyncExchangeRateApi:
+    """
+    Asynchronous variant of :class:`ExchangeRateApi` built on a shared ``httpx.AsyncClient``.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient | None = None,
+        *,
+        url: str = EXCHANGERATE_API_OPEN,
+        timeout: httpx.Timeout = DEFAULT_TIMEOUT,
+        retries: int = 2,
+        backoff: float = 0.5,
+        breaker: CircuitBreaker | None = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self.client = client or httpx.AsyncClient(timeout=timeout, limits=DEFAULT_LIMITS)
+        self.url = url
+        self.timeout = timeout
+        self.sleep = sleep
+        self.policy = _RetryPolicy(retries, backoff, breaker or CircuitBreaker())
+
+    async def __call__(self, currency: Currency) -> dict[Currency, Decimal]:
+        return _parse_rates(await self._get_json(currency))
+
+    async def fetch_many(
+        self, currencies: Iterable[Currency]
+    ) -> dict[Currency, dict[Currency, Decimal]]:
+        currencies = list(currencies)
+        rates = await asyncio.gather(*(self(currency) for currency in currencies))
+        return dict(zip(currencies, rates))
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def _get_json(self, currency: Currency) -> ExchangeRateApiJsonSchema:
+        attempt = 0
+        while True:
+            self.policy.breaker.before_call()
+            try:
+                response = await self.client.get(
+                    self.url.format(currency=currency.code), timeout=self.timeout
+                )
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                self.policy.breaker.record_failure()
+                if attempt >= self.policy.retries or not self.policy.should_retry(e):
+                    raise
+
+                await self.sleep(self.policy.delay(attempt))
+                attempt += 1
+            else:
+                self.policy.breaker.record_success()
+                result: ExchangeRateApiJsonSchema = response.json()
+                return result
+
+
+def _parse_rates(exchange_data: ExchangeRateApiJsonSchema) -> dict[Currency, Decimal]:
+    currencies = currencies_by_code()
+    return {
+        currencies[code]: Decimal(rate)
+        for code, rate in exchange_data["rates"].items()
+        if code in currencies
+    }
+
+
+@functools.cache
+def _default_api() -> ExchangeRateApi:
+    return ExchangeRateApi()
+
+
+def exchange_api(currency: Currency) -> dict[Currency, Decimal]:
+    return _default_api()(currency)
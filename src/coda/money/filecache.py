@@ -0,0 +1,36 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from coda.money import Currency
+from coda.money.exchange import RatesSnapshot
+
+
+class FileRatesCache:
+    """
+    Stores one JSON file per base currency in ``directory``.
+    Files are replaced atomically, so processes sharing the directory never read partial snapshots.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    def __getitem__(self, currency: Currency) -> RatesSnapshot:
+        try:
+            data = json.loads(self._path(currency).read_text())
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            raise KeyError(currency) from e
+
+        return RatesSnapshot.from_json(data)
+
+    def __setitem__(self, currency: Currency, snapshot: RatesSnapshot) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(snapshot.to_json(), f)
+
+        os.replace(tmp, self._path(currency))
+
+    def _path(self, currency: Currency) -> Path:
+        return self.directory / f"{currency.code}.json"
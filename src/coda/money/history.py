@@ -0,0 +1,73 @@
+import bisect
+import datetime
+from collections import defaultdict
+from collections.abc import Iterable
+from decimal import Decimal
+from typing import NamedTuple
+
+from ._currency import Currency
+from ._money import CurrencyExchange
+
+
+class HistoricalRate(NamedTuple):
+    date: datetime.date
+    base: Currency
+    quote: Currency
+    rate: Decimal
+
+
+class RatesHistory:
+    """
+    In-memory index of historical exchange rates.
+    A rate is valid from its date until the date of the next rate for the same currency pair,
+    so looking up a date without its own rate (e.g. a weekend) returns the last known rate.
+    """
+
+    def __init__(self, rates: Iterable[HistoricalRate]) -> None:
+        pairs: dict[tuple[Currency, Currency], list[tuple[datetime.date, Decimal]]] = defaultdict(
+            list
+        )
+        for rate in rates:
+            pairs[(rate.base, rate.quote)].append((rate.date, rate.rate))
+
+        self._dates: dict[tuple[Currency, Currency], list[datetime.date]] = {}
+        self._rates: dict[tuple[Currency, Currency], list[Decimal]] = {}
+        for pair, values in pairs.items():
+            values.sort(key=lambda value: value[0])
+            self._dates[pair] = [date for date, _ in values]
+            self._rates[pair] = [rate for _, rate in values]
+
+    def rate(self, base: Currency, quote: Currency, date: datetime.date) -> Decimal:
+        """
+        Returns the rate converting ``base`` to ``quote`` valid at ``date``.
+        If only the inverse pair is known, its reciprocal is used.
+        Raises ``KeyError`` if no rate is known at or before ``date``.
+        """
+        if base == quote:
+            return Decimal(1)
+
+        try:
+            return self._lookup((base, quote), date)
+        except KeyError:
+            return 1 / self._lookup((quote, base), date)
+
+    def exchange_at(self, date: datetime.date) -> CurrencyExchange:
+        """
+        Returns an exchange usable with ``Money.convert_to`` converting with the rates of ``date``.
+        """
+
+        def exchange(origin: Currency, target: Currency) -> Decimal:
+            return self.rate(origin, target, date)
+
+        return exchange
+
+    def _lookup(self, pair: tuple[Currency, Currency], date: datetime.date) -> Decimal:
+        dates = self._dates.get(pair)
+        if not dates:
+            raise KeyError(pair)
+
+        index = bisect.bisect_right(dates, date) - 1
+        if index < 0:
+            raise KeyError((*pair, date))
+
+        return self._rates[pair][index]
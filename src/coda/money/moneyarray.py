@@ -0,0 +1,177 @@
+"""
+Columnar money for aggregating many amounts at once.
+
+A :class:`MoneyArray` stores amounts as integer minor units (e.g. cents) next to their
+currency codes in a polars frame, so sums and conversions run vectorized instead of
+creating one :class:`Money` per amount.
+"""
+
+import functools
+from collections.abc import Iterable, Iterator, Sequence
+from decimal import Decimal
+from typing import Any, Self
+
+import polars as pl
+
+from ._currency import Currency, currency_codes
+from ._money import CurrencyExchange, Money
+from .exchange import CROSS_RATE_PLACES, round_rate
+
+MINOR = "minor"
+CURRENCY = "currency"
+
+_SCHEMA = {MINOR: pl.Int64, CURRENCY: pl.String}
+
+# scale used for amount columns that are not decimals yet, e.g. strings or floats
+_INPUT_SCALE = 8
+
+
+class MoneyArray:
+    """
+    Sequence of money amounts, possibly in different currencies.
+    Converting from and to :class:`Money` is exact and rounds like :class:`Money` does.
+    """
+
+    __slots__ = ("frame",)
+
+    def __init__(self, frame: pl.DataFrame) -> None:
+        self.frame = frame.select(pl.col(MINOR).cast(pl.Int64), pl.col(CURRENCY).cast(pl.String))
+
+    @classmethod
+    def from_money(cls, monies: Iterable[Money]) -> Self:
+        minor, currencies = [], []
+        for money in monies:
+            minor.append(int(money.amount.scaleb(money.currency.minor_units)))
+            currencies.append(money.currency.code)
+
+        return cls(pl.DataFrame({MINOR: minor, CURRENCY: currencies}, schema=_SCHEMA))
+
+    @classmethod
+    def from_columns(
+        cls, amounts: pl.Series | Sequence[Any], currencies: pl.Series | Sequence[str]
+    ) -> Self:
+        """
+        Creates an array from major unit amounts and currency codes, e.g. the
+        ``cost_amount`` and ``cost_currency`` columns of a query.
+        Amounts with more decimal places than their currency are rounded half up.
+        Anything polars can turn into a series is accepted, including numpy arrays.
+        """
+        amounts = pl.Series(MINOR, amounts)
+        if not isinstance(amounts.dtype, pl.Decimal):
+            amounts = amounts.cast(pl.Decimal(38, _INPUT_SCALE))
+
+        scale = amounts.dtype.scale  # type: ignore[attr-defined]
+        frame = pl.DataFrame([amounts.to_physical(), pl.Series(CURRENCY, currencies, pl.String)])
+        _check_codes(frame[CURRENCY])
+
+        rescaled = frame.join(_rescale_factors(scale), on=CURRENCY, how="left").select(
+            _half_round_up(pl.col(MINOR) * pl.col("multiplier"), pl.col("divisor")),
+            pl.col(CURRENCY),
+        )
+        return cls(rescaled)
+
+    @classmethod
+    def from_frame(cls, frame: pl.DataFrame, amount: str, currency: str) -> Self:
+        return cls.from_columns(frame[amount], frame[currency])
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def __iter__(self) -> Iterator[Money]:
+        for minor, code in self.frame.iter_rows():
+            yield _as_money(minor, Currency.from_code(code))
+
+    def to_money(self) -> list[Money]:
+        return list(self)
+
+    def currencies(self) -> set[Currency]:
+        return {Currency.from_code(code) for code in self.frame[CURRENCY].unique()}
+
+    def sum(self, currency: Currency) -> Money:
+        """
+        Adds up all amounts like :meth:`Money.sum`.
+        Amounts in other currencies than ``currency`` are only allowed if they are zero.
+        """
+        mismatched = self.frame.filter((pl.col(CURRENCY) != currency.code) & (pl.col(MINOR) != 0))
+        if not mismatched.is_empty():
+            raise TypeError("Cannot compare money in different currencies")
+
+        return _as_money(int(self.frame[MINOR].sum()), currency)
+
+    def sum_by_currency(self) -> dict[Currency, Money]:
+        totals = self.frame.group_by(CURRENCY).agg(pl.col(MINOR).sum())
+        return {
+            Currency.from_code(code): _as_money(total, Currency.from_code(code))
+            for code, total in totals.iter_rows()
+        }
+
+    def convert_to(self, target_currency: Currency, exchange: CurrencyExchange) -> "MoneyArray":
+        """
+        Converts all amounts to ``target_currency``, asking ``exchange`` once per currency.
+        Rates are rounded to ``CROSS_RATE_PLACES`` decimal places, for such rates the result
+        equals converting every amount with :meth:`Money.convert_to`.
+        """
+        factors = pl.DataFrame(
+            [
+                _conversion_factors(Currency.from_code(code), target_currency, exchange)
+                for code in self.frame[CURRENCY].unique()
+            ],
+            schema={
+                CURRENCY: pl.String,
+                "multiplier": pl.Int128,
+                "divisor": pl.Int128,
+            },
+            orient="row",
+        )
+        converted = self.frame.join(factors, on=CURRENCY, how="left").select(
+            _half_round_up(pl.col(MINOR).cast(pl.Int128) * pl.col("multiplier"), pl.col("divisor")),
+            pl.lit(target_currency.code).alias(CURRENCY),
+        )
+        return MoneyArray(converted)
+
+    def __repr__(self) -> str:
+        return f"MoneyArray({len(self)} amounts)"
+
+
+def _as_money(minor: int, currency: Currency) -> Money:
+    return Money(Decimal(minor).scaleb(-currency.minor_units), currency)
+
+
+def _half_round_up(value: pl.Expr, divisor: pl.Expr) -> pl.Expr:
+    """
+    Integer division rounding ties away from zero, like ``ROUND_HALF_UP`` on decimals.
+    """
+    return (value.sign() * ((value.abs() + divisor // 2) // divisor)).alias(MINOR)
+
+
+def _factors(shift: int) -> tuple[int, int]:
+    # multiplier and divisor for moving the decimal point by ``shift`` places to the right
+    return (10**shift, 1) if shift >= 0 else (1, 10**-shift)
+
+
+@functools.cache
+def _rescale_factors(scale: int) -> pl.DataFrame:
+    rows = [(c.code, *_factors(c.minor_units - scale)) for c in Currency]
+    return pl.DataFrame(
+        rows,
+        schema={CURRENCY: pl.String, "multiplier": pl.Int128, "divisor": pl.Int128},
+        orient="row",
+    )
+
+
+def _conversion_factors(
+    origin: Currency, target: Currency, exchange: CurrencyExchange
+) -> tuple[str, int, int]:
+    if origin == target:
+        return origin.code, 1, 1
+
+    rate = round_rate(exchange(origin, target))
+    scaled_rate = int(rate.scaleb(CROSS_RATE_PLACES))
+    multiplier, divisor = _factors(target.minor_units - origin.minor_units - CROSS_RATE_PLACES)
+    return origin.code, scaled_rate * multiplier, divisor
+
+
+def _check_codes(codes: pl.Series) -> None:
+    unknown = set(codes.unique()) - currency_codes()
+    if unknown:
+        raise ValueError(f"Unknown currency codes: {', '.join(sorted(map(str, unknown)))}")
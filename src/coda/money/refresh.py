@@ -0,0 +1,84 @@
+import enum
+import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait
+
+from ._currency import Currency
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshStatus(enum.Enum):
+    Running = "running"
+    Succeeded = "succeeded"
+    Failed = "failed"
+
+
+RefreshHook = Callable[[Currency, RefreshStatus, BaseException | None], None]
+
+
+class BackgroundRefresher:
+    """
+    Runs rate refreshes outside of the calling thread, at most one per currency at a time.
+    Every status change is reported to the ``on_status`` hook and kept for :meth:`status`.
+    """
+
+    def __init__(
+        self, executor: Executor | None = None, on_status: RefreshHook | None = None
+    ) -> None:
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="rates-refresh"
+        )
+        self.on_status = on_status
+        self._lock = threading.RLock()
+        self._running: dict[Currency, Future[None]] = {}
+        self._status: dict[Currency, RefreshStatus] = {}
+
+    def submit(self, currency: Currency, refresh: Callable[[], object]) -> Future[None]:
+        """
+        Schedules ``refresh`` unless a refresh of ``currency`` is already running,
+        in which case the running refresh is returned.
+        """
+        with self._lock:
+            if currency in self._running:
+                return self._running[currency]
+
+            self._report(currency, RefreshStatus.Running)
+            future = self.executor.submit(self._run, currency, refresh)
+            self._running[currency] = future
+
+        return future
+
+    def status(self, currency: Currency) -> RefreshStatus | None:
+        return self._status.get(currency)
+
+    def wait(self, timeout: float | None = None) -> None:
+        """
+        Blocks until all currently running refreshes are finished, e.g. before shutting down.
+        """
+        with self._lock:
+            running = list(self._running.values())
+
+        wait(running, timeout=timeout)
+
+    def _run(self, currency: Currency, refresh: Callable[[], object]) -> None:
+        error = None
+        try:
+            refresh()
+        except Exception as e:
+            logger.warning("Refreshing %s exchange rates failed", currency.code, exc_info=e)
+            error = e
+
+        with self._lock:
+            self._running.pop(currency, None)
+            self._report(
+                currency, RefreshStatus.Failed if error else RefreshStatus.Succeeded, error
+            )
+
+    def _report(
+        self, currency: Currency, status: RefreshStatus, error: BaseException | None = None
+    ) -> None:
+        self._status[currency] = status
+        if self.on_status:
+            self.on_status(currency, status, error)
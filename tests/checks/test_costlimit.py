@@ -62,3 +62,49 @@ def test__cost_below_limit_in_different_currency__returns_success() -> None:
     result = sut(app)
 
     assert result == CheckResult.SUCCESS
+
+
+def test__cost_limit_check__check_all__returns_same_results_as_checking_each_application() -> None:
+    apps = [
+        ApplicationTestDouble(UNDER_LIMIT),
+        ApplicationTestDouble(OVER_LIMIT),
+        ApplicationTestDouble(LIMIT),
+    ]
+    sut = make_sut(LIMIT)
+
+    results = sut.check_all(apps)
+
+    assert results == [sut(app) for app in apps]
+    assert results == [CheckResult.SUCCESS, CheckResult.FAILURE, CheckResult.SUCCESS]
+
+
+def test__cost_limit_check__at_minor_unit_boundary__single_and_batch_results_agree() -> None:
+    def exchange(origin: Currency, target: Currency) -> Decimal:
+        return Decimal("0.49999999996")
+
+    apps = [
+        ApplicationTestDouble(Money("2000.00", Currency.USD)),
+        ApplicationTestDouble(Money("2000.01", Currency.USD)),
+    ]
+    sut = CostLimitCheck(LIMIT, converter=exchange)
+
+    results = sut.check_all(apps)
+
+    assert results == [sut(app) for app in apps]
+    assert results == [CheckResult.SUCCESS, CheckResult.FAILURE]
+
+
+def test__cost_limit_check__check_all__asks_converter_once_per_currency() -> None:
+    asked = []
+
+    def exchange(origin: Currency, target: Currency) -> Decimal:
+        asked.append(origin)
+        return Decimal(2)
+
+    apps = [ApplicationTestDouble(Money(LIMIT.amount / 2, Currency.USD)) for _ in range(10)]
+    sut = CostLimitCheck(LIMIT, converter=exchange)
+
+    results = sut.check_all([*apps, ApplicationTestDouble(OVER_LIMIT)])
+
+    assert asked == [Currency.USD]
+    assert results == [CheckResult.SUCCESS] * 10 + [CheckResult.FAILURE]
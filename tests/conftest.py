@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
@@ -5,11 +6,51 @@ from django.core.management import call_command
 from django.test import Client
 from pytest_django import DjangoDbBlocker
 
+from coda.apps.exchangerates import services as exchangerates_services
 from coda.apps.users.models import User
+from coda.money import Currency
 
 BASE_DIR = Path(__file__).parent.parent
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption("--run-benchmarks", action="store_true", help="run tests marked as benchmark")
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    if config.getoption("--run-benchmarks"):
+        return
+
+    skip = pytest.mark.skip(reason="benchmarks only run with --run-benchmarks")
+    for item in items:
+        if item.get_closest_marker("benchmark"):
+            item.add_marker(skip)
+
+
+class RecordingRefresher:
+    """
+    Records the refreshes submitted in the background instead of running them.
+    """
+
+    def __init__(self) -> None:
+        self.refreshes: list[Callable[[], object]] = []
+
+    def submit(self, currency: Currency, refresh: Callable[[], object]) -> None:
+        self.refreshes.append(refresh)
+
+    def run_all(self) -> None:
+        for refresh in self.refreshes:
+            refresh()
+
+
+@pytest.fixture(autouse=True)
+def recording_refresher(monkeypatch: pytest.MonkeyPatch) -> RecordingRefresher:
+    # tests must never fetch exchange rates in a worker thread
+    refresher = RecordingRefresher()
+    monkeypatch.setattr(exchangerates_services, "background_refresher", lambda: refresher)
+    return refresher
+
+
 @pytest.fixture
 def logged_in(client: Client) -> None:
     client.force_login(User.objects.create_user("testuser"))
@@ -0,0 +1,180 @@
+import datetime
+import json
+from decimal import Decimal
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.core.management import CommandError, call_command
+from pytest_django import DjangoAssertNumQueries
+
+from coda.apps.exchangerates.history import import_rates, load_history, parse_csv, parse_json
+from coda.apps.exchangerates.models import HistoricalRate as HistoricalRateModel
+from coda.money import Currency
+from coda.money.history import HistoricalRate
+
+JAN_1 = datetime.date(2023, 1, 1)
+FEB_1 = datetime.date(2023, 2, 1)
+
+CSV = """date,base,quote,rate
+2023-01-01,EUR,USD,1.1
+2023-02-01,EUR,USD,1.2
+2023-01-01,EUR,GBP,0.88
+"""
+
+
+def test__parse_csv__returns_historical_rates() -> None:
+    rates = list(parse_csv(StringIO(CSV)))
+
+    assert rates == [
+        HistoricalRate(JAN_1, Currency.EUR, Currency.USD, Decimal("1.1")),
+        HistoricalRate(FEB_1, Currency.EUR, Currency.USD, Decimal("1.2")),
+        HistoricalRate(JAN_1, Currency.EUR, Currency.GBP, Decimal("0.88")),
+    ]
+
+
+def test__parse_json__returns_historical_rates() -> None:
+    text = json.dumps([{"date": "2023-01-01", "base": "EUR", "quote": "USD", "rate": 1.1}])
+
+    rates = list(parse_json(text))
+
+    assert rates == [HistoricalRate(JAN_1, Currency.EUR, Currency.USD, Decimal("1.1"))]
+
+
+def test__parse_json__with_missing_field__raises_value_error() -> None:
+    text = json.dumps([{"date": "2023-01-01", "base": "EUR", "quote": "USD"}])
+
+    with pytest.raises(ValueError):
+        list(parse_json(text))
+
+
+def test__parse_csv__with_invalid_rows__reports_all_of_them() -> None:
+    text = CSV + "2023-13-01,EUR,USD,1\n2023-03-01,EUR,XYZ,1\n2023-03-01,EUR,USD,abc\n"
+
+    with pytest.raises(ValueError) as error:
+        list(parse_csv(StringIO(text)))
+
+    assert str(error.value).splitlines() == [
+        "Row 5: Invalid date '2023-13-01'",
+        "Row 6: Unknown currency 'XYZ'",
+        "Row 7: Invalid rate 'abc'",
+    ]
+
+
+@pytest.mark.parametrize("rate", [0, -1.1, "NaN", "Infinity", 10**10])
+def test__parse_json__with_rate_out_of_range__raises_value_error(rate: object) -> None:
+    text = json.dumps([{"date": "2023-01-01", "base": "EUR", "quote": "USD", "rate": rate}])
+
+    with pytest.raises(ValueError, match="Row 1: Invalid rate"):
+        list(parse_json(text))
+
+
+def test__parse_json__without_list__raises_value_error() -> None:
+    with pytest.raises(ValueError):
+        list(parse_json(json.dumps({"date": "2023-01-01"})))
+
+
+@pytest.mark.django_db
+def test__import_rates__stores_rates(django_assert_num_queries: DjangoAssertNumQueries) -> None:
+    with django_assert_num_queries(1):
+        count = import_rates(parse_csv(StringIO(CSV)))
+
+    assert count == 3
+    assert HistoricalRateModel.objects.count() == 3
+
+
+@pytest.mark.django_db
+def test__import_rates__for_existing_date__overwrites_rate() -> None:
+    import_rates([HistoricalRate(JAN_1, Currency.EUR, Currency.USD, Decimal("1.1"))])
+
+    import_rates([HistoricalRate(JAN_1, Currency.EUR, Currency.USD, Decimal("1.15"))])
+
+    assert HistoricalRateModel.objects.get().rate == Decimal("1.15")
+
+
+@pytest.mark.django_db
+def test__import_rates__with_same_pair_and_date_twice__stores_last_rate() -> None:
+    count = import_rates(
+        [
+            HistoricalRate(JAN_1, Currency.EUR, Currency.USD, Decimal("1.1")),
+            HistoricalRate(JAN_1, Currency.EUR, Currency.USD, Decimal("1.15")),
+        ]
+    )
+
+    assert count == 1
+    assert HistoricalRateModel.objects.get().rate == Decimal("1.15")
+
+
+@pytest.mark.django_db
+def test__load_history__converts_as_of_date_with_single_query(
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    import_rates(parse_csv(StringIO(CSV)))
+
+    with django_assert_num_queries(1):
+        history = load_history()
+
+    assert history.rate(Currency.EUR, Currency.USD, datetime.date(2023, 1, 15)) == Decimal("1.1")
+    assert history.rate(Currency.EUR, Currency.USD, datetime.date(2023, 2, 15)) == Decimal("1.2")
+
+
+@pytest.mark.django_db
+def test__load_history__only_loads_requested_currencies_until_date() -> None:
+    import_rates(parse_csv(StringIO(CSV)))
+
+    history = load_history([Currency.EUR, Currency.USD], until=JAN_1)
+
+    assert history.rate(Currency.EUR, Currency.USD, FEB_1) == Decimal("1.1")
+    with pytest.raises(KeyError):
+        history.rate(Currency.EUR, Currency.GBP, JAN_1)
+
+
+@pytest.mark.django_db
+def test__import_exchange_rates_command__imports_csv_file(tmp_path: Path) -> None:
+    path = tmp_path / "rates.csv"
+    path.write_text(CSV)
+    out = StringIO()
+
+    call_command("import_exchange_rates", str(path), stdout=out)
+
+    assert "Imported 3 exchange rates" in out.getvalue()
+    assert HistoricalRateModel.objects.count() == 3
+
+
+@pytest.mark.django_db
+def test__import_exchange_rates_command__with_invalid_file__raises_command_error(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "rates.csv"
+    path.write_text("date,base,quote,rate\nnot-a-date,EUR,USD,1\n")
+
+    with pytest.raises(CommandError):
+        call_command("import_exchange_rates", str(path))
+
+    assert not HistoricalRateModel.objects.exists()
+
+
+@pytest.mark.django_db
+def test__import_exchange_rates_command__with_unknown_currency__raises_command_error(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "rates.csv"
+    path.write_text("date,base,quote,rate\n2023-01-01,EUR,XYZ,1\n")
+
+    with pytest.raises(CommandError):
+        call_command("import_exchange_rates", str(path))
+
+    assert not HistoricalRateModel.objects.exists()
+
+
+@pytest.mark.django_db
+def test__import_exchange_rates_command__with_malformed_rate__raises_command_error(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "rates.csv"
+    path.write_text(CSV + "2023-03-01,EUR,USD,abc\n")
+
+    with pytest.raises(CommandError, match="Row 5: Invalid rate 'abc'"):
+        call_command("import_exchange_rates", str(path))
+
+    assert not HistoricalRateModel.objects.exists()
@@ -0,0 +1,191 @@
+from datetime import datetime
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from coda.apps.exchangerates import services
+from coda.apps.exchangerates.caches import DatabaseRatesCache
+from coda.apps.exchangerates.services import home_amounts, home_converter
+from coda.apps.fundingrequests import repository
+from coda.apps.fundingrequests.models import FundingRequest as FundingRequestModel
+from coda.apps.fundingrequests.models import FundingRequestListEntry
+from coda.apps.fundingrequests.services import fundingrequest_create
+from coda.apps.invoices.models import Position as PositionModel
+from coda.apps.invoices.services import invoice_create, invoices_total_spent
+from coda.apps.management.management.commands import recompute_home_costs
+from coda.apps.preferences.models import GlobalPreferences
+from coda.author import InstitutionId
+from coda.fundingrequest import FundingRequest, FundingRequestId, Payment
+from coda.invoice import CostType, CreditorId, Position
+from coda.money import Currency, Money
+from coda.money.exchange import RatesSnapshot
+from coda.publication import JournalId
+from tests import domainfactory, modelfactory
+from tests.conftest import RecordingRefresher
+
+
+def cache_eur_rates() -> None:
+    DatabaseRatesCache()[Currency.EUR] = RatesSnapshot(
+        timestamp=datetime(2023, 12, 18).timestamp(),
+        rates={Currency.USD: Decimal(2), Currency.JPY: Decimal(100)},
+    )
+
+
+def fundingrequest_costing(money: Money) -> FundingRequestId:
+    funding_request = FundingRequest.new(
+        domainfactory.publication(JournalId(modelfactory.journal().pk)),
+        domainfactory.author(InstitutionId(modelfactory.institution().pk)),
+        Payment(money, domainfactory.payment().method),
+    )
+    return fundingrequest_create(funding_request)
+
+
+def position_costing(money: Money) -> Position[str]:
+    return Position(item="Position", cost=money, cost_type=CostType.Gold_OA)
+
+
+@pytest.mark.django_db
+def test__home_converter__with_money_in_home_currency__returns_amount() -> None:
+    assert home_converter()(Money("12.34", Currency.EUR)) == Decimal("12.34")
+
+
+@pytest.mark.django_db
+def test__home_converter__converts_with_cached_rates() -> None:
+    cache_eur_rates()
+
+    assert home_converter()(Money(10, Currency.USD)) == Decimal(5)
+
+
+@pytest.mark.django_db
+def test__home_converter__without_cached_rates__returns_none() -> None:
+    assert home_converter()(Money(10, Currency.USD)) is None
+
+
+@pytest.mark.django_db
+def test__home_converter__without_cached_rates__refreshes_them_in_background(
+    monkeypatch: pytest.MonkeyPatch, recording_refresher: RecordingRefresher
+) -> None:
+    monkeypatch.setattr(services, "exchange_api", lambda currency: {Currency.USD: Decimal(2)})
+
+    home_converter()(Money(10, Currency.USD))
+    recording_refresher.run_all()
+
+    assert home_converter()(Money(10, Currency.USD)) == Decimal(5)
+
+
+@pytest.mark.django_db
+def test__home_converter__rounds_rates_like_home_amounts() -> None:
+    def exchange(origin: Currency, target: Currency) -> Decimal:
+        return Decimal("0.123456789044")
+
+    amount = Decimal(1_000_000_000)
+
+    converted = home_converter(exchange)(Money(amount, Currency.USD))
+
+    assert converted == home_amounts([amount], ["USD"], exchange)[0] == Decimal("123456789.00")
+
+
+@pytest.mark.django_db
+def test__creating_fundingrequest__stores_home_cost() -> None:
+    cache_eur_rates()
+
+    id = fundingrequest_costing(Money(300, Currency.JPY))
+
+    assert FundingRequestModel.objects.get(pk=id).estimated_cost_home == Decimal(3)
+    assert FundingRequestListEntry.objects.get(pk=id).estimated_cost_home == Decimal(3)
+
+
+@pytest.mark.django_db
+def test__creating_invoice__stores_home_cost_of_positions() -> None:
+    cache_eur_rates()
+    invoice = domainfactory.invoice(
+        creditor=CreditorId(modelfactory.creditor().pk),
+        positions=[
+            position_costing(Money(10, Currency.USD)),
+            position_costing(Money(7, Currency.EUR)),
+        ],
+    )
+
+    invoice_create(invoice)
+
+    home_costs = PositionModel.objects.order_by("id").values_list("cost_amount_home", flat=True)
+    assert list(home_costs) == [Decimal(5), Decimal(7)]
+
+
+@pytest.mark.django_db
+def test__written_data_without_cached_rates__gets_home_cost_once_rates_are_refreshed(
+    monkeypatch: pytest.MonkeyPatch, recording_refresher: RecordingRefresher
+) -> None:
+    monkeypatch.setattr(
+        services,
+        "exchange_api",
+        lambda currency: {Currency.USD: Decimal(2), Currency.JPY: Decimal(100)},
+    )
+    fundingrequest = fundingrequest_costing(Money(300, Currency.JPY))
+    invoice_create(
+        domainfactory.invoice(
+            creditor=CreditorId(modelfactory.creditor().pk),
+            positions=[position_costing(Money(10, Currency.USD))],
+        )
+    )
+    assert FundingRequestModel.objects.get(pk=fundingrequest).estimated_cost_home is None
+    assert PositionModel.objects.get().cost_amount_home is None
+
+    recording_refresher.run_all()
+
+    assert FundingRequestModel.objects.get(pk=fundingrequest).estimated_cost_home == Decimal(3)
+    assert FundingRequestListEntry.objects.get(pk=fundingrequest).estimated_cost_home == Decimal(3)
+    assert PositionModel.objects.get().cost_amount_home == Decimal(5)
+
+
+@pytest.mark.django_db
+def test__total_spent__sums_home_cost_of_all_positions() -> None:
+    cache_eur_rates()
+    creditor = CreditorId(modelfactory.creditor().pk)
+    for money in [Money(10, Currency.USD), Money("2.50", Currency.EUR)]:
+        invoice_create(
+            domainfactory.invoice(creditor=creditor, positions=[position_costing(money)])
+        )
+
+    assert invoices_total_spent() == Money("7.50", Currency.EUR)
+
+
+@pytest.mark.django_db
+def test__search__ordered_by_cost__returns_most_expensive_first() -> None:
+    cache_eur_rates()
+    cheap = fundingrequest_costing(Money(10, Currency.EUR))
+    expensive = fundingrequest_costing(Money(100, Currency.USD))
+    unknown = fundingrequest_costing(Money(1, Currency.GBP))
+
+    results = repository.search_list_entries(order_by_cost=True)
+
+    assert [entry.pk for entry in results] == [expensive, cheap, unknown]
+
+
+@pytest.mark.django_db
+def test__recompute_home_costs_command__converts_costs_into_current_home_currency(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fundingrequest = fundingrequest_costing(Money(10, Currency.EUR))
+    invoice_create(
+        domainfactory.invoice(
+            creditor=CreditorId(modelfactory.creditor().pk),
+            positions=[position_costing(Money(4, Currency.EUR))],
+        )
+    )
+    GlobalPreferences.set_home_currency(Currency.USD)
+
+    def exchange(origin: Currency, target: Currency) -> Decimal:
+        return Decimal(2)
+
+    monkeypatch.setattr(recompute_home_costs, "currency_exchange", lambda wait_for_rates: exchange)
+    out = StringIO()
+
+    call_command("recompute_home_costs", stdout=out)
+
+    assert FundingRequestModel.objects.get(pk=fundingrequest).estimated_cost_home == Decimal(20)
+    assert FundingRequestListEntry.objects.get(pk=fundingrequest).estimated_cost_home == Decimal(20)
+    assert PositionModel.objects.get().cost_amount_home == Decimal(8)
+    assert "1 funding requests and 1 invoice positions" in out.getvalue()
@@ -0,0 +1,136 @@
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+
+from coda.apps.exchangerates import services
+from coda.apps.exchangerates.caches import DatabaseRatesCache, DjangoCacheRatesCache, rates_cache
+from coda.apps.exchangerates.services import currency_exchange
+from coda.money import Currency, RatesCache
+from coda.money.exchange import CachingCurrencyExchange, Rates, RatesSnapshot
+from coda.money.filecache import FileRatesCache
+
+NOW = datetime(year=2023, month=12, day=18)
+
+SNAPSHOT = RatesSnapshot(
+    timestamp=NOW.timestamp(),
+    rates={Currency.USD: Decimal("1.0923"), Currency.GBP: Decimal("0.8571")},
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache() -> Iterator[None]:
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def file_cache(tmp_path: Path) -> RatesCache:
+    return FileRatesCache(tmp_path / "rates")
+
+
+def django_cache(tmp_path: Path) -> RatesCache:
+    return DjangoCacheRatesCache()
+
+
+def database_cache(tmp_path: Path) -> RatesCache:
+    return DatabaseRatesCache()
+
+
+CacheFactory = Callable[[Path], RatesCache]
+all_caches = pytest.mark.parametrize("make_cache", [file_cache, django_cache, database_cache])
+
+
+@pytest.mark.django_db
+@all_caches
+def test__rates_cache__without_snapshot__raises_key_error(
+    make_cache: CacheFactory, tmp_path: Path
+) -> None:
+    sut = make_cache(tmp_path)
+
+    with pytest.raises(KeyError):
+        sut[Currency.EUR]
+
+
+@pytest.mark.django_db
+@all_caches
+def test__rates_cache__returns_stored_snapshot(make_cache: CacheFactory, tmp_path: Path) -> None:
+    sut = make_cache(tmp_path)
+
+    sut[Currency.EUR] = SNAPSHOT
+
+    assert sut[Currency.EUR] == SNAPSHOT
+
+
+@pytest.mark.django_db
+@all_caches
+def test__rates_cache__storing_snapshot_again__replaces_it(
+    make_cache: CacheFactory, tmp_path: Path
+) -> None:
+    sut = make_cache(tmp_path)
+    newer = RatesSnapshot(timestamp=SNAPSHOT.timestamp + 1, rates={Currency.USD: Decimal(2)})
+
+    sut[Currency.EUR] = SNAPSHOT
+    sut[Currency.EUR] = newer
+
+    assert sut[Currency.EUR] == newer
+
+
+@pytest.mark.django_db
+@all_caches
+def test__rates_cache__is_shared_between_instances(
+    make_cache: CacheFactory, tmp_path: Path
+) -> None:
+    make_cache(tmp_path)[Currency.EUR] = SNAPSHOT
+
+    assert make_cache(tmp_path)[Currency.EUR] == SNAPSHOT
+
+
+@pytest.mark.django_db
+@all_caches
+def test__caching_currency_exchange__with_shared_cache__fetches_rates_only_once(
+    make_cache: CacheFactory, tmp_path: Path
+) -> None:
+    calls = []
+
+    def provider(currency: Currency) -> Rates:
+        calls.append(currency)
+        return SNAPSHOT.rates
+
+    first_worker = CachingCurrencyExchange(make_cache(tmp_path), provider, lambda: NOW)
+    second_worker = CachingCurrencyExchange(make_cache(tmp_path), provider, lambda: NOW)
+
+    first_worker.rate(Currency.EUR, Currency.USD)
+    rate = second_worker.rate(Currency.EUR, Currency.USD)
+
+    assert rate == SNAPSHOT.rates[Currency.USD]
+    assert calls == [Currency.EUR]
+
+
+@pytest.mark.parametrize(
+    "setting, expected",
+    [("database", DatabaseRatesCache), ("cache", DjangoCacheRatesCache), ("file", FileRatesCache)],
+)
+def test__rates_cache__returns_configured_cache(setting: str, expected: type) -> None:
+    with override_settings(EXCHANGE_RATES_CACHE=setting):
+        assert isinstance(rates_cache(), expected)
+
+
+@pytest.mark.django_db
+def test__currency_exchange__refreshes_stale_rates_in_background() -> None:
+    exchange = currency_exchange()
+
+    assert isinstance(exchange, CachingCurrencyExchange)
+    assert exchange.refresher is services.background_refresher()
+
+
+@pytest.mark.django_db
+def test__currency_exchange__waiting_for_rates__fetches_them_right_away() -> None:
+    exchange = currency_exchange(wait_for_rates=True)
+
+    assert isinstance(exchange, CachingCurrencyExchange)
+    assert exchange.refresher is None
@@ -1,9 +1,10 @@
 import pytest
 from django.test import Client
 from django.urls import reverse
+from pytest_django import DjangoAssertNumQueries
 from pytest_django.asserts import assertRedirects
 
-from coda.apps.fundingrequests import repository
+from coda.apps.fundingrequests import repository, services
 from coda.fundingrequest import FundingRequestId, Review
 from tests import modelfactory
 
@@ -64,6 +65,43 @@ def test__approving_or_requesting_non_existent_request__raises_404(
     assert response.status_code == 404
 
 
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+@pytest.mark.parametrize("view_name", ["approve", "reject"])
+def test__approving_or_requesting_request_with_invalid_id__returns_bad_request(
+    client: Client, view_name: str
+) -> None:
+    response = client.post(reverse(f"fundingrequests:{view_name}"), {"fundingrequest": "1 or 1"})
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__rejecting_approved_request__keeps_it_approved(client: Client) -> None:
+    request = modelfactory.fundingrequest()
+    id = FundingRequestId(request.pk)
+    services.fundingrequest_perform_review(id, Review.Approved)
+
+    response = client.post(reverse("fundingrequests:reject"), {"fundingrequest": request.pk})
+
+    assertRedirects(response, reverse("fundingrequests:detail", kwargs={"pk": request.pk}))
+    assert_approved(id)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__bulk_review_view__with_invalid_id__returns_bad_request(client: Client) -> None:
+    request = modelfactory.fundingrequest()
+
+    response = client.post(
+        reverse("fundingrequests:bulk_review"),
+        {"review": Review.Approved.value, "fundingrequest": [request.pk, "abc"]},
+    )
+
+    assert response.status_code == 400
+    assert_open(FundingRequestId(request.pk))
+
+
 def assert_approved(id: FundingRequestId) -> None:
     assert repository.get_by_id(id).review() == Review.Approved
 
@@ -74,3 +112,97 @@ def assert_rejected(id: FundingRequestId) -> None:
 
 def assert_open(id: FundingRequestId) -> None:
     assert repository.get_by_id(id).review() == Review.Open
+
+
+@pytest.mark.django_db
+def test__bulk_review__updates_all_requests_with_single_update(
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    requests = [modelfactory.fundingrequest() for _ in range(3)]
+    ids = [FundingRequestId(r.pk) for r in requests]
+
+    # savepoint pair, read current states, update requests, update list entries
+    with django_assert_num_queries(5):
+        result = services.fundingrequests_perform_review(ids, Review.Approved)
+
+    assert result.reviewed == ids
+    assert result.skipped == []
+    for id in ids:
+        assert_approved(id)
+
+
+@pytest.mark.django_db
+def test__bulk_review__skips_requests_with_invalid_transition() -> None:
+    open_request = modelfactory.fundingrequest()
+    rejected_request = modelfactory.fundingrequest(review=Review.Rejected)
+    ids = [FundingRequestId(open_request.pk), FundingRequestId(rejected_request.pk)]
+
+    result = services.fundingrequests_perform_review(ids, Review.Approved)
+
+    assert result.reviewed == [open_request.pk]
+    assert result.skipped == [rejected_request.pk]
+    assert_approved(FundingRequestId(open_request.pk))
+    assert_rejected(FundingRequestId(rejected_request.pk))
+
+
+@pytest.mark.django_db
+def test__bulk_review__reopen__only_reopens_reviewed_requests() -> None:
+    open_request = modelfactory.fundingrequest()
+    approved_request = modelfactory.fundingrequest(review=Review.Approved)
+    ids = [FundingRequestId(open_request.pk), FundingRequestId(approved_request.pk)]
+
+    result = services.fundingrequests_perform_review(ids, Review.Open)
+
+    assert result.reviewed == [approved_request.pk]
+    assert result.skipped == [open_request.pk]
+    assert_open(FundingRequestId(approved_request.pk))
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__bulk_review_view__reviews_selected_requests(client: Client) -> None:
+    selected = [modelfactory.fundingrequest() for _ in range(2)]
+    not_selected = modelfactory.fundingrequest()
+
+    response = client.post(
+        reverse("fundingrequests:bulk_review"),
+        {"review": "rejected", "fundingrequest": [r.pk for r in selected]},
+    )
+
+    assertRedirects(response, reverse("fundingrequests:list"))
+    for request in selected:
+        assert_rejected(FundingRequestId(request.pk))
+    assert_open(FundingRequestId(not_selected.pk))
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__bulk_review_view__with_search_scope__reviews_all_matching_requests(
+    client: Client,
+) -> None:
+    matching = [modelfactory.fundingrequest(title=f"Matching {i}") for i in range(2)]
+    not_matching = modelfactory.fundingrequest(title="Other")
+
+    query_string = "search_type=title&search_term=Matching"
+    response = client.post(
+        f"{reverse('fundingrequests:bulk_review')}?{query_string}",
+        {"review": "approved", "scope": "search"},
+    )
+
+    assertRedirects(response, f"{reverse('fundingrequests:list')}?{query_string}")
+    for request in matching:
+        assert_approved(FundingRequestId(request.pk))
+    assert_open(FundingRequestId(not_matching.pk))
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__bulk_review_view__with_unknown_review__returns_bad_request(client: Client) -> None:
+    request = modelfactory.fundingrequest()
+
+    response = client.post(
+        reverse("fundingrequests:bulk_review"), {"review": "maybe", "fundingrequest": request.pk}
+    )
+
+    assert response.status_code == 400
+    assert_open(FundingRequestId(request.pk))
@@ -0,0 +1,126 @@
+import csv
+import io
+from typing import Any
+
+import polars as pl
+import pytest
+from django.http import StreamingHttpResponse
+from django.test import Client
+from django.urls import reverse
+from pytest_django import DjangoAssertNumQueries
+
+from coda.apps.fundingrequests.models import FundingRequest as FundingRequestModel
+from coda.apps.fundingrequests.services import label_attach, label_create
+from coda.apps.fundingrequests.views import export
+from coda.color import Color
+from tests import modelfactory
+
+HEADER = [
+    "id",
+    "request_id",
+    "title",
+    "journal",
+    "publisher",
+    "submitter",
+    "status",
+    "estimated_cost",
+    "currency",
+    "labels",
+]
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__export_csv__streams_one_row_per_matching_funding_request(client: Client) -> None:
+    funding_request = modelfactory.fundingrequest(title="Matching")
+    modelfactory.fundingrequest(title="Other")
+    label_attach(funding_request, label_create("B", Color.from_rgb(0, 0, 0)))
+    label_attach(funding_request, label_create("A", Color.from_rgb(0, 0, 0)))
+
+    response = client.get(
+        reverse("fundingrequests:export_csv"), {"search_type": "title", "search_term": "Matching"}
+    )
+
+    assert isinstance(response, StreamingHttpResponse)
+    lines = list(csv.reader(io.StringIO(b"".join(response.streaming_content).decode())))
+    assert lines == [HEADER, expected_row(funding_request, labels="A; B")]
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__export_parquet__contains_matching_funding_requests(client: Client) -> None:
+    funding_request = modelfactory.fundingrequest(title="Matching")
+    modelfactory.fundingrequest(title="Other")
+
+    response = client.get(
+        reverse("fundingrequests:export_parquet"),
+        {"search_type": "title", "search_term": "Matching"},
+    )
+
+    frame = read_parquet(response)
+    assert frame.columns == HEADER
+    assert frame["id"].to_list() == [funding_request.pk]
+    assert frame["request_id"].to_list() == [funding_request.request_id]
+    assert frame["title"].to_list() == ["Matching"]
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__export_parquet__without_results__returns_empty_frame(client: Client) -> None:
+    response = client.get(reverse("fundingrequests:export_parquet"))
+
+    frame = read_parquet(response)
+    assert frame.columns == HEADER
+    assert frame.is_empty()
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__export_parquet__with_chunk_without_any_submitter__exports_all_rows(
+    client: Client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(export, "CHUNK_SIZE", 2)
+    with_submitter = modelfactory.fundingrequest()
+    for _ in range(3):
+        modelfactory.fundingrequest()
+    FundingRequestModel.objects.exclude(pk=with_submitter.pk).update(submitter=None)
+
+    frame = read_parquet(client.get(reverse("fundingrequests:export_parquet")))
+
+    assert frame.height == 4
+    assert frame["submitter"].null_count() == 3
+
+
+@pytest.mark.django_db
+def test__export_rows__queries_labels_once_per_chunk(
+    django_assert_num_queries: DjangoAssertNumQueries, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(export, "CHUNK_SIZE", 2)
+    for _ in range(5):
+        modelfactory.fundingrequest()
+
+    # rows, plus one label query for each of the three chunks
+    with django_assert_num_queries(4):
+        rows = list(export.rows(FundingRequestModel.objects.order_by("id")))
+
+    assert len(rows) == 5
+
+
+def read_parquet(response: Any) -> pl.DataFrame:
+    return pl.read_parquet(io.BytesIO(b"".join(response.streaming_content)))
+
+
+def expected_row(funding_request: FundingRequestModel, labels: str) -> list[str]:
+    journal = funding_request.publication.journal
+    return [
+        str(funding_request.pk),
+        funding_request.request_id,
+        funding_request.publication.title,
+        journal.title,
+        journal.publisher.name,
+        funding_request.submitter.name if funding_request.submitter else "",
+        funding_request.processing_status,
+        str(funding_request.estimated_cost),
+        funding_request.estimated_cost_currency,
+        labels,
+    ]
@@ -1,11 +1,19 @@
 import pytest
 from django.test import Client
 from django.urls import reverse
+from pytest_django import DjangoAssertNumQueries
 from pytest_django.asserts import assertRedirects
 
 from coda.apps.fundingrequests.models import Label
-from coda.apps.fundingrequests.services import label_attach, label_create, label_detach
+from coda.apps.fundingrequests.services import (
+    label_attach,
+    label_create,
+    label_detach,
+    labels_attach,
+    labels_detach,
+)
 from coda.color import Color
+from coda.fundingrequest import FundingRequestId
 from tests import modelfactory
 
 
@@ -71,3 +79,96 @@ def test__fundingrequest_detach_label_view__can_detach_label_from_funding_reques
     kwargs = {"pk": funding_request.pk}
     assertRedirects(response, reverse("fundingrequests:detail", kwargs=kwargs))
     assert funding_request.labels.first() is None
+
+
+@pytest.mark.django_db
+def test__bulk_attach_label__attaches_label_with_single_insert(
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    funding_requests = [modelfactory.fundingrequest() for _ in range(3)]
+    label = label_create("My label", Color.from_rgb(255, 0, 0))
+
+    # insert, then read requests, read labels and upsert the list entries
+    with django_assert_num_queries(4):
+        labels_attach(label, [FundingRequestId(fr.pk) for fr in funding_requests])
+
+    assert set(label.requests.all()) == set(funding_requests)
+
+
+@pytest.mark.django_db
+def test__bulk_attach_label__ignores_requests_already_labeled() -> None:
+    labeled, unlabeled = modelfactory.fundingrequest(), modelfactory.fundingrequest()
+    label = label_create("My label", Color.from_rgb(255, 0, 0))
+    label_attach(labeled, label)
+
+    labels_attach(label, [FundingRequestId(labeled.pk), FundingRequestId(unlabeled.pk)])
+
+    assert set(label.requests.all()) == {labeled, unlabeled}
+
+
+@pytest.mark.django_db
+def test__bulk_detach_label__removes_label_only_from_given_requests(
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    detached, kept = modelfactory.fundingrequest(), modelfactory.fundingrequest()
+    label = label_create("My label", Color.from_rgb(255, 0, 0))
+    labels_attach(label, [FundingRequestId(detached.pk), FundingRequestId(kept.pk)])
+
+    # delete, then read requests, read labels and upsert the list entries
+    with django_assert_num_queries(4):
+        labels_detach(label, [FundingRequestId(detached.pk)])
+
+    assert list(label.requests.all()) == [kept]
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__bulk_attach_label_view__with_search_scope__labels_all_matching_requests(
+    client: Client,
+) -> None:
+    matching = [modelfactory.fundingrequest(title=f"Matching {i}") for i in range(2)]
+    modelfactory.fundingrequest(title="Other")
+    label = label_create("DFG 2026", Color.from_rgb(255, 0, 0))
+
+    query_string = "search_type=title&search_term=Matching"
+    response = client.post(
+        f"{reverse('fundingrequests:label_bulk_attach')}?{query_string}",
+        {"label": label.pk, "scope": "search"},
+    )
+
+    assertRedirects(response, f"{reverse('fundingrequests:list')}?{query_string}")
+    assert set(label.requests.all()) == set(matching)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__bulk_detach_label_view__removes_label_from_selected_requests(client: Client) -> None:
+    funding_requests = [modelfactory.fundingrequest() for _ in range(2)]
+    label = label_create("My label", Color.from_rgb(255, 0, 0))
+    labels_attach(label, [FundingRequestId(fr.pk) for fr in funding_requests])
+
+    response = client.post(
+        reverse("fundingrequests:label_bulk_detach"),
+        {"label": label.pk, "fundingrequest": [fr.pk for fr in funding_requests]},
+    )
+
+    assertRedirects(response, reverse("fundingrequests:list"))
+    assert not label.requests.exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+@pytest.mark.parametrize(
+    "view_name", ["label_attach", "label_detach", "label_bulk_attach", "label_bulk_detach"]
+)
+def test__label_views__with_invalid_label_id__return_bad_request(
+    client: Client, view_name: str
+) -> None:
+    funding_request = modelfactory.fundingrequest()
+
+    response = client.post(
+        reverse(f"fundingrequests:{view_name}"),
+        {"label": "abc", "fundingrequest": funding_request.pk},
+    )
+
+    assert response.status_code == 400
@@ -0,0 +1,83 @@
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from pytest_django import DjangoAssertNumQueries
+
+from coda.apps.fundingrequests.models import FundingRequest as FundingRequestModel
+from coda.apps.fundingrequests.services import (
+    fundingrequest_perform_review,
+    fundingrequests_prescreen,
+)
+from coda.apps.management.management.commands import prescreen_fundingrequests
+from coda.checks.checklist import CheckResult
+from coda.fundingrequest import FundingRequestId, Review
+from coda.money import Currency, Money
+from tests import modelfactory
+
+LIMIT = Money(1000, Currency.EUR)
+
+
+def fundingrequest_costing(amount: str, currency: Currency) -> FundingRequestId:
+    request = modelfactory.fundingrequest()
+    FundingRequestModel.objects.filter(pk=request.pk).update(
+        estimated_cost=Decimal(amount), estimated_cost_currency=currency.code
+    )
+    return FundingRequestId(request.pk)
+
+
+def half(origin: Currency, target: Currency) -> Decimal:
+    return Decimal("0.5")
+
+
+@pytest.mark.django_db
+def test__prescreen__checks_open_fundingrequests_against_limit() -> None:
+    under = fundingrequest_costing("999.99", Currency.EUR)
+    over = fundingrequest_costing("1000.01", Currency.EUR)
+    converted_under = fundingrequest_costing("2000.00", Currency.USD)
+    converted_over = fundingrequest_costing("2000.04", Currency.USD)
+
+    results = fundingrequests_prescreen(LIMIT, half)
+
+    assert results == {
+        under: CheckResult.SUCCESS,
+        over: CheckResult.FAILURE,
+        converted_under: CheckResult.SUCCESS,
+        converted_over: CheckResult.FAILURE,
+    }
+
+
+@pytest.mark.django_db
+def test__prescreen__ignores_reviewed_fundingrequests() -> None:
+    reviewed = fundingrequest_costing("5000", Currency.EUR)
+    fundingrequest_perform_review(reviewed, Review.Rejected)
+
+    assert fundingrequests_prescreen(LIMIT, half) == {}
+
+
+@pytest.mark.django_db
+def test__prescreen__reads_costs_with_one_query(
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    for _ in range(5):
+        fundingrequest_costing("1500", Currency.USD)
+
+    with django_assert_num_queries(1):
+        fundingrequests_prescreen(LIMIT, half)
+
+
+@pytest.mark.django_db
+def test__prescreen_command__reports_fundingrequests_over_limit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fundingrequest_costing("10", Currency.EUR)
+    over = fundingrequest_costing("5000", Currency.EUR)
+    out = StringIO()
+
+    monkeypatch.setattr(prescreen_fundingrequests, "currency_exchange", lambda wait_for_rates: half)
+
+    call_command("prescreen_fundingrequests", "1000", "--currency", "EUR", stdout=out)
+
+    assert f"Funding request {over} exceeds" in out.getvalue()
+    assert "Checked 2 open funding requests, 1 over limit" in out.getvalue()
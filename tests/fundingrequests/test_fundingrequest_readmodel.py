@@ -0,0 +1,125 @@
+from io import StringIO
+from typing import cast
+
+import pytest
+from django.core.management import call_command
+
+from coda.apps.authors.models import Author as AuthorModel
+from coda.apps.fundingrequests import readmodel
+from coda.apps.fundingrequests.models import FundingRequest as FundingRequestModel
+from coda.apps.fundingrequests.models import FundingRequestListEntry
+from coda.apps.fundingrequests.services import (
+    fundingrequest_perform_review,
+    fundingrequest_publication_update,
+    fundingrequest_submitter_update,
+    label_attach,
+    label_create,
+    label_detach,
+)
+from coda.author import AuthorId
+from coda.color import Color
+from coda.fundingrequest import FundingRequestId, Review
+from coda.publication import JournalId, PublicationId
+from tests import domainfactory, modelfactory
+
+
+@pytest.mark.django_db
+def test__creating_fundingrequest__creates_list_entry() -> None:
+    funding_request = modelfactory.fundingrequest(title="The Title")
+
+    assert_entry_matches(funding_request)
+
+
+@pytest.mark.django_db
+def test__reviewing_fundingrequest__updates_list_entry_status() -> None:
+    funding_request = modelfactory.fundingrequest()
+
+    fundingrequest_perform_review(FundingRequestId(funding_request.pk), Review.Approved)
+
+    assert entry(funding_request).processing_status == Review.Approved.value
+
+
+@pytest.mark.django_db
+def test__attaching_and_detaching_labels__updates_list_entry_label_ids() -> None:
+    funding_request = modelfactory.fundingrequest()
+    first = label_create("First", Color())
+    second = label_create("Second", Color())
+
+    label_attach(funding_request, first)
+    label_attach(funding_request, second)
+    assert entry(funding_request).label_ids == [first.pk, second.pk]
+
+    label_detach(funding_request, first)
+    assert entry(funding_request).label_ids == [second.pk]
+
+
+@pytest.mark.django_db
+def test__updating_publication__updates_list_entry() -> None:
+    funding_request = modelfactory.fundingrequest()
+    new_journal = modelfactory.journal()
+
+    fundingrequest_publication_update(
+        domainfactory.publication(
+            JournalId(new_journal.pk),
+            title="A new title",
+            id=PublicationId(funding_request.publication_id),
+        )
+    )
+
+    funding_request.refresh_from_db()
+    assert_entry_matches(funding_request)
+    assert entry(funding_request).title == "A new title"
+
+
+@pytest.mark.django_db
+def test__updating_submitter__updates_list_entry() -> None:
+    funding_request = modelfactory.fundingrequest()
+    submitter = cast(AuthorModel, funding_request.submitter)
+
+    fundingrequest_submitter_update(domainfactory.author(id=AuthorId(submitter.pk)))
+
+    funding_request.refresh_from_db()
+    assert_entry_matches(funding_request)
+
+
+@pytest.mark.django_db
+def test__rebuild__recreates_all_list_entries() -> None:
+    funding_requests = [modelfactory.fundingrequest() for _ in range(3)]
+    FundingRequestListEntry.objects.all().delete()
+
+    count = readmodel.rebuild()
+
+    assert count == 3
+    for funding_request in funding_requests:
+        assert_entry_matches(funding_request)
+
+
+@pytest.mark.django_db
+def test__rebuild_command__rebuilds_list_entries() -> None:
+    funding_request = modelfactory.fundingrequest()
+    FundingRequestListEntry.objects.all().delete()
+    out = StringIO()
+
+    call_command("rebuild_fundingrequest_list", stdout=out)
+
+    assert "Rebuilt 1 funding request list entries" in out.getvalue()
+    assert_entry_matches(funding_request)
+
+
+def entry(funding_request: FundingRequestModel) -> FundingRequestListEntry:
+    return FundingRequestListEntry.objects.get(pk=funding_request.pk)
+
+
+def assert_entry_matches(funding_request: FundingRequestModel) -> None:
+    actual = entry(funding_request)
+    journal = funding_request.publication.journal
+    assert actual.title == funding_request.publication.title
+    assert actual.journal_title == journal.title
+    assert actual.journal_eissn == journal.eissn
+    assert actual.publisher_name == journal.publisher.name
+    assert actual.submitter_name == cast(AuthorModel, funding_request.submitter).name
+    assert actual.processing_status == funding_request.processing_status
+    assert actual.estimated_cost == funding_request.estimated_cost
+    assert actual.estimated_cost_currency == funding_request.estimated_cost_currency
+    assert actual.label_ids == sorted(label.pk for label in funding_request.labels.all())
+    assert actual.created_at == funding_request.created_at
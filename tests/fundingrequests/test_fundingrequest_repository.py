@@ -2,13 +2,17 @@ from datetime import date
 from typing import Any, cast
 
 import pytest
+from pytest_django import DjangoAssertNumQueries
 
 from coda.apps.authors.models import Author
 from coda.apps.fundingrequests import repository
+from coda.apps.fundingrequests.models import FundingRequest as FundingRequestModel
+from coda.apps.fundingrequests.repository import LabelMatch
 from coda.apps.fundingrequests.services import label_attach, label_create
 from coda.color import Color
-from coda.fundingrequest import Review
+from coda.fundingrequest import FundingRequestId, Review
 from tests import dtofactory, modelfactory
+from tests.fundingrequests.test_fundingrequest_services import assert_fundingrequest_eq
 
 
 @pytest.mark.django_db
@@ -52,15 +56,48 @@ def test__searching_for_funding_requests_with_label__returns_matching_funding_re
     assert list(results) == [matching_request]
 
 
+@pytest.mark.django_db
+def test__searching_for_funding_requests_with_any_label__returns_requests_with_either_label() -> (
+    None
+):
+    first = label_create("The Label", Color())
+    second = label_create("Another Label", Color())
+    with_first = modelfactory.fundingrequest()
+    label_attach(with_first, first)
+    with_both = modelfactory.fundingrequest()
+    label_attach(with_both, first)
+    label_attach(with_both, second)
+    _ = modelfactory.fundingrequest("No match")
+
+    results = repository.search(labels=[first.pk, second.pk], label_match=LabelMatch.Any)
+
+    assert list(results) == [with_both, with_first]
+
+
+@pytest.mark.django_db
+def test__searching_for_funding_requests_with_all_labels__returns_requests_with_every_label() -> (
+    None
+):
+    first = label_create("The Label", Color())
+    second = label_create("Another Label", Color())
+    with_first = modelfactory.fundingrequest()
+    label_attach(with_first, first)
+    with_both = modelfactory.fundingrequest()
+    label_attach(with_both, first)
+    label_attach(with_both, second)
+
+    results = repository.search(labels=[first.pk, second.pk], label_match=LabelMatch.All)
+
+    assert list(results) == [with_both]
+
+
 @pytest.mark.django_db
 def test__searching_for_funding_requests_by_process_state__returns_matching_funding_requests() -> (
     None
 ):
-    approved_request = modelfactory.fundingrequest()
-    approved_request.approve()
+    approved_request = modelfactory.fundingrequest(review=Review.Approved)
 
-    rejected_request = modelfactory.fundingrequest()
-    rejected_request.reject()
+    rejected_request = modelfactory.fundingrequest(review=Review.Rejected)
 
     in_progress_request = modelfactory.fundingrequest()  # noqa: F841
 
@@ -137,3 +174,99 @@ def test__searching_with_no_end_date__returns_matching_funding_requests() -> Non
 def assert_contains_all(expected: list[Any], actual: list[Any]) -> None:
     assert len(expected) == len(actual)
     assert set(expected) == set(actual)
+
+
+@pytest.mark.django_db
+def test__searching_by_title_ordered_by_relevance__returns_best_match_first() -> None:
+    exact_match = modelfactory.fundingrequest("Open Access")
+    partial_match = modelfactory.fundingrequest("Costs of Open Access publishing")
+    _ = modelfactory.fundingrequest("No match")
+
+    results = repository.search(title="open access", order_by_relevance=True)
+
+    assert list(results) == [exact_match, partial_match]
+
+
+@pytest.mark.django_db
+def test__searching_by_title_ordered_by_relevance__ranks_prefix_and_closer_matches_higher() -> None:
+    longer_match = modelfactory.fundingrequest("Costs of open access publishing in physics")
+    prefix_match = modelfactory.fundingrequest("Open access in physics")
+    closer_match = modelfactory.fundingrequest("Costs of open access")
+
+    results = repository.search(title="open access", order_by_relevance=True)
+
+    assert list(results) == [prefix_match, closer_match, longer_match]
+
+
+@pytest.mark.django_db
+def test__searching_ordered_by_relevance_without_search_term__returns_newest_first() -> None:
+    older = modelfactory.fundingrequest()
+    newer = modelfactory.fundingrequest()
+
+    results = repository.search(order_by_relevance=True)
+
+    assert list(results) == [newer, older]
+
+
+@pytest.mark.django_db
+def test__count_by_status__returns_number_of_requests_per_status() -> None:
+    modelfactory.fundingrequest(review=Review.Approved)
+    modelfactory.fundingrequest(review=Review.Approved)
+    modelfactory.fundingrequest(review=Review.Rejected)
+
+    counts = repository.count_by_status()
+
+    assert counts == {
+        Review.Open.value: 0,
+        Review.Approved.value: 2,
+        Review.Rejected.value: 1,
+        Review.Withdrawn.value: 0,
+    }
+
+
+@pytest.mark.django_db
+def test__count_by_label__returns_number_of_requests_per_label() -> None:
+    first = label_create("The Label", Color())
+    second = label_create("Another Label", Color())
+    for request in (modelfactory.fundingrequest(), modelfactory.fundingrequest()):
+        label_attach(request, first)
+    label_attach(modelfactory.fundingrequest(), second)
+
+    counts = repository.count_by_label()
+
+    assert counts == {first.pk: 2, second.pk: 1}
+
+
+@pytest.mark.django_db
+def test__count_by_month__returns_number_of_requests_per_month() -> None:
+    for created_at in (date(2021, 3, 1), date(2021, 3, 20), date(2021, 5, 2)):
+        request = modelfactory.fundingrequest()
+        request.created_at = created_at
+        request.save()
+
+    counts = repository.count_by_month()
+
+    assert counts == {date(2021, 3, 1): 2, date(2021, 5, 1): 1}
+
+
+@pytest.mark.django_db
+def test__get_many__returns_same_funding_requests_as_get_by_id_in_given_order() -> None:
+    ids = [FundingRequestId(modelfactory.fundingrequest().pk) for _ in range(3)][::-1]
+
+    actual = repository.get_many(ids)
+
+    assert [request.id for request in actual] == ids
+    for request in actual:
+        assert_fundingrequest_eq(request, repository.get_by_id(cast(FundingRequestId, request.id)))
+
+
+@pytest.mark.django_db
+def test__as_domain_objects__uses_constant_number_of_queries(
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    for _ in range(5):
+        modelfactory.fundingrequest()
+
+    # funding requests with joined relations, publication links and link types
+    with django_assert_num_queries(3):
+        repository.as_domain_objects(FundingRequestModel.objects.all())
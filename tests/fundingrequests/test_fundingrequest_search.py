@@ -1,18 +1,31 @@
 from typing import Any, cast
 
 import pytest
+from django.db import connection
 from django.template import RequestContext
 from django.template.response import TemplateResponse
 from django.test import Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from pytest_django import DjangoAssertNumQueries
 
 from coda.apps.authors.models import Author
-from coda.apps.fundingrequests.models import FundingRequest
-from coda.apps.fundingrequests.services import label_attach, label_create
+from coda.apps.fundingrequests.models import FundingRequest, FundingRequestListEntry
+from coda.apps.fundingrequests.services import (
+    fundingrequest_perform_review,
+    label_attach,
+    label_create,
+)
 from coda.color import Color
-from coda.fundingrequest import Review
+from coda.fundingrequest import FundingRequestId, Review
 from tests import dtofactory, modelfactory
 
+LIST_PAGE_SIZE = 10
+
+# session, user, approximate count, page of list entries, labels
+# plus the savepoint pair of ATOMIC_REQUESTS
+LIST_QUERY_BUDGET = 7
+
 
 @pytest.mark.django_db
 @pytest.mark.usefixtures("logged_in")
@@ -84,16 +97,35 @@ def test__searching_for_funding_requests_by_label__shows_only_matching_funding_r
     assert_contains(response.context, {matching_request})
 
 
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__searching_for_funding_requests_with_all_labels__shows_only_requests_with_every_label(
+    client: Client,
+) -> None:
+    first = label_create("The Label", Color())
+    second = label_create("Another Label", Color())
+    matching_request = modelfactory.fundingrequest()
+    label_attach(matching_request, first)
+    label_attach(matching_request, second)
+    partial_match = modelfactory.fundingrequest()
+    label_attach(partial_match, first)
+
+    query = {"labels": [first.pk, second.pk], "label_match": "all"}
+    response = search_fundingrequests(client, query)
+
+    assert_contains(response.context, {matching_request})
+
+
 @pytest.mark.django_db
 @pytest.mark.usefixtures("logged_in")
 def test__searching_for_funding_requests_by_process_state__shows_only_matching_funding_requests(
     client: Client,
 ) -> None:
     approved_request = modelfactory.fundingrequest()
-    approved_request.approve()
+    fundingrequest_perform_review(FundingRequestId(approved_request.pk), Review.Approved)
 
     rejected_request = modelfactory.fundingrequest()
-    rejected_request.reject()
+    fundingrequest_perform_review(FundingRequestId(rejected_request.pk), Review.Rejected)
 
     in_progress_request = modelfactory.fundingrequest()  # noqa: F841
 
@@ -103,6 +135,74 @@ def test__searching_for_funding_requests_by_process_state__shows_only_matching_f
     assert_contains(response.context, {approved_request, rejected_request})
 
 
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__listing_funding_requests__stays_within_query_budget(
+    client: Client, django_assert_max_num_queries: DjangoAssertNumQueries
+) -> None:
+    for _ in range(LIST_PAGE_SIZE):
+        labeled_fundingrequest()
+
+    with django_assert_max_num_queries(LIST_QUERY_BUDGET):
+        search_fundingrequests(client)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__listing_funding_requests__query_count_does_not_depend_on_number_of_rows(
+    client: Client,
+) -> None:
+    labeled_fundingrequest()
+    with CaptureQueriesContext(connection) as single_row:
+        search_fundingrequests(client)
+
+    for _ in range(LIST_PAGE_SIZE - 1):
+        labeled_fundingrequest()
+    with CaptureQueriesContext(connection) as full_page:
+        search_fundingrequests(client)
+
+    assert len(full_page) == len(single_row)
+
+
+def labeled_fundingrequest() -> FundingRequest:
+    request = modelfactory.fundingrequest()
+    label_attach(request, label_create("The Label", Color()))
+    return request
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__searching_for_funding_requests_ordered_by_relevance__shows_best_match_first(
+    client: Client,
+) -> None:
+    exact_match = modelfactory.fundingrequest("Open Access")
+    partial_match = modelfactory.fundingrequest("Costs of open access")
+    prefix_match = modelfactory.fundingrequest("Open access publishing costs")
+
+    response = search_fundingrequests(client, by_title("open access") | {"order": "relevance"})
+
+    assert page_ids(response) == [exact_match.pk, prefix_match.pk, partial_match.pk]
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__listing_funding_requests_ordered_by_cost__shows_most_expensive_first(
+    client: Client,
+) -> None:
+    cheap = modelfactory.fundingrequest()
+    expensive = modelfactory.fundingrequest()
+    for request, cost in [(cheap, 10), (expensive, 1000)]:
+        FundingRequestListEntry.objects.filter(pk=request.pk).update(estimated_cost_home=cost)
+
+    response = search_fundingrequests(client, {"order": "cost"})
+
+    assert page_ids(response) == [expensive.pk, cheap.pk]
+
+
+def page_ids(response: Any) -> list[int]:
+    return [viewmodel.id for viewmodel in response.context["funding_requests"]]
+
+
 def search_fundingrequests(client: Client, query: dict[str, Any] | None = None) -> TemplateResponse:
     return cast(TemplateResponse, client.get(reverse("fundingrequests:list"), data=query))
 
@@ -1,17 +1,24 @@
 import datetime
 import random
-from typing import Any, cast
+import time
+from typing import Any
 
 import faker
 import pytest
-from django.template.response import TemplateResponse
 from django.test import Client
 from django.urls import reverse
+from pytest_django import DjangoAssertNumQueries
 from pytest_django.asserts import assertRedirects
 
+from coda.apps.invoices.draft import MAX_DRAFT_AGE, MAX_DRAFTS, STORE_PREFIX
+from coda.apps.invoices.models import Invoice as InvoiceModel
 from coda.apps.invoices.services import get_by_id
-from coda.apps.invoices.views.create import DEFAULT_TAX_RATE_PERCENTAGE
-from coda.apps.publications.models import Publication
+from coda.apps.invoices.views.create import (
+    DEFAULT_TAX_RATE_PERCENTAGE,
+    MIN_TITLE_SEARCH_LENGTH,
+    SEARCH_LIMIT,
+)
+from coda.apps.publications.models import Link, LinkType, Publication
 from coda.invoice import CostType, CreditorId, Invoice, InvoiceId, PaymentStatus, Position, TaxRate
 from coda.money import Currency, Money
 from coda.publication import PublicationId
@@ -33,106 +40,369 @@ def test__searching_for_publication__returns_matches_in_response(client: Client)
 
 @pytest.mark.django_db
 @pytest.mark.usefixtures("logged_in")
-def test__add_publication_as_position__returns_position_in_response(client: Client) -> None:
+@pytest.mark.parametrize("term", ["10.1234/Example.5678", "https://doi.org/10.1234/EXAMPLE.5678"])
+def test__searching_for_doi__returns_publication_with_that_doi(client: Client, term: str) -> None:
+    fr = modelfactory.fundingrequest()
+    Link.objects.create(
+        type=LinkType.objects.get(name="DOI"),
+        value="10.1234/example.5678",
+        publication=fr.publication,
+    )
+
+    response = search(client, term)
+
+    assert [expect_search_result(fr.publication)] == response.context["publications"]
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__searching_for_request_id__returns_publication_of_funding_request(client: Client) -> None:
+    fr = modelfactory.fundingrequest()
+    modelfactory.fundingrequest()
+
+    response = search(client, fr.request_id.upper())
+
+    assert [expect_search_result(fr.publication)] == response.context["publications"]
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__searching_for_publication__puts_exact_matches_before_title_matches(
+    client: Client,
+) -> None:
+    by_title = modelfactory.publication("A study of 10.1234/abc")
+    by_doi = modelfactory.publication("Something else")
+    Link.objects.create(
+        type=LinkType.objects.get(name="DOI"), value="10.1234/abc", publication=by_doi
+    )
+
+    response = search(client, "10.1234/abc")
+
+    assert [by_doi.id, by_title.id] == [p["id"] for p in response.context["publications"]]
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__searching_for_publication__returns_at_most_search_limit_results(client: Client) -> None:
+    for n in range(SEARCH_LIMIT + 1):
+        modelfactory.publication(f"Open access {n}")
+
+    response = search(client, "open access")
+
+    assert len(response.context["publications"]) == SEARCH_LIMIT
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__searching_for_short_term__does_not_search_titles(client: Client) -> None:
+    publication = modelfactory.publication("Ab initio")
+
+    response = search(client, publication.title[: MIN_TITLE_SEARCH_LENGTH - 1])
+
+    assert [] == response.context["publications"]
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__searching_for_publication__has_constant_number_of_queries(
+    client: Client, django_assert_num_queries: DjangoAssertNumQueries
+) -> None:
+    for _ in range(3):
+        modelfactory.fundingrequest("Open access publishing")
+    search(client, "open access")
+
+    # session, user and the title search within the request savepoint
+    with django_assert_num_queries(5):
+        response = search(client, "open access")
+
+    assert len(response.context["publications"]) == 3
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__searching_for_publication__may_be_cached_privately(client: Client) -> None:
+    response = search(client, "open access")
+
+    assert "private" in response["Cache-Control"]
+    assert "max-age" in response["Cache-Control"]
+    assert "Cookie" in response["Vary"]
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__add_publication_as_position__returns_position_in_response(
+    client: Client, draft_id: str
+) -> None:
     fr = modelfactory.fundingrequest()
     publication = fr.publication
 
-    response = add_publication_position(client, publication.id)
+    response = add_publication_position(client, draft_id, publication.id)
 
     expected = expect_new_publication_position(publication)
+    assert [expected] == response.context["changed"]
     assert [expected] == response.context["positions"]
 
 
 @pytest.mark.django_db
 @pytest.mark.usefixtures("logged_in")
-def test__add_free_position__returns_position_in_response(client: Client) -> None:
+def test__add_free_position__returns_position_in_response(client: Client, draft_id: str) -> None:
     position_data = new_free_position_data()
-    response = client.post(reverse("invoices:add_position"), position_data)
+    response = add_free_position(client, draft_id, position_data)
 
     expected = expect_new_free_position(position_data)
-    assert expected in response.context["positions"]
+    assert [expected] == response.context["changed"]
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__add_position__keeps_positions_added_before(client: Client, draft_id: str) -> None:
+    first = new_free_position_data()
+    second = new_free_position_data()
+    add_free_position(client, draft_id, first)
+
+    response = add_free_position(client, draft_id, second)
+
+    assert response.context["changed"] == [expect_new_free_position(second, key=2)]
+    assert response.context["positions"] == [
+        expect_new_free_position(first, key=1),
+        expect_new_free_position(second, key=2),
+    ]
 
 
 @pytest.mark.django_db
 @pytest.mark.usefixtures("logged_in")
-def test__changing_publication_position_data__updates_position_in_response(client: Client) -> None:
+def test__changing_publication_position_data__updates_position_in_response(
+    client: Client, draft_id: str
+) -> None:
     publication = modelfactory.publication()
-    position_data = number_of_positions(1) | create_publication_position_input(publication)
-    response = client.post(reverse("invoices:create"), position_data)
+    add_publication_position(client, draft_id, publication.id)
+    position_data = create_publication_position_input()
+
+    response = update_position(client, draft_id, 1, position_data)
 
-    expected = expect_existing_publication_position(position_data)
-    assert expected in response.context["positions"]
+    expected = expect_existing_publication_position(publication, position_data)
+    assert [expected] == response.context["changed"]
+    assert [expected] == response.context["positions"]
 
 
 @pytest.mark.django_db
 @pytest.mark.usefixtures("logged_in")
-def test__changing_free_position_data__updates_position_in_response(client: Client) -> None:
-    position_data = number_of_positions(1) | create_free_position_input()
-    response = client.post(reverse("invoices:create"), position_data)
+def test__changing_free_position_data__updates_position_in_response(
+    client: Client, draft_id: str
+) -> None:
+    add_free_position(client, draft_id, new_free_position_data())
+    position_data = create_free_position_input()
+
+    response = update_position(client, draft_id, 1, position_data)
 
     expected = expect_existing_free_position(position_data)
+    assert [expected] == response.context["changed"]
     assert [expected] == response.context["positions"]
 
 
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__changing_position__renders_only_changed_position(
+    client: Client, draft_id: str, django_assert_num_queries: DjangoAssertNumQueries
+) -> None:
+    for _ in range(50):
+        add_free_position(client, draft_id, new_free_position_data())
+
+    # session, user and session update
+    # plus the savepoint pairs of ATOMIC_REQUESTS and of saving the session
+    with django_assert_num_queries(7):
+        response = update_position(client, draft_id, 25, create_free_position_input(25))
+
+    assert [position["key"] for position in response.context["changed"]] == [25]
+    assert response.content.decode().count("<tr id=") == 1
+
+
 @pytest.mark.django_db
 @pytest.mark.usefixtures("logged_in")
 def test__given_position_added__removing_position__position_removed_from_response(
-    client: Client,
+    client: Client, draft_id: str
 ) -> None:
     first = modelfactory.publication()
     second = modelfactory.publication()
-    position_data = (
-        number_of_positions(2)
-        | create_publication_position_input(first, 1)
-        | create_publication_position_input(second, 2)
+    add_publication_position(client, draft_id, first.id)
+    add_publication_position(client, draft_id, second.id)
+
+    response = client.post(
+        reverse("invoices:remove_position", kwargs={"key": 1}), {"draft": draft_id}
     )
 
+    assert response.context["changed"] == []
+    assert response.context["positions"] == [expect_new_publication_position(second, key=2)]
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__opening_create_page__starts_new_draft(client: Client, draft_id: str) -> None:
+    add_free_position(client, draft_id, new_free_position_data())
+
+    response = client.get(reverse("invoices:create"))
+
+    assert response.context["draft_id"] != draft_id
+    assert response.context["positions"] == []
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__opening_create_page_in_second_tab__keeps_draft_of_first_tab(
+    client: Client, draft_id: str
+) -> None:
+    first = new_free_position_data()
+    add_free_position(client, draft_id, first)
+    second_draft_id = client.get(reverse("invoices:create")).context["draft_id"]
+    add_free_position(client, second_draft_id, new_free_position_data())
+
+    response = add_free_position(client, draft_id, new_free_position_data())
+
+    assert [position["key"] for position in response.context["positions"]] == [1, 2]
+    assert response.context["positions"][0] == expect_new_free_position(first)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+@pytest.mark.parametrize("draft", ["", "../invoice-draft", "0" * 31])
+def test__changing_positions_with_invalid_draft_id__is_bad_request(
+    client: Client, draft: str
+) -> None:
     response = client.post(
-        reverse("invoices:remove_position"), position_data | {"remove-position": "1"}
+        reverse("invoices:add_position"), new_free_position_data() | {"draft": draft}
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__opening_create_page__keeps_only_newest_drafts(client: Client) -> None:
+    draft_ids = [
+        client.get(reverse("invoices:create")).context["draft_id"] for _ in range(MAX_DRAFTS + 2)
+    ]
+
+    stored = [key.removeprefix(STORE_PREFIX) for key, _ in client.session.items()]
+    assert sorted(id for id in stored if id in draft_ids) == sorted(draft_ids[-MAX_DRAFTS:])
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__opening_create_page__removes_expired_drafts(
+    client: Client, draft_id: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + MAX_DRAFT_AGE)
+
+    client.get(reverse("invoices:create"))
+
+    assert STORE_PREFIX + draft_id not in client.session
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+@pytest.mark.parametrize(
+    "field, value", [("cost", "a lot"), ("cost", "-1"), ("taxrate", "1.5"), ("cost-type", "x")]
+)
+def test__changing_position_to_invalid_value__is_bad_request_and_keeps_draft(
+    client: Client, draft_id: str, field: str, value: str
+) -> None:
+    position_data = new_free_position_data()
+    add_free_position(client, draft_id, position_data)
+
+    response = update_position(
+        client, draft_id, 1, create_free_position_input() | {f"position-1-{field}": value}
     )
 
-    assert response.context["positions"] == [expect_existing_publication_position(position_data, 2)]
+    assert response.status_code == 400
+    total = client.post(reverse("invoices:get_total"), {"draft": draft_id, "currency": "EUR"})
+    assert total.context["positions"] == [expect_new_free_position(position_data)]
 
 
 @pytest.mark.django_db
 @pytest.mark.usefixtures("logged_in")
-def test__given_positions_added__create__saves_new_invoice(client: Client) -> None:
+def test__adding_position_with_invalid_cost__is_bad_request(client: Client, draft_id: str) -> None:
+    response = add_free_position(
+        client, draft_id, new_free_position_data() | {"free-position-cost": "NaN"}
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__calculating_total_with_unknown_currency__is_bad_request(
+    client: Client, draft_id: str
+) -> None:
+    response = client.post(reverse("invoices:get_total"), {"draft": draft_id, "currency": "XYZ"})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__given_positions_added__create__saves_new_invoice(client: Client, draft_id: str) -> None:
     creditor = modelfactory.creditor()
     first = modelfactory.publication()
+    add_publication_position(client, draft_id, first.id)
+    add_free_position(client, draft_id, new_free_position_data())
 
-    first_position_data = create_publication_position_input(first, 1)
+    first_position_data = create_publication_position_input(1)
     second_position_data = create_free_position_input(2)
 
-    post_data = (
-        {
-            "action": "create",
-            "number": _faker.pystr(),
-            "date": _faker.date(),
-            "creditor": str(creditor.id),
-            "status": PaymentStatus.Unpaid.value,
-            "currency": Currency.EUR.code,
-        }
-        | number_of_positions(2)
-        | first_position_data
-        | second_position_data
-    )
+    post_data = invoice_head_data(creditor.id) | first_position_data | second_position_data
 
-    response = client.post(reverse("invoices:create"), post_data)
+    response = client.post(
+        reverse("invoices:create"), post_data | {"draft": draft_id, "positions": ["1", "2"]}
+    )
 
-    actual = get_by_id(InvoiceId(1))
-    expected = expected_invoice(post_data)
+    invoice_id = InvoiceId(InvoiceModel.objects.get().pk)
+    actual = get_by_id(invoice_id)
+    expected = expected_invoice(post_data, PublicationId(first.id))
     assert_invoice_eq(expected, actual)
-    assertRedirects(response, reverse("invoices:detail", kwargs={"pk": 1}))
+    assertRedirects(response, reverse("invoices:detail", kwargs={"pk": invoice_id}))
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__create__saves_only_positions_of_submitted_form(client: Client, draft_id: str) -> None:
+    creditor = modelfactory.creditor()
+    add_free_position(client, draft_id, new_free_position_data())
+    add_free_position(client, draft_id, new_free_position_data())
+    kept_position_data = create_free_position_input(2)
+
+    client.post(
+        reverse("invoices:create"),
+        invoice_head_data(creditor.id)
+        | kept_position_data
+        | {"draft": draft_id, "positions": ["2"]},
+    )
 
+    positions = get_by_id(InvoiceId(InvoiceModel.objects.get().pk)).positions
+    assert [position.item for position in positions] == [
+        kept_position_data["position-2-description"]
+    ]
 
-def expected_invoice(post_data: dict[str, str]) -> Invoice:
+
+def invoice_head_data(creditor_id: int) -> dict[str, str]:
+    return {
+        "action": "create",
+        "number": _faker.pystr(),
+        "date": _faker.date(),
+        "creditor": str(creditor_id),
+        "status": PaymentStatus.Unpaid.value,
+        "currency": Currency.EUR.code,
+    }
+
+
+def expected_invoice(post_data: dict[str, str], publication: PublicationId) -> Invoice:
     return Invoice.new(
         post_data["number"],
         datetime.date.fromisoformat(post_data["date"]),
         CreditorId(int(post_data["creditor"])),
         [
             Position(
-                PublicationId(int(post_data["position-1-id"])),
+                publication,
                 Money(
                     post_data["position-1-cost"],
                     Currency[post_data["currency"]],
@@ -153,58 +423,46 @@ def expected_invoice(post_data: dict[str, str]) -> Invoice:
     )
 
 
-def search(
-    client: Client, title: str, other_post_data: dict[str, str] | None = None
-) -> TemplateResponse:
-    return cast(
-        TemplateResponse,
-        client.post(reverse("invoices:pub_search"), {"q": title} | (other_post_data or {})),
-    )
+def search(client: Client, term: str) -> Any:
+    return client.get(reverse("invoices:pub_search"), {"q": term})
 
 
-def add_publication_position(
-    client: Client, id: int, /, other_post_data: dict[str, Any] | None = None
-) -> TemplateResponse:
-    return cast(
-        TemplateResponse,
-        client.post(
-            reverse("invoices:add_position"),
-            {"add-publication-position": id} | (other_post_data or {}),
-        ),
+@pytest.fixture
+def draft_id(client: Client, logged_in: None) -> str:
+    return str(client.get(reverse("invoices:create")).context["draft_id"])
+
+
+def add_free_position(client: Client, draft_id: str, position_data: dict[str, str]) -> Any:
+    return client.post(reverse("invoices:add_position"), position_data | {"draft": draft_id})
+
+
+def add_publication_position(client: Client, draft_id: str, id: int) -> Any:
+    return client.post(
+        reverse("invoices:add_position"), {"add-publication-position": id, "draft": draft_id}
     )
 
 
-def number_of_positions(num: int) -> dict[str, str]:
-    return {"number-of-positions": str(num)}
+def update_position(client: Client, draft_id: str, key: int, position_data: dict[str, str]) -> Any:
+    return client.post(
+        reverse("invoices:update_position", kwargs={"key": key}),
+        position_data | {"draft": draft_id},
+    )
 
 
-def create_free_position_input(index: int = 1) -> dict[str, str]:
+def create_free_position_input(key: int = 1) -> dict[str, str]:
     return {
-        f"position-{index}-type": "free",
-        f"position-{index}-description": _faker.sentence(),
-        f"position-{index}-cost": _random_cost(),
-        f"position-{index}-taxrate": _random_tax_rate(),
-        f"position-{index}-cost-type": _random_cost_type(),
+        f"position-{key}-description": _faker.sentence(),
+        f"position-{key}-cost": _random_cost(),
+        f"position-{key}-taxrate": _random_tax_rate(),
+        f"position-{key}-cost-type": _random_cost_type(),
     }
 
 
-def create_publication_position_input(publication: Publication, index: int = 1) -> dict[str, str]:
-    if hasattr(publication, "fundingrequest"):
-        request_id = publication.fundingrequest.request_id
-        url = publication.fundingrequest.get_absolute_url()
-    else:
-        request_id = ""
-        url = ""
-
+def create_publication_position_input(key: int = 1) -> dict[str, str]:
     return {
-        f"position-{index}-type": "publication",
-        f"position-{index}-id": str(publication.id),
-        f"position-{index}-title": publication.title,
-        f"position-{index}-cost": _random_cost(),
-        f"position-{index}-taxrate": _random_tax_rate(),
-        f"position-{index}-cost-type": _random_cost_type(),
-        f"position-{index}-fundingrequest-id": request_id,
-        f"position-{index}-fundingrequest-url": url,
+        f"position-{key}-cost": _random_cost(),
+        f"position-{key}-taxrate": _random_tax_rate(),
+        f"position-{key}-cost-type": _random_cost_type(),
     }
 
 
@@ -230,28 +488,31 @@ def _random_cost() -> str:
     return str(_faker.pyfloat(max_value=100_000, right_digits=2, positive=True))
 
 
-def expect_new_free_position(free_position_data: dict[str, str]) -> dict[str, Any]:
+def expect_new_free_position(free_position_data: dict[str, str], key: int = 1) -> dict[str, Any]:
     return {
         "type": "free",
         "description": free_position_data["free-position-description"],
         "cost_amount": free_position_data["free-position-cost"],
         "cost_type": free_position_data["free-position-cost-type"],
         "tax_rate": free_position_data["free-position-taxrate"],
+        "key": key,
     }
 
 
-def expect_existing_free_position(position_data: dict[str, str], index: int = 1) -> dict[str, Any]:
+def expect_existing_free_position(position_data: dict[str, str], key: int = 1) -> dict[str, Any]:
     return {
         "type": "free",
-        "description": position_data[f"position-{index}-description"],
-        "cost_amount": position_data[f"position-{index}-cost"],
-        "cost_type": position_data[f"position-{index}-cost-type"],
-        "tax_rate": position_data[f"position-{index}-taxrate"],
+        "description": position_data[f"position-{key}-description"],
+        "cost_amount": position_data[f"position-{key}-cost"],
+        "cost_type": position_data[f"position-{key}-cost-type"],
+        "tax_rate": position_data[f"position-{key}-taxrate"],
+        "key": key,
     }
 
 
-def expect_new_publication_position(publication: Publication) -> dict[str, Any]:
+def expect_new_publication_position(publication: Publication, key: int = 1) -> dict[str, Any]:
     return {
+        "key": key,
         "type": "publication",
         "id": str(publication.id),
         "title": publication.title,
@@ -270,19 +531,12 @@ def expect_new_publication_position(publication: Publication) -> dict[str, Any]:
 
 
 def expect_existing_publication_position(
-    position_data: dict[str, str], i: int = 1
+    publication: Publication, position_data: dict[str, str], key: int = 1
 ) -> dict[str, Any]:
-    return {
-        "type": "publication",
-        "id": position_data[f"position-{i}-id"],
-        "title": position_data[f"position-{i}-title"],
-        "funding_request": {
-            "request_id": position_data[f"position-{i}-fundingrequest-id"],
-            "url": position_data[f"position-{i}-fundingrequest-url"],
-        },
-        "cost_amount": position_data[f"position-{i}-cost"],
-        "cost_type": position_data[f"position-{i}-cost-type"],
-        "tax_rate": position_data[f"position-{i}-taxrate"],
+    return expect_new_publication_position(publication, key) | {
+        "cost_amount": position_data[f"position-{key}-cost"],
+        "cost_type": position_data[f"position-{key}-cost-type"],
+        "tax_rate": position_data[f"position-{key}-taxrate"],
     }
 
 
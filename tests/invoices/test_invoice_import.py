@@ -0,0 +1,245 @@
+import datetime
+from decimal import Decimal
+from io import BytesIO, StringIO
+from pathlib import Path
+
+import pytest
+from django.core.management import CommandError, call_command
+from pytest_django import DjangoAssertNumQueries
+
+from coda.apps.invoices import services
+from coda.apps.invoices.importing import (
+    ImportRow,
+    RowError,
+    import_invoices,
+    parse_csv,
+    parse_opencost,
+)
+from coda.apps.invoices.models import Creditor
+from coda.apps.invoices.models import Invoice as InvoiceModel
+from coda.apps.invoices.models import Position as PositionModel
+from coda.apps.preferences.models import GlobalPreferences
+from coda.apps.publications.models import Link, LinkType
+from coda.apps.publications.models import Publication as PublicationModel
+from coda.invoice import CostType, PaymentStatus, Position, TaxRate
+from coda.money import Currency, Money
+from coda.publication import PublicationId
+from tests import modelfactory
+
+DOI = "10.1234/example.5678"
+
+CSV = """invoice_number,invoice_date,creditor,doi,description,amount,currency,cost_type,tax_rate
+INV-1,2024-03-01,Example Press,10.1234/EXAMPLE.5678,,1500.00,EUR,gold-oa,0.19
+INV-1,2024-03-01,Example Press,,Handling fee,20,EUR,other,
+INV-2,2024-03-15,Example Press,,Colour pages,99.50,EUR,colour charge,0
+"""
+
+OPENCOST = f"""<?xml version="1.0" encoding="UTF-8"?>
+<data xmlns="https://www.opencost.de/schema">
+  <publication>
+    <primary_identifier>
+      <type>doi</type>
+      <value>{DOI}</value>
+    </primary_identifier>
+    <invoice>
+      <invoice_number>OC-1</invoice_number>
+      <invoice_date>2024-01-31</invoice_date>
+      <invoicing_party>Example Press</invoicing_party>
+      <cost_data>
+        <type>hybrid-oa</type>
+        <amount_paid>2000</amount_paid>
+        <currency>EUR</currency>
+        <amount_invoiced>2150</amount_invoiced>
+        <currency_invoiced>USD</currency_invoiced>
+      </cost_data>
+      <cost_data>
+        <type>vat</type>
+        <amount_paid>380</amount_paid>
+        <currency>USD</currency>
+      </cost_data>
+    </invoice>
+  </publication>
+</data>
+"""
+
+
+def row(number: str = "INV-1", **fields: str) -> ImportRow:
+    values = {
+        "invoice_date": "2024-03-01",
+        "creditor": "Example Press",
+        "amount": "100",
+        "currency": "EUR",
+        "cost_type": "other",
+        "description": "Fee",
+    }
+    return ImportRow(row=1, invoice_number=number, **(values | fields))
+
+
+@pytest.fixture
+def creditor() -> Creditor:
+    return Creditor.objects.create(name="Example Press")
+
+
+@pytest.fixture
+def publication() -> PublicationModel:
+    publication = modelfactory.publication()
+    Link.objects.create(type=LinkType.objects.get(name="DOI"), value=DOI, publication=publication)
+    return publication
+
+
+def test__parse_csv__returns_one_row_per_position() -> None:
+    rows = list(parse_csv(StringIO(CSV)))
+
+    assert [(r.row, r.invoice_number, r.doi, r.description, r.amount) for r in rows] == [
+        (2, "INV-1", "10.1234/EXAMPLE.5678", "", "1500.00"),
+        (3, "INV-1", "", "Handling fee", "20"),
+        (4, "INV-2", "", "Colour pages", "99.50"),
+    ]
+
+
+def test__parse_csv__with_missing_column__raises_value_error() -> None:
+    with pytest.raises(ValueError, match="cost_type"):
+        list(parse_csv(StringIO("invoice_number,invoice_date,creditor,amount,currency\n")))
+
+
+def test__parse_opencost__returns_one_row_per_cost_entry() -> None:
+    rows = list(parse_opencost(BytesIO(OPENCOST.encode())))
+
+    assert rows == [
+        ImportRow(1, "OC-1", "2024-01-31", "Example Press", "2150", "USD", "hybrid-oa", doi=DOI),
+        ImportRow(2, "OC-1", "2024-01-31", "Example Press", "380", "USD", "vat", doi=DOI),
+    ]
+
+
+@pytest.mark.django_db
+def test__import_invoices__creates_invoices_with_positions(
+    creditor: Creditor, publication: PublicationModel
+) -> None:
+    report = import_invoices(parse_csv(StringIO(CSV)))
+
+    assert (report.invoices, report.positions, report.errors) == (2, 3, [])
+    model = InvoiceModel.objects.get(number="INV-1")
+    invoice = services.as_domain_object(model)
+    assert invoice.creditor == creditor.pk
+    assert invoice.date == datetime.date(2024, 3, 1)
+    assert invoice.status == PaymentStatus.Unpaid
+    assert invoice.positions == [
+        Position(
+            item=PublicationId(publication.pk),
+            cost=Money("1500", Currency.EUR),
+            cost_type=CostType.Gold_OA,
+            tax_rate=TaxRate(Decimal("0.19")),
+        ),
+        Position(item="Handling fee", cost=Money("20", Currency.EUR), cost_type=CostType.Other),
+    ]
+    assert services.stored_totals(model) == (invoice.net(), invoice.tax(), invoice.total())
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("creditor", "publication")
+def test__import_invoices__from_opencost__resolves_publication_by_doi() -> None:
+    report = import_invoices(parse_opencost(BytesIO(OPENCOST.encode())))
+
+    assert (report.invoices, report.positions, report.errors) == (1, 2, [])
+    assert services.stored_totals(InvoiceModel.objects.get()) == (
+        Money("2530", Currency.USD),
+        Money("0", Currency.USD),
+        Money("2530", Currency.USD),
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("creditor")
+def test__import_invoices__with_invalid_row__reports_it_and_skips_its_invoice() -> None:
+    rows = [
+        row("INV-1"),
+        row("INV-1", amount="a lot")._replace(row=2),
+        row("INV-2", creditor="Unknown Press")._replace(row=3),
+        row("INV-3", doi="10.9999/missing")._replace(row=4),
+        row("INV-4", currency="USD")._replace(row=5),
+        row("INV-4", currency="EUR")._replace(row=6),
+        row("INV-5")._replace(row=7),
+    ]
+
+    report = import_invoices(rows)
+
+    assert report.errors == [
+        RowError(2, "Invalid amount 'a lot'"),
+        RowError(3, "Unknown creditor Unknown Press"),
+        RowError(4, "Unknown DOI 10.9999/missing"),
+        RowError(6, "Currency EUR differs from the invoice currency USD"),
+    ]
+    assert (report.invoices, report.skipped) == (1, 3)
+    assert list(InvoiceModel.objects.values_list("number", flat=True)) == ["INV-5"]
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("creditor")
+def test__import_invoices__with_tax_rate_out_of_range__reports_it() -> None:
+    rows = [
+        row("INV-1", tax_rate="19"),
+        row("INV-2", tax_rate="-0.1")._replace(row=2),
+        row("INV-3", tax_rate="1")._replace(row=3),
+        row("INV-4", tax_rate="0.19")._replace(row=4),
+    ]
+
+    report = import_invoices(rows)
+
+    assert report.errors == [
+        RowError(1, "Tax rate 19 is not a fraction between 0 and 1"),
+        RowError(2, "Tax rate -0.1 is not a fraction between 0 and 1"),
+        RowError(3, "Tax rate 1 is not a fraction between 0 and 1"),
+    ]
+    assert list(InvoiceModel.objects.values_list("number", flat=True)) == ["INV-4"]
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("creditor")
+def test__import_invoices__skips_invoices_imported_before() -> None:
+    import_invoices([row("INV-1")])
+
+    report = import_invoices([row("INV-1"), row("INV-2")])
+
+    assert report.errors == [RowError(1, "Invoice INV-1 was already imported")]
+    assert InvoiceModel.objects.count() == 2
+    assert PositionModel.objects.count() == 2
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("creditor")
+def test__import_invoices__writes_each_batch_with_constant_number_of_queries(
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    GlobalPreferences.get_home_currency()
+    rows = [row(f"INV-{n // 2}")._replace(row=n) for n in range(100)]
+
+    # creditors, DOIs and existing invoices, then per batch
+    # the savepoint pair, home currency, invoices and positions
+    with django_assert_num_queries(3 + 2 * 5):
+        report = import_invoices(rows, batch_size=25)
+
+    assert (report.invoices, report.positions) == (50, 100)
+    assert PositionModel.objects.count() == 100
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("creditor", "publication")
+def test__import_invoices_command__reports_imported_invoices_and_errors(tmp_path: Path) -> None:
+    path = tmp_path / "invoices.csv"
+    path.write_text(CSV + "INV-3,2024-13-01,Example Press,,Fee,1,EUR,other,\n")
+    out, err = StringIO(), StringIO()
+
+    call_command("import_invoices", str(path), stdout=out, stderr=err)
+
+    assert "Imported 2 invoices with 3 positions, skipped 1 invoices" in out.getvalue()
+    assert "Row 5: Invalid invoice date '2024-13-01'" in err.getvalue()
+
+
+def test__import_invoices_command__with_unsupported_format__raises_command_error(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "invoices.json"
+    path.write_text("[]")
+
+    with pytest.raises(CommandError):
+        call_command("import_invoices", str(path))
@@ -0,0 +1,73 @@
+import importlib
+
+import pytest
+from django.apps import apps
+from django.db import connection
+
+from coda.apps.invoices.models import Invoice as InvoiceModel
+from coda.apps.invoices.models import Position as PositionModel
+from coda.apps.invoices.services import invoice_create
+from coda.invoice import CostType, CreditorId, Position, TaxRate
+from coda.money import Currency, Money
+from tests import domainfactory, modelfactory
+
+invoice_totals = importlib.import_module("coda.apps.invoices.migrations.0012_invoice_totals")
+
+
+@pytest.mark.django_db
+def test__populating_invoice_totals__with_unknown_currency__leaves_totals_empty() -> None:
+    id = invoice_create(
+        domainfactory.invoice(
+            creditor=CreditorId(modelfactory.creditor().pk),
+            positions=[
+                Position(item="Fee", cost=Money(10, Currency.EUR), cost_type=CostType.Other)
+            ],
+        )
+    )
+    PositionModel.objects.update(cost_currency="XYZ")
+    InvoiceModel.objects.update(net_amount=None, tax_amount=None, total_amount=None)
+
+    invoice_totals.populate(apps, connection.schema_editor())
+
+    invoice = InvoiceModel.objects.get(pk=id)
+    assert invoice.currency == "XYZ"
+    assert invoice.total_amount is None
+
+
+@pytest.mark.django_db
+def test__populating_invoice_totals__computes_totals_like_invoice_create() -> None:
+    creditor = CreditorId(modelfactory.creditor().pk)
+    ids = [
+        invoice_create(domainfactory.invoice(creditor=creditor, positions=positions))
+        for positions in [
+            [
+                Position(item="Fee", cost=Money("10.05", Currency.EUR), cost_type=CostType.Other),
+                Position(
+                    item="Fee",
+                    cost=Money("3.33", Currency.EUR),
+                    cost_type=CostType.Other,
+                    tax_rate=TaxRate("0.19"),
+                ),
+            ],
+            [
+                Position(
+                    item="Fee",
+                    cost=Money(999, Currency.JPY),
+                    cost_type=CostType.Other,
+                    tax_rate=TaxRate("0.1"),
+                )
+            ],
+            [
+                Position(item="Fee", cost=Money(5, Currency.EUR), cost_type=CostType.Other),
+                Position(item="Fee", cost=Money(5, Currency.USD), cost_type=CostType.Other),
+            ],
+        ]
+    ]
+    fields = ["currency", "net_amount", "tax_amount", "total_amount"]
+    stored = list(InvoiceModel.objects.filter(pk__in=ids).order_by("id").values_list(*fields))
+    InvoiceModel.objects.update(currency="", net_amount=None, tax_amount=None, total_amount=None)
+
+    invoice_totals.populate(apps, connection.schema_editor())
+
+    populated = InvoiceModel.objects.filter(pk__in=ids).order_by("id").values_list(*fields)
+    assert list(populated) == stored
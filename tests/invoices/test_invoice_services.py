@@ -1,9 +1,13 @@
+from decimal import Decimal
+
 import pytest
 
 from coda.apps.authors.services import author_create
 from coda.apps.invoices import services
+from coda.apps.invoices.models import Invoice as InvoiceModel
 from coda.apps.publications.services import publication_create
-from coda.invoice import Invoice, CreditorId
+from coda.invoice import CostType, CreditorId, Invoice, InvoiceId, Position, TaxRate
+from coda.money import Currency, Money
 from coda.publication import JournalId, PublicationId
 from tests import domainfactory, modelfactory
 
@@ -30,6 +34,67 @@ def test__create_invoice__saves_invoice_to_database() -> None:
     assert_invoice_eq(invoice, actual)
 
 
+@pytest.mark.django_db
+def test__create_invoice__stores_totals_of_positions() -> None:
+    invoice = domainfactory.invoice(
+        creditor=CreditorId(modelfactory.creditor().pk),
+        positions=[
+            fee("12.34", Currency.USD),
+            fee("56.78", Currency.USD),
+        ],
+    )
+
+    new_id = services.invoice_create(invoice)
+
+    assert services.stored_totals(InvoiceModel.objects.get(pk=new_id)) == (
+        invoice.net(),
+        invoice.tax(),
+        invoice.total(),
+    )
+
+
+@pytest.mark.django_db
+def test__create_invoice__with_positions_in_different_currencies__stores_no_totals() -> None:
+    invoice = domainfactory.invoice(
+        creditor=CreditorId(modelfactory.creditor().pk),
+        positions=[
+            fee("12.34", Currency.USD),
+            fee("56.78", Currency.EUR),
+        ],
+    )
+
+    new_id = services.invoice_create(invoice)
+
+    assert services.stored_totals(InvoiceModel.objects.get(pk=new_id)) is None
+
+
+@pytest.mark.django_db
+def test__invoices_above__returns_invoices_with_larger_total_in_same_currency() -> None:
+    creditor = CreditorId(modelfactory.creditor().pk)
+
+    def create(amount: str, currency: Currency) -> InvoiceId:
+        return services.invoice_create(
+            domainfactory.invoice(creditor=creditor, positions=[fee(amount, currency)])
+        )
+
+    create("90", Currency.EUR)
+    above = create("100", Currency.EUR)
+    create("1000", Currency.USD)
+
+    actual = services.invoices_above(Money("110", Currency.EUR))
+
+    assert [invoice.pk for invoice in actual] == [above]
+
+
+def fee(amount: str, currency: Currency) -> Position[str]:
+    return Position(
+        item="Fee",
+        cost=Money(amount, currency),
+        cost_type=CostType.Other,
+        tax_rate=TaxRate(Decimal("0.19")),
+    )
+
+
 def random_publication(publisher_id: int) -> PublicationId:
     journal_id = modelfactory.journal(publisher_id).id
     author_id = author_create(domainfactory.author())
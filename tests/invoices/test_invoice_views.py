@@ -0,0 +1,174 @@
+from typing import Any, cast
+
+import pytest
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from pytest_django import DjangoAssertNumQueries
+
+from coda.apps.authors.models import Author as AuthorModel
+from coda.apps.invoices.services import invoice_create
+from coda.apps.invoices.views.inspect import PAGE_SIZE
+from coda.invoice import CostType, CreditorId, InvoiceId, Position
+from coda.money import Currency, Money
+from coda.publication import PublicationId
+from tests import domainfactory, modelfactory
+
+# session, user, home currency, count, page of invoices with creditors
+# plus the savepoint pair of ATOMIC_REQUESTS
+LIST_QUERY_BUDGET = 7
+
+# session, user, invoice with creditor, positions, funding requests, publications
+# plus the savepoint pair of ATOMIC_REQUESTS
+DETAIL_QUERY_BUDGET = 8
+
+
+def invoice_for_fundingrequest() -> InvoiceId:
+    funding_request = modelfactory.fundingrequest()
+    return invoice_create(
+        domainfactory.invoice(
+            creditor=CreditorId(modelfactory.creditor().pk),
+            positions=[
+                domainfactory.publication_position(
+                    PublicationId(funding_request.publication.pk), currency=Currency.EUR
+                ),
+                Position(
+                    item="Handling fee", cost=Money(10, Currency.EUR), cost_type=CostType.Other
+                ),
+            ],
+        )
+    )
+
+
+def get_list(client: Client, page: int = 1) -> Any:
+    return client.get(reverse("invoices:list"), {"page": page})
+
+
+def get_detail(client: Client, id: InvoiceId) -> Any:
+    return client.get(reverse("invoices:detail", kwargs={"pk": id}))
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__invoice_detail__shows_submitter_and_related_fundingrequest(client: Client) -> None:
+    funding_request = modelfactory.fundingrequest()
+    id = invoice_create(
+        domainfactory.invoice(
+            creditor=CreditorId(modelfactory.creditor().pk),
+            positions=[
+                domainfactory.publication_position(PublicationId(funding_request.publication.pk))
+            ],
+        )
+    )
+
+    response = get_detail(client, id)
+
+    position = response.context["invoice"].positions[0]
+    assert position.name == funding_request.publication.title
+    assert position.publication_submitter == cast(AuthorModel, funding_request.submitter).name
+    assert position.related_funding_request.request_id == funding_request.request_id
+    assert position.related_funding_request.url == funding_request.get_absolute_url()
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__invoice_detail__stays_within_query_budget(
+    client: Client, django_assert_num_queries: DjangoAssertNumQueries
+) -> None:
+    id = invoice_for_fundingrequest()
+
+    with django_assert_num_queries(DETAIL_QUERY_BUDGET):
+        get_detail(client, id)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__invoice_list__paginates_invoices(client: Client) -> None:
+    creditor = CreditorId(modelfactory.creditor().pk)
+    for _ in range(PAGE_SIZE + 1):
+        invoice_create(
+            domainfactory.invoice(creditor=creditor, positions=[domainfactory.free_position()])
+        )
+
+    first_page = get_list(client)
+    second_page = get_list(client, page=2)
+
+    assert len(first_page.context["invoices"]) == PAGE_SIZE
+    assert len(second_page.context["invoices"]) == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__invoice_list__query_count_does_not_depend_on_number_of_invoices(
+    client: Client, django_assert_num_queries: DjangoAssertNumQueries
+) -> None:
+    invoice_for_fundingrequest()
+    with CaptureQueriesContext(connection) as single_invoice:
+        get_list(client)
+
+    for _ in range(5):
+        invoice_for_fundingrequest()
+
+    with django_assert_num_queries(len(single_invoice.captured_queries)):
+        response = get_list(client)
+
+    assert len(response.context["invoices"]) == 6
+    assert len(single_invoice.captured_queries) == LIST_QUERY_BUDGET
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__invoice_list__filters_and_sorts_by_stored_total(client: Client) -> None:
+    creditor = CreditorId(modelfactory.creditor().pk)
+    for amount in ["50", "300", "200"]:
+        invoice_create(
+            domainfactory.invoice(
+                creditor=creditor,
+                positions=[
+                    Position(item="Fee", cost=Money(amount, Currency.EUR), cost_type=CostType.Other)
+                ],
+            )
+        )
+
+    response = client.get(
+        reverse("invoices:list"), {"min_total": "100", "currency": "EUR", "sort": "total"}
+    )
+
+    totals = [invoice.total for invoice in response.context["invoices"]]
+    assert totals == [Money(300, Currency.EUR), Money(200, Currency.EUR)]
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__invoice_list__sorted_by_total__shows_selected_currency_with_totals_first(
+    client: Client,
+) -> None:
+    creditor = CreditorId(modelfactory.creditor().pk)
+
+    def fee(amount: str, currency: Currency) -> Position[str]:
+        return Position(item="Fee", cost=Money(amount, currency), cost_type=CostType.Other)
+
+    for positions in [
+        [fee("50", Currency.EUR), fee("10", Currency.USD)],
+        [fee("1000", Currency.USD)],
+        [fee("50", Currency.EUR)],
+        [fee("200", Currency.EUR)],
+    ]:
+        invoice_create(domainfactory.invoice(creditor=creditor, positions=positions))
+
+    response = client.get(reverse("invoices:list"), {"currency": "EUR", "sort": "total"})
+
+    totals = [invoice.total for invoice in response.context["invoices"]]
+    assert totals == [Money(200, Currency.EUR), Money(50, Currency.EUR), None]
+    assert "only invoices in EUR are shown" in response.content.decode()
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__invoice_list__with_invalid_minimum__shows_all_invoices(client: Client) -> None:
+    invoice_for_fundingrequest()
+
+    response = client.get(reverse("invoices:list"), {"min_total": "NaN"})
+
+    assert len(response.context["invoices"]) == 1
@@ -8,14 +8,17 @@ from coda.apps.authors.models import Author as AuthorModel
 from coda.apps.authors.services import author_create
 from coda.apps.fundingrequests.models import ExternalFunding, FundingOrganization
 from coda.apps.fundingrequests.models import FundingRequest as FundingRequestModel
-from coda.apps.fundingrequests.services import fundingrequest_create
+from coda.apps.fundingrequests.services import (
+    fundingrequest_create,
+    fundingrequest_perform_review,
+)
 from coda.apps.institutions.models import Institution
 from coda.apps.invoices.models import Creditor
 from coda.apps.journals.models import Journal
 from coda.apps.publications.models import Concept, Publication, Vocabulary
 from coda.apps.publishers.models import Publisher
 from coda.author import InstitutionId
-from coda.fundingrequest import FundingOrganizationId, FundingRequest
+from coda.fundingrequest import FundingOrganizationId, FundingRequest, Review
 from coda.publication import JournalId
 from tests import domainfactory
 
@@ -80,7 +83,9 @@ def external_funding(funder_id: int | None = None) -> ExternalFunding:
     )
 
 
-def fundingrequest(title: str = "", _author_dto: AuthorDto | None = None) -> FundingRequestModel:
+def fundingrequest(
+    title: str = "", _author_dto: AuthorDto | None = None, review: Review = Review.Open
+) -> FundingRequestModel:
     request_id = fundingrequest_create(
         FundingRequest.new(
             domainfactory.publication(JournalId(journal().pk), title),
@@ -89,6 +94,9 @@ def fundingrequest(title: str = "", _author_dto: AuthorDto | None = None) -> Fun
             domainfactory.external_funding(FundingOrganizationId(funding_organization().pk)),
         )
     )
+    if review != Review.Open:
+        fundingrequest_perform_review(request_id, review)
+
     return FundingRequestModel.objects.get(pk=request_id)
 
 
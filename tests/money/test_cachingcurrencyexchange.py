@@ -1,14 +1,21 @@
+import threading
 from datetime import datetime, timedelta
 from decimal import Decimal
 
-from coda.money import Currency
+import pytest
+
+from coda.money import Currency, Money
 from coda.money.exchange import (
+    CROSS_RATE_PLACES,
     CachingCurrencyExchange,
     Calendar,
     Rates,
     RatesLookup,
     RatesSnapshot,
+    RatesUnavailable,
+    cross_rate,
 )
+from coda.money.refresh import BackgroundRefresher, RefreshStatus
 
 
 class ExchangeProviderStub:
@@ -50,11 +57,17 @@ def make_sut(
     cache: RatesLookup = eur_rates(),
     exchange_provider: ExchangeProviderStub | None = None,
     calendar: Calendar = calendar,
+    base_currency: Currency | None = None,
+    refresher: BackgroundRefresher | None = None,
+    max_stale: timedelta = timedelta(days=1),
 ) -> CachingCurrencyExchange:
     return CachingCurrencyExchange(
         cache=cache,
         exchange_provider=exchange_provider or ExchangeProviderStub({}),
         calendar=calendar,
+        base_currency=base_currency,
+        refresher=refresher,
+        max_stale=max_stale,
     )
 
 
@@ -65,6 +78,12 @@ def test__caching_currency_exchange__returns_rate_from_cache() -> None:
     assert sut.rate(Currency.EUR, Currency.GBP) == EXPECTED_GBP_RATE
 
 
+def test__caching_currency_exchange__can_be_used_as_currency_exchange() -> None:
+    sut = make_sut()
+
+    assert Money(10, Currency.EUR).convert_to(Currency.USD, sut) == Money(20, Currency.USD)
+
+
 def test__caching_currency_exchange__when_rate_not_in_cache__pulls_from_exchange_provider() -> None:
     exchange_provider = ExchangeProviderStub(eur_rates())
     sut = make_sut(empty_cache(), exchange_provider)
@@ -120,3 +139,143 @@ def test__cached_rates_less_than_a_day_old__does_not_pull_new_rates_from_exchang
     sut.rate(Currency.EUR, Currency.GBP)
 
     assert cache == eur_rates()
+
+
+class CountingExchangeProvider(ExchangeProviderStub):
+    def __init__(self, rates: RatesLookup) -> None:
+        super().__init__(rates)
+        self.calls: list[Currency] = []
+
+    def __call__(self, currency: Currency) -> Rates:
+        self.calls.append(currency)
+        return super().__call__(currency)
+
+
+def test__with_base_currency__derives_cross_rates_from_base_snapshot() -> None:
+    exchange_provider = CountingExchangeProvider(eur_rates())
+    sut = make_sut(empty_cache(), exchange_provider, base_currency=Currency.EUR)
+
+    assert sut.rate(Currency.USD, Currency.GBP) == Decimal("0.75")
+    assert sut.rate(Currency.GBP, Currency.USD) == Decimal("1.3333333333")
+    assert sut.rate(Currency.USD, Currency.EUR) == Decimal("0.5")
+    assert sut.rate(Currency.EUR, Currency.USD) == EXPECTED_USD_RATE
+    assert exchange_provider.calls == [Currency.EUR]
+
+
+def test__with_base_currency__same_currency__returns_one() -> None:
+    sut = make_sut(base_currency=Currency.EUR)
+
+    assert sut.rate(Currency.USD, Currency.USD) == Decimal(1)
+
+
+def test__with_base_currency__expired_snapshot__pulls_new_base_rates() -> None:
+    cache = eur_rates()
+    exchange_provider = CountingExchangeProvider(new_rates())
+    sut = make_sut(cache, exchange_provider, lambda: TOMORROW, base_currency=Currency.EUR)
+
+    assert sut.rate(Currency.USD, Currency.GBP) == Decimal("0.6666666667")
+    assert exchange_provider.calls == [Currency.EUR]
+    assert cache == new_rates()
+
+
+def test__cross_rate__is_rounded_half_up_to_fixed_places() -> None:
+    rates = {Currency.USD: Decimal(3), Currency.GBP: Decimal(2)}
+
+    assert cross_rate(rates, Currency.EUR, Currency.USD, Currency.GBP) == Decimal("0.6666666667")
+    assert cross_rate(rates, Currency.EUR, Currency.USD, Currency.GBP).as_tuple().exponent == (
+        -CROSS_RATE_PLACES
+    )
+
+
+class BlockingExchangeProvider(CountingExchangeProvider):
+    def __init__(self, rates: RatesLookup) -> None:
+        super().__init__(rates)
+        self.release = threading.Event()
+
+    def __call__(self, currency: Currency) -> Rates:
+        assert self.release.wait(timeout=5)
+        return super().__call__(currency)
+
+
+def test__expired_rates_within_max_stale__serves_stale_rates_and_refreshes_in_background() -> None:
+    cache = eur_rates()
+    exchange_provider = BlockingExchangeProvider(new_rates())
+    statuses: list[RefreshStatus] = []
+    refresher = BackgroundRefresher(on_status=lambda _, status, __: statuses.append(status))
+    sut = make_sut(cache, exchange_provider, lambda: TOMORROW, refresher=refresher)
+
+    assert sut.rate(Currency.EUR, Currency.USD) == EXPECTED_USD_RATE
+    assert refresher.status(Currency.EUR) == RefreshStatus.Running
+
+    exchange_provider.release.set()
+    refresher.wait(timeout=5)
+
+    assert cache == new_rates()
+    assert statuses == [RefreshStatus.Running, RefreshStatus.Succeeded]
+
+
+def test__stale_rates__are_refreshed_only_once_while_refresh_is_running() -> None:
+    exchange_provider = BlockingExchangeProvider(new_rates())
+    refresher = BackgroundRefresher()
+    sut = make_sut(eur_rates(), exchange_provider, lambda: TOMORROW, refresher=refresher)
+
+    sut.rate(Currency.EUR, Currency.USD)
+    sut.rate(Currency.EUR, Currency.GBP)
+    exchange_provider.release.set()
+    refresher.wait(timeout=5)
+
+    assert exchange_provider.calls == [Currency.EUR]
+
+
+def test__expired_rates_beyond_max_stale__are_unavailable_until_refreshed_in_background() -> None:
+    cache = eur_rates()
+    exchange_provider = BlockingExchangeProvider(new_rates())
+    refresher = BackgroundRefresher()
+    sut = make_sut(
+        cache,
+        exchange_provider,
+        lambda: TOMORROW,
+        refresher=refresher,
+        max_stale=timedelta(0),
+    )
+
+    with pytest.raises(RatesUnavailable):
+        sut.rate(Currency.EUR, Currency.USD)
+
+    exchange_provider.release.set()
+    refresher.wait(timeout=5)
+
+    assert sut.rate(Currency.EUR, Currency.USD) == Decimal(3)
+
+
+def test__missing_rates__are_unavailable_until_refreshed_in_background() -> None:
+    cache = empty_cache()
+    exchange_provider = BlockingExchangeProvider(new_rates())
+    refresher = BackgroundRefresher()
+    sut = make_sut(cache, exchange_provider, lambda: TOMORROW, refresher=refresher)
+
+    with pytest.raises(RatesUnavailable):
+        sut.rate(Currency.EUR, Currency.USD)
+    assert refresher.status(Currency.EUR) == RefreshStatus.Running
+
+    exchange_provider.release.set()
+    refresher.wait(timeout=5)
+
+    assert sut.rate(Currency.EUR, Currency.USD) == Decimal(3)
+
+
+def test__failing_background_refresh__reports_failure_and_keeps_stale_rates() -> None:
+    def failing_provider(currency: Currency) -> Rates:
+        raise ConnectionError("provider down")
+
+    cache = eur_rates()
+    errors: list[BaseException | None] = []
+    refresher = BackgroundRefresher(on_status=lambda _, __, error: errors.append(error))
+    sut = CachingCurrencyExchange(cache, failing_provider, lambda: TOMORROW, refresher=refresher)
+
+    assert sut.rate(Currency.EUR, Currency.USD) == EXPECTED_USD_RATE
+    refresher.wait(timeout=5)
+
+    assert refresher.status(Currency.EUR) == RefreshStatus.Failed
+    assert isinstance(errors[1], ConnectionError)
+    assert cache == eur_rates()
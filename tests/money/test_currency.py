@@ -0,0 +1,30 @@
+import pytest
+
+from coda.money import Currency, currencies_by_code, currencies_by_numeric, currency_codes
+
+
+def test__from_code__returns_currency_with_that_code() -> None:
+    assert Currency.from_code("EUR") == Currency.EUR
+
+
+def test__from_code__with_unknown_code__raises_key_error() -> None:
+    with pytest.raises(KeyError):
+        Currency.from_code("from_code")
+
+
+def test__from_numeric__returns_currency_with_that_iso_number() -> None:
+    assert Currency.from_numeric(978) == Currency.EUR
+    assert Currency.from_numeric(8) == Currency.ALL
+
+
+def test__every_currency__has_unique_numeric_code() -> None:
+    assert len(currencies_by_numeric()) == len(Currency)
+
+
+def test__allcodes__returns_codes_of_all_currencies() -> None:
+    assert Currency.allcodes() == currency_codes() == {c.code for c in Currency}
+
+
+def test__lookup_tables__cannot_be_modified() -> None:
+    with pytest.raises(TypeError):
+        currencies_by_code()["XXX"] = Currency.EUR  # type: ignore[index]
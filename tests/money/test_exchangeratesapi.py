@@ -1,12 +1,20 @@
+import asyncio
 import json
 from decimal import Decimal
 from pathlib import Path
 
+import httpx
 import pytest
 
 from coda.money import Currency
-from coda.money.exchangeratesapi import ExchangeRateApiJsonSchema, exchange_api
-
+from coda.money.exchangeratesapi import (
+    AsyncExchangeRateApi,
+    CircuitBreaker,
+    CircuitOpen,
+    ExchangeRateApi,
+    ExchangeRateApiJsonSchema,
+    exchange_api,
+)
 
 EXCHANGE_DATA_PATH = Path(__file__).parent / "exchangeapi_result.json"
 EXCHANGE_DATA: ExchangeRateApiJsonSchema = json.loads(EXCHANGE_DATA_PATH.read_text())
@@ -26,3 +34,140 @@ def test__can_request_rates_from_exchange_api() -> None:
 
 def assert_extracted_valid_currencies(rates: dict[Currency, Decimal]) -> None:
     assert all(currency.code in EXCHANGE_DATA["rates"].keys() for currency in rates)
+
+
+def stub_client(*responses: httpx.Response | Exception) -> tuple[httpx.Client, list[str]]:
+    requested: list[str] = []
+    remaining = list(responses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        response = remaining.pop(0) if len(remaining) > 1 else remaining[0]
+        if isinstance(response, Exception):
+            raise response
+
+        return response
+
+    return httpx.Client(transport=httpx.MockTransport(handler)), requested
+
+
+def ok() -> httpx.Response:
+    return httpx.Response(200, json=EXCHANGE_DATA)
+
+
+def no_sleep(seconds: float) -> None:
+    pass
+
+
+def test__exchange_rate_api__parses_rates_of_known_currencies() -> None:
+    client, requested = stub_client(ok())
+    sut = ExchangeRateApi(client, sleep=no_sleep)
+
+    rates = sut(Currency.USD)
+
+    assert requested == ["https://open.er-api.com/v6/latest/USD"]
+    assert rates[Currency.EUR] == Decimal(EXCHANGE_DATA["rates"]["EUR"])
+    assert_extracted_valid_currencies(rates)
+
+
+def test__exchange_rate_api__retries_server_errors_with_backoff() -> None:
+    client, requested = stub_client(httpx.Response(503), httpx.ConnectError("down"), ok())
+    delays: list[float] = []
+    sut = ExchangeRateApi(client, retries=2, backoff=0.1, sleep=delays.append)
+
+    sut(Currency.USD)
+
+    assert len(requested) == 3
+    assert delays == [0.1, 0.2]
+
+
+def test__exchange_rate_api__does_not_retry_client_errors() -> None:
+    client, requested = stub_client(httpx.Response(404), ok())
+    sut = ExchangeRateApi(client, sleep=no_sleep)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        sut(Currency.USD)
+
+    assert len(requested) == 1
+
+
+def test__exchange_rate_api__gives_up_after_retries() -> None:
+    client, requested = stub_client(httpx.ReadTimeout("slow"))
+    sut = ExchangeRateApi(client, retries=2, sleep=no_sleep)
+
+    with pytest.raises(httpx.ReadTimeout):
+        sut(Currency.USD)
+
+    assert len(requested) == 3
+
+
+def test__exchange_rate_api__after_repeated_failures__opens_circuit() -> None:
+    now = [0.0]
+    client, requested = stub_client(httpx.ConnectError("down"))
+    breaker = CircuitBreaker(failure_threshold=2, reset_after=30, clock=lambda: now[0])
+    sut = ExchangeRateApi(client, retries=0, breaker=breaker, sleep=no_sleep)
+
+    for _ in range(2):
+        with pytest.raises(httpx.ConnectError):
+            sut(Currency.USD)
+
+    with pytest.raises(CircuitOpen):
+        sut(Currency.USD)
+    assert len(requested) == 2
+
+    now[0] = 31.0
+    with pytest.raises(httpx.ConnectError):
+        sut(Currency.USD)
+    assert len(requested) == 3
+
+
+def test__circuit_breaker__closes_after_successful_trial_call() -> None:
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_after=30, clock=lambda: now[0])
+    breaker.record_failure()
+
+    now[0] = 31.0
+    breaker.before_call()
+    breaker.record_success()
+    breaker.before_call()
+
+
+def test__exchange_rate_api__fetch_many__fetches_every_base_currency() -> None:
+    client, requested = stub_client(ok())
+    sut = ExchangeRateApi(client, sleep=no_sleep)
+
+    rates = sut.fetch_many([Currency.USD, Currency.EUR, Currency.GBP])
+
+    assert set(rates) == {Currency.USD, Currency.EUR, Currency.GBP}
+    assert sorted(requested) == sorted(
+        f"https://open.er-api.com/v6/latest/{code}" for code in ["USD", "EUR", "GBP"]
+    )
+
+
+def test__async_exchange_rate_api__fetch_many__fetches_concurrently_with_retries() -> None:
+    requested: list[str] = []
+    failed_once: set[str] = set()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        if request.url.path not in failed_once:
+            failed_once.add(request.url.path)
+            return httpx.Response(502)
+
+        return ok()
+
+    async def no_async_sleep(seconds: float) -> None:
+        pass
+
+    async def fetch() -> dict[Currency, dict[Currency, Decimal]]:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        sut = AsyncExchangeRateApi(client, sleep=no_async_sleep)
+        try:
+            return await sut.fetch_many([Currency.USD, Currency.EUR])
+        finally:
+            await sut.aclose()
+
+    rates = asyncio.run(fetch())
+
+    assert set(rates) == {Currency.USD, Currency.EUR}
+    assert len(requested) == 4
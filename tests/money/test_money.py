@@ -1,6 +1,6 @@
 from collections.abc import Callable
 from decimal import Decimal
-from operator import eq, ge, gt, le, lt, ne
+from operator import ge, gt, le, lt
 
 import pytest
 
@@ -62,14 +62,19 @@ def test__money_cannot_be_compared_to_non_money() -> None:
         _ = Money(100, Currency.EUR) == 100
 
 
-@pytest.mark.parametrize("compare", [eq, ne, lt, le, gt, ge])
-def test__money_in_different_currencies_cannot_be_compared(
-    compare: Callable[[object, object], bool]
+@pytest.mark.parametrize("compare", [lt, le, gt, ge])
+def test__money_in_different_currencies_cannot_be_ordered(
+    compare: Callable[[object, object], bool],
 ) -> None:
     with pytest.raises(TypeError):
         _ = compare(Money(100, Currency.EUR), Money(100, Currency.USD))
 
 
+def test__money_in_different_currencies_is_not_equal() -> None:
+    assert Money(100, Currency.EUR) != Money(100, Currency.USD)
+    assert len({Money(100, Currency.EUR), Money(100, Currency.USD)}) == 2
+
+
 def test__zero_money_in_different_currencies_is_equal() -> None:
     assert Money(0, Currency.EUR) == Money(0, Currency.USD)
 
@@ -102,3 +107,47 @@ def test__money_plus_money__returns_sum() -> None:
 
 def test__money_multiplied_by_scalar__returns_product() -> None:
     assert Money(100, Currency.EUR) * 2 == Money(200, Currency.EUR)
+
+
+def test__equal_money__has_equal_hash() -> None:
+    assert hash(Money(100, Currency.EUR)) == hash(Money("100.00", Currency.EUR))
+    assert hash(Money(0, Currency.EUR)) == hash(Money(0, Currency.JPY))
+
+
+def test__money__can_be_used_as_dict_key() -> None:
+    costs = {Money(100, Currency.EUR): "a", Money(100, Currency.USD): "b"}
+
+    assert costs[Money("100.00", Currency.EUR)] == "a"
+    assert costs[Money("100.00", Currency.USD)] == "b"
+
+
+def test__money_sum__returns_same_result_as_adding_up_money() -> None:
+    monies = [Money("0.01", Currency.EUR), Money("10.50", Currency.EUR), Money(3, Currency.EUR)]
+
+    actual = Money.sum(monies, Currency.EUR)
+
+    assert actual == sum(monies, Money(0, Currency.EUR))
+    assert actual.currency == Currency.EUR
+
+
+def test__money_sum__of_nothing__returns_zero_in_given_currency() -> None:
+    actual = Money.sum([], Currency.JPY)
+
+    assert actual == Money(0, Currency.JPY)
+    assert actual.currency == Currency.JPY
+
+
+def test__money_sum__with_zero_money_in_different_currency__ignores_it() -> None:
+    monies = [Money(0, Currency.USD), Money(5, Currency.EUR)]
+
+    assert Money.sum(monies, Currency.EUR) == Money(5, Currency.EUR)
+
+
+def test__money_sum__with_money_in_different_currency__raises_type_error() -> None:
+    with pytest.raises(TypeError):
+        Money.sum([Money(5, Currency.EUR), Money(5, Currency.USD)], Currency.EUR)
+
+
+def test__money_sum__with_non_money__raises_type_error() -> None:
+    with pytest.raises(TypeError):
+        Money.sum([Money(5, Currency.EUR), 5], Currency.EUR)  # type: ignore[list-item]
@@ -0,0 +1,59 @@
+"""
+Micro-benchmarks comparing ``Money.sum`` with folding money using ``+``
+and ``MoneyArray.sum`` with ``Money.sum``.
+They are skipped unless pytest runs with ``--run-benchmarks``. The timings are recorded as
+test properties, e.g. in the report written by ``--junitxml``.
+"""
+
+import timeit
+from collections.abc import Callable
+from decimal import Decimal
+
+import pytest
+
+from coda.money import Currency, Money
+from coda.money.moneyarray import MoneyArray
+
+POSITIONS = 20_000
+REPEAT = 5
+
+
+@pytest.mark.benchmark
+def test__money_sum__matches_folding_money(record_property: Callable[[str, object], None]) -> None:
+    monies = [Money(Decimal(i) / 100, Currency.EUR) for i in range(POSITIONS)]
+
+    def fold() -> Money:
+        return sum(monies, Money(0, Currency.EUR))
+
+    def money_sum() -> Money:
+        return Money.sum(monies, Currency.EUR)
+
+    assert fold() == money_sum()
+
+    record_property("fold_seconds", best_time(fold))
+    record_property("money_sum_seconds", best_time(money_sum))
+
+
+@pytest.mark.benchmark
+def test__money_array_sum__matches_money_sum(
+    record_property: Callable[[str, object], None],
+) -> None:
+    amounts = [Decimal(i).scaleb(-2) for i in range(POSITIONS)]
+    codes = ["EUR"] * POSITIONS
+    array = MoneyArray.from_columns(amounts, codes)
+    monies = array.to_money()
+
+    def money_sum() -> Money:
+        return Money.sum(monies, Currency.EUR)
+
+    def array_sum() -> Money:
+        return array.sum(Currency.EUR)
+
+    assert money_sum() == array_sum()
+
+    record_property("money_sum_seconds", best_time(money_sum))
+    record_property("money_array_sum_seconds", best_time(array_sum))
+
+
+def best_time(function: Callable[[], object]) -> float:
+    return min(timeit.repeat(function, number=1, repeat=REPEAT))
@@ -0,0 +1,109 @@
+import random
+from decimal import Decimal
+
+import polars as pl
+import pytest
+
+from coda.money import Currency, Money
+from coda.money.moneyarray import MoneyArray
+from tests.checks.test_costlimit import one2one
+
+
+def random_money(count: int) -> list[Money]:
+    rng = random.Random(42)
+    currencies = [Currency.EUR, Currency.USD, Currency.JPY, Currency.JOD, Currency.CLF]
+    return [
+        Money(Decimal(rng.randint(-(10**9), 10**9)).scaleb(-4), rng.choice(currencies))
+        for _ in range(count)
+    ]
+
+
+def assert_same_money(actual: list[Money], expected: list[Money]) -> None:
+    assert [(m.amount, m.currency) for m in actual] == [(m.amount, m.currency) for m in expected]
+
+
+def test__money_array__from_money__round_trips_exactly() -> None:
+    monies = random_money(500)
+
+    actual = MoneyArray.from_money(monies).to_money()
+
+    assert_same_money(actual, monies)
+
+
+def test__money_array__from_columns__rounds_half_up_like_money() -> None:
+    amounts = [Decimal("1.0050"), Decimal("-1.0050"), Decimal("2.5000"), Decimal("1.0000")]
+    codes = ["EUR", "EUR", "JPY", "CLF"]
+
+    actual = MoneyArray.from_columns(amounts, codes).to_money()
+
+    expected = [Money(amount, Currency[code]) for amount, code in zip(amounts, codes)]
+    assert_same_money(actual, expected)
+
+
+def test__money_array__from_frame__reads_amount_and_currency_columns() -> None:
+    frame = pl.DataFrame(
+        {"cost_amount": [Decimal("10.5000"), Decimal("3.0000")], "cost_currency": ["EUR", "USD"]}
+    )
+
+    actual = MoneyArray.from_frame(frame, "cost_amount", "cost_currency").to_money()
+
+    assert_same_money(actual, [Money("10.50", Currency.EUR), Money(3, Currency.USD)])
+
+
+def test__money_array__from_columns__with_unknown_currency__raises_value_error() -> None:
+    with pytest.raises(ValueError, match="XXX"):
+        MoneyArray.from_columns(["1.00"], ["XXX"])
+
+
+def test__money_array__sum__returns_same_result_as_money_sum() -> None:
+    monies = [money for money in random_money(500) if money.currency == Currency.EUR]
+
+    actual = MoneyArray.from_money(monies).sum(Currency.EUR)
+
+    assert_same_money([actual], [Money.sum(monies, Currency.EUR)])
+
+
+def test__money_array__sum__with_money_in_different_currency__raises_type_error() -> None:
+    array = MoneyArray.from_money([Money(5, Currency.EUR), Money(5, Currency.USD)])
+
+    with pytest.raises(TypeError):
+        array.sum(Currency.EUR)
+
+
+def test__money_array__sum_by_currency__returns_total_per_currency() -> None:
+    monies = random_money(500)
+
+    actual = MoneyArray.from_money(monies).sum_by_currency()
+
+    expected = {c: Money.sum((m for m in monies if m.currency == c), c) for c in actual}
+    assert set(actual) == {money.currency for money in monies}
+    assert_same_money(list(actual.values()), list(expected.values()))
+
+
+@pytest.mark.parametrize("rate", ["1.1", "0.0123456789", "157.25", "1"])
+def test__money_array__convert_to__returns_same_result_as_converting_each_money(
+    rate: str,
+) -> None:
+    monies = random_money(500)
+
+    def exchange(origin: Currency, target: Currency) -> Decimal:
+        return Decimal(rate)
+
+    actual = MoneyArray.from_money(monies).convert_to(Currency.EUR, exchange).to_money()
+
+    expected = [money.convert_to(Currency.EUR, exchange) for money in monies]
+    assert_same_money(actual, expected)
+
+
+def test__money_array__convert_to__asks_exchange_once_per_currency() -> None:
+    asked = []
+
+    def exchange(origin: Currency, target: Currency) -> Decimal:
+        asked.append(origin)
+        return one2one(origin, target)
+
+    MoneyArray.from_money(random_money(500)).convert_to(Currency.USD, exchange)
+
+    assert sorted(asked, key=lambda c: c.code) == sorted(
+        {Currency.EUR, Currency.JPY, Currency.JOD, Currency.CLF}, key=lambda c: c.code
+    )
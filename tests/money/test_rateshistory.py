@@ -0,0 +1,65 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+
+from coda.money import Currency, Money
+from coda.money.history import HistoricalRate, RatesHistory
+
+JAN_1 = datetime.date(2023, 1, 1)
+FEB_1 = datetime.date(2023, 2, 1)
+
+
+def make_sut() -> RatesHistory:
+    return RatesHistory(
+        [
+            HistoricalRate(FEB_1, Currency.EUR, Currency.USD, Decimal("1.2")),
+            HistoricalRate(JAN_1, Currency.EUR, Currency.USD, Decimal("1.1")),
+        ]
+    )
+
+
+def test__rate__on_date_of_rate__returns_that_rate() -> None:
+    sut = make_sut()
+
+    assert sut.rate(Currency.EUR, Currency.USD, JAN_1) == Decimal("1.1")
+    assert sut.rate(Currency.EUR, Currency.USD, FEB_1) == Decimal("1.2")
+
+
+def test__rate__between_dates__returns_last_known_rate() -> None:
+    sut = make_sut()
+
+    assert sut.rate(Currency.EUR, Currency.USD, datetime.date(2023, 1, 31)) == Decimal("1.1")
+    assert sut.rate(Currency.EUR, Currency.USD, datetime.date(2024, 1, 1)) == Decimal("1.2")
+
+
+def test__rate__before_first_rate__raises_key_error() -> None:
+    sut = make_sut()
+
+    with pytest.raises(KeyError):
+        sut.rate(Currency.EUR, Currency.USD, datetime.date(2022, 12, 31))
+
+
+def test__rate__for_unknown_pair__raises_key_error() -> None:
+    sut = make_sut()
+
+    with pytest.raises(KeyError):
+        sut.rate(Currency.EUR, Currency.GBP, FEB_1)
+
+
+def test__rate__for_inverse_pair__returns_reciprocal() -> None:
+    sut = make_sut()
+
+    assert sut.rate(Currency.USD, Currency.EUR, JAN_1) == 1 / Decimal("1.1")
+
+
+def test__rate__for_same_currency__returns_one() -> None:
+    assert RatesHistory([]).rate(Currency.EUR, Currency.EUR, JAN_1) == Decimal(1)
+
+
+def test__exchange_at__converts_money_with_rates_of_date() -> None:
+    sut = make_sut()
+
+    converted = Money("100", Currency.EUR).convert_to(Currency.USD, sut.exchange_at(JAN_1))
+
+    assert converted == Money("110", Currency.USD)
@@ -0,0 +1,68 @@
+import pytest
+from django.core.cache import cache
+from django.test import Client
+from django.urls import reverse
+from pytest_django import DjangoAssertNumQueries
+
+from coda.apps.invoices.services import invoice_create
+from coda.fundingrequest import Review
+from coda.invoice import CostType, CreditorId, Position
+from coda.money import Currency, Money
+from tests import domainfactory, modelfactory
+
+
+@pytest.fixture(autouse=True)
+def clear_cache() -> None:
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test__home__shows_funding_request_counts_per_status(client: Client) -> None:
+    modelfactory.fundingrequest()
+    modelfactory.fundingrequest(review=Review.Approved)
+    modelfactory.fundingrequest(review=Review.Rejected)
+
+    response = client.get(reverse("home"))
+
+    assert response.context["num_requests"] == 3
+    assert response.context["num_open_requests"] == 1
+    assert response.context["num_approved_requests"] == 1
+    assert response.context["num_rejected_requests"] == 1
+
+
+@pytest.mark.django_db
+def test__home__shows_total_spent_on_invoices(client: Client) -> None:
+    position = Position(item="APC", cost=Money("12.50", Currency.EUR), cost_type=CostType.Gold_OA)
+    invoice_create(
+        domainfactory.invoice(creditor=CreditorId(modelfactory.creditor().pk), positions=[position])
+    )
+
+    response = client.get(reverse("home"))
+
+    assert response.context["total_spent"] == Money("12.50", Currency.EUR)
+    assert "Total spent: 12.50 EUR" in response.content.decode()
+
+
+@pytest.mark.django_db
+def test__home__reads_dashboard_numbers_with_one_query_each(
+    client: Client, django_assert_num_queries: DjangoAssertNumQueries
+) -> None:
+    modelfactory.fundingrequest()
+
+    # the counts query, the home currency and the total spent query
+    # plus the savepoint pair of ATOMIC_REQUESTS
+    with django_assert_num_queries(5):
+        client.get(reverse("home"))
+
+
+@pytest.mark.django_db
+def test__home__caches_dashboard_numbers(
+    client: Client, django_assert_num_queries: DjangoAssertNumQueries
+) -> None:
+    client.get(reverse("home"))
+    modelfactory.fundingrequest()
+
+    with django_assert_num_queries(2):
+        response = client.get(reverse("home"))
+
+    assert response.context["num_requests"] == 0
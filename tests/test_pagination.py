@@ -0,0 +1,131 @@
+import datetime
+
+import pytest
+from django.core.cache import cache
+from django.db.models import QuerySet
+from django.test import Client
+from django.urls import reverse
+
+from coda.apps.fundingrequests.models import FundingRequest, FundingRequestListEntry
+from coda.apps.fundingrequests.views import listview
+from coda.apps.pagination import Cursor, keyset_paginate
+from tests import modelfactory
+
+
+def newest_first() -> list[FundingRequest]:
+    return list(FundingRequest.objects.order_by("-created_at", "-id"))
+
+
+def test__cursor__survives_encoding_roundtrip() -> None:
+    cursor = Cursor(datetime.datetime(2024, 3, 1, 12, 30, tzinfo=datetime.UTC), 42)
+
+    assert Cursor.decode(cursor.encode()) == cursor
+
+
+@pytest.mark.parametrize("token", ["", "not base64!", "bm90IGEgY3Vyc29y"])
+def test__decoding_invalid_cursor__raises_value_error(token: str) -> None:
+    with pytest.raises(ValueError):
+        Cursor.decode(token)
+
+
+@pytest.mark.django_db
+def test__first_page__returns_newest_rows_and_next_cursor() -> None:
+    for _ in range(5):
+        modelfactory.fundingrequest()
+
+    page = keyset_paginate(FundingRequest.objects.all(), 2)
+
+    assert page.object_list == newest_first()[:2]
+    assert page.has_next()
+    assert not page.has_previous()
+
+
+@pytest.mark.django_db
+def test__following_next_cursors__walks_all_rows_once() -> None:
+    for _ in range(5):
+        modelfactory.fundingrequest()
+
+    seen: list[FundingRequest] = []
+    page = keyset_paginate(FundingRequest.objects.all(), 2)
+    seen.extend(page.object_list)
+    while page.next_cursor:
+        page = keyset_paginate(FundingRequest.objects.all(), 2, after=page.next_cursor)
+        seen.extend(page.object_list)
+
+    assert seen == newest_first()
+    assert page.has_previous()
+
+
+@pytest.mark.django_db
+def test__previous_cursor__returns_preceding_page() -> None:
+    for _ in range(5):
+        modelfactory.fundingrequest()
+
+    first = keyset_paginate(FundingRequest.objects.all(), 2)
+    second = keyset_paginate(FundingRequest.objects.all(), 2, after=first.next_cursor)
+
+    back = keyset_paginate(FundingRequest.objects.all(), 2, before=second.previous_cursor)
+
+    assert back.object_list == first.object_list
+    assert not back.has_previous()
+    assert back.has_next()
+
+
+@pytest.mark.django_db
+def test__paginating_with_count__returns_count() -> None:
+    for _ in range(3):
+        modelfactory.fundingrequest()
+
+    with_count = keyset_paginate(FundingRequest.objects.all(), 2, with_count=True)
+    without_count = keyset_paginate(FundingRequest.objects.all(), 2)
+
+    assert with_count.approximate_count is not None
+    assert without_count.approximate_count is None
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__fundingrequest_list__with_after_cursor__shows_next_page(client: Client) -> None:
+    for _ in range(12):
+        modelfactory.fundingrequest()
+    tenth = newest_first()[9]
+
+    response = client.get(reverse("fundingrequests:list"), {"after": Cursor.of(tenth).encode()})
+
+    ids = [fr.id for fr in response.context["funding_requests"]]
+    assert ids == [fr.id for fr in newest_first()[10:]]
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__fundingrequest_list__with_invalid_cursor__returns_bad_request(client: Client) -> None:
+    response = client.get(reverse("fundingrequests:list"), {"after": "not a cursor"})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("logged_in")
+def test__fundingrequest_list__counts_results_once_per_search(
+    client: Client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache.clear()
+    for _ in range(12):
+        modelfactory.fundingrequest()
+    counted = []
+
+    def count(queryset: QuerySet[FundingRequestListEntry]) -> int:
+        counted.append(queryset)
+        return queryset.count()
+
+    monkeypatch.setattr(listview, "approximate_count", count)
+
+    first = client.get(reverse("fundingrequests:list"))
+    second = client.get(
+        reverse("fundingrequests:list"), {"after": first.context["page"].next_cursor.encode()}
+    )
+    client.get(reverse("fundingrequests:list"), {"search_type": "title", "search_term": "x"})
+
+    assert len(counted) == 2
+    assert first.context["page"].approximate_count == 12
+    assert second.context["page"].approximate_count == 12